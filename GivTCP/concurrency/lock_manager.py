@@ -12,11 +12,20 @@ This module provides:
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from threading import RLock
+from threading import Condition, Lock, RLock, get_ident
 from typing import Optional, Generator
 import logging
 import time
 
+# fastrlock provides a C-level RLock that is much cheaper to acquire and
+# release when uncontended (optional dependency)
+try:
+    from fastrlock.rlock import RLock as _RLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    _RLock = RLock
+    FASTRLOCK_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +65,102 @@ class LockManager(ABC):
         pass
 
 
+class _ResourceLock:
+    """
+    RLock plus hold bookkeeping so is_locked() can inspect it without acquiring.
+
+    Only non-blocking and wait-forever acquires are made on the lock itself,
+    since fastrlock doesn't implement acquire timeouts; a timed wait sleeps
+    on the release condition between non-blocking attempts.
+    """
+
+    __slots__ = ('lock', 'count', 'owner', 'released', 'waiters')
+
+    def __init__(self):
+        self.lock = _RLock()
+        self.count = 0  # Recursion depth; only changed while lock is held
+        self.owner = None  # Thread ident of the holder, None when free
+        self.released = Condition(Lock())  # Notified when the lock is fully released
+        self.waiters = 0  # Threads blocked in wait_for_release
+
+    def take(self, resource_name: str, timeout: Optional[float]) -> None:
+        """Acquire the lock, raising TimeoutError if it isn't free within timeout."""
+        if self.lock.acquire(False):
+            # Uncontended (or re-entered by the holder)
+            logger.debug("Lock acquired for resource: %s", resource_name)
+        elif timeout is None:
+            # Wait forever
+            self.lock.acquire()
+            logger.debug("Lock acquired for resource: %s", resource_name)
+        else:
+            # Block until released or timed out (no polling)
+            start_time = time.monotonic()
+            if self._take_within(start_time + timeout):
+                elapsed = time.monotonic() - start_time
+                logger.debug("Lock acquired for resource: %s (waited %.3fs)", resource_name, elapsed)
+            else:
+                elapsed = time.monotonic() - start_time
+                logger.error("Timeout acquiring lock for resource: %s (waited %.3fs)", resource_name, elapsed)
+                raise TimeoutError(f"Could not acquire lock for '{resource_name}' within {timeout}s")
+
+        self.owner = get_ident()
+        self.count += 1
+
+    def _take_within(self, deadline: float) -> bool:
+        """Retry a non-blocking acquire on each full release until the deadline."""
+        with self.released:
+            self.waiters += 1
+            try:
+                while not self.lock.acquire(False):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self.released.wait(remaining)
+                return True
+            finally:
+                self.waiters -= 1
+
+    def give(self, resource_name: str) -> None:
+        """Release one level of the lock, waking wait_for_release callers when free."""
+        self.count -= 1
+        released = self.count == 0
+        if released:
+            self.owner = None
+        self.lock.release()
+        logger.debug("Lock released for resource: %s", resource_name)
+        if released and self.waiters:
+            with self.released:
+                self.released.notify_all()
+
+
+class ResourceLockHandle:
+    """
+    Reusable context manager for one resource of a ThreadLockManager.
+
+    Obtained from ThreadLockManager.get_lock(). Holding on to the handle
+    skips the per-call resource lookup that acquire() performs.
+    """
+
+    __slots__ = ('_holder', 'resource_name', 'timeout')
+
+    def __init__(self, holder: _ResourceLock, resource_name: str, timeout: Optional[float]):
+        self._holder = holder
+        self.resource_name = resource_name
+        self.timeout = timeout
+
+    def __enter__(self) -> bool:
+        self._holder.take(self.resource_name, self.timeout)
+        return True
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self._holder.give(self.resource_name)
+        return False
+
+
 class ThreadLockManager(LockManager):
     """
-    Thread-safe lock manager using threading.RLock.
+    Thread-safe lock manager using reentrant locks (fastrlock if installed,
+    else threading.RLock).
 
     Provides per-resource locking with reentrant locks to prevent deadlocks.
     Suitable for single-process multi-threaded applications.
@@ -72,10 +174,21 @@ class ThreadLockManager(LockManager):
 
     def __init__(self):
         """Initialize the thread lock manager."""
-        self._locks = {}  # resource_name -> RLock
-        self._global_lock = RLock()  # Protects _locks dictionary
+        self._locks = {}  # resource_name -> _ResourceLock
+        self._global_lock = RLock()  # Serialises clear(); lookups are lock-free
         logger.debug("ThreadLockManager initialized")
 
+    def _get_holder(self, resource_name: str) -> _ResourceLock:
+        """Get or create the lock holder for a resource."""
+        holder = self._locks.get(resource_name)
+        if holder is None:
+            # setdefault is atomic; a thread losing the creation race discards its lock
+            new_holder = _ResourceLock()
+            holder = self._locks.setdefault(resource_name, new_holder)
+            if holder is new_holder:
+                logger.debug("Created new lock for resource: %s", resource_name)
+        return holder
+
     @contextmanager
     def acquire(self, resource_name: str, timeout: Optional[float] = None) -> Generator[bool, None, None]:
         """
@@ -96,45 +209,35 @@ class ThreadLockManager(LockManager):
                 # Critical section - only one thread at a time
                 read_inverter_data()
         """
-        # Get or create lock for this resource
-        with self._global_lock:
-            if resource_name not in self._locks:
-                self._locks[resource_name] = RLock()
-                logger.debug(f"Created new lock for resource: {resource_name}")
-            resource_lock = self._locks[resource_name]
+        holder = self._get_holder(resource_name)
+        holder.take(resource_name, timeout)
+        try:
+            yield True
+        finally:
+            holder.give(resource_name)
 
-        # Try to acquire the resource lock
-        start_time = time.time()
-        acquired = False
+    def get_lock(self, resource_name: str, timeout: Optional[float] = None) -> ResourceLockHandle:
+        """
+        Get a reusable context manager for a frequently used resource.
 
-        try:
-            if timeout is None:
-                # Wait forever
-                resource_lock.acquire()
-                acquired = True
-                logger.debug(f"Lock acquired for resource: {resource_name}")
-            else:
-                # Try to acquire with timeout
-                end_time = start_time + timeout
-                while time.time() < end_time:
-                    if resource_lock.acquire(blocking=False):
-                        acquired = True
-                        elapsed = time.time() - start_time
-                        logger.debug(f"Lock acquired for resource: {resource_name} (waited {elapsed:.3f}s)")
-                        break
-                    time.sleep(0.01)  # Brief sleep to avoid busy-waiting
-
-                if not acquired:
-                    elapsed = time.time() - start_time
-                    logger.error(f"Timeout acquiring lock for resource: {resource_name} (waited {elapsed:.3f}s)")
-                    raise TimeoutError(f"Could not acquire lock for '{resource_name}' within {timeout}s")
+        Equivalent to acquire(resource_name, timeout) but resolves the
+        resource once, so hot call sites can keep the handle and skip the
+        lookup on every use. Handles stay bound to their lock, so don't
+        call clear() while they are in use.
 
-            yield True
+        Args:
+            resource_name: Unique identifier for the resource
+            timeout: Maximum time to wait on each use (seconds). None = wait forever
 
-        finally:
-            if acquired:
-                resource_lock.release()
-                logger.debug(f"Lock released for resource: {resource_name}")
+        Returns:
+            ResourceLockHandle: Context manager that raises TimeoutError on timeout
+
+        Example:
+            inverter_lock = lock_manager.get_lock('inverter_read', timeout=10.0)
+            with inverter_lock:
+                read_inverter_data()
+        """
+        return ResourceLockHandle(self._get_holder(resource_name), resource_name, timeout)
 
     def is_locked(self, resource_name: str) -> bool:
         """
@@ -155,17 +258,40 @@ class ThreadLockManager(LockManager):
             bool: True if locked by another thread, False if not locked or
                   locked by current thread
         """
-        with self._global_lock:
-            if resource_name not in self._locks:
-                return False  # No lock exists = not locked
-            resource_lock = self._locks[resource_name]
+        holder = self._locks.get(resource_name)
+        if holder is None:
+            return False  # No lock exists = not locked
+
+        # Read the holder bookkeeping rather than probing the lock, so
+        # checking never contends with threads waiting to acquire it
+        owner = holder.owner
+        return owner is not None and owner != get_ident()
+
+    def wait_for_release(self, resource_name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a resource is not locked by another thread.
+
+        Waiters sleep on a condition variable that is notified when the
+        holder fully releases the lock, so there is no polling. The lock is
+        not acquired; another thread may take it before the caller acts.
 
-        # Try to acquire without blocking
-        acquired = resource_lock.acquire(blocking=False)
-        if acquired:
-            resource_lock.release()
-            return False  # Was able to acquire = not locked
-        return True  # Unable to acquire = locked
+        Args:
+            resource_name: Resource identifier
+            timeout: Maximum time to wait (seconds). None = wait forever
+
+        Returns:
+            bool: True if the resource was free, False if the timeout expired
+        """
+        holder = self._get_holder(resource_name)
+        me = get_ident()
+        with holder.released:
+            holder.waiters += 1
+            try:
+                return holder.released.wait_for(
+                    lambda: holder.owner is None or holder.owner == me, timeout=timeout
+                )
+            finally:
+                holder.waiters -= 1
 
     def clear(self):
         """
@@ -177,4 +303,4 @@ class ThreadLockManager(LockManager):
         with self._global_lock:
             count = len(self._locks)
             self._locks.clear()
-            logger.debug(f"Cleared {count} locks")
+            logger.debug("Cleared %s locks", count)
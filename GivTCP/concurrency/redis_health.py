@@ -0,0 +1,44 @@
+"""
+Shared Redis connection check for the Redis-backed managers.
+
+Phase 5 Refactoring: Replace File Locks with Proper Synchronization
+
+The lock manager and status manager are usually built around the same
+client, so the set of clients that have already answered PING is kept here,
+once per process, rather than on each manager class.
+"""
+
+import logging
+import weakref
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Clients that have answered PING (weak, so clients can still be collected)
+_verified_clients = weakref.WeakSet()
+
+
+def verify_client(client: 'redis.Redis') -> None:
+    """
+    Ping a Redis client, skipping clients that have already answered.
+
+    Args:
+        client: Redis client instance
+
+    Raises:
+        redis.ConnectionError: If Redis cannot be reached
+    """
+    if client in _verified_clients:
+        return
+    try:
+        client.ping()
+    except redis.ConnectionError as e:
+        logger.error("Redis connection failed: %s", e)
+        raise
+    _verified_clients.add(client)
@@ -10,8 +10,10 @@ Uses the Redis SET NX (set if not exists) pattern with automatic expiration.
 from contextlib import contextmanager
 from typing import Optional, Generator
 import logging
+import os
+import random
+import threading
 import time
-import uuid
 
 try:
     import redis
@@ -20,10 +22,20 @@ except ImportError:
     REDIS_AVAILABLE = False
 
 from .lock_manager import LockManager
+from .redis_health import verify_client
 
 
 logger = logging.getLogger(__name__)
 
+# Atomic check-and-delete: only the holder (matching value) may release
+RELEASE_LUA = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
 
 class RedisLockManager(LockManager):
     """
@@ -40,6 +52,22 @@ class RedisLockManager(LockManager):
     https://redis.io/docs/manual/patterns/distributed-locks/
     """
 
+    # Retry backoff bounds (seconds) for contended locks
+    BACKOFF_BASE = 0.005
+    BACKOFF_CAP = 1.0
+
+    # Fast-path retries before backing off: immediate, then yielding,
+    # bounded by SPIN_LIMIT seconds in total
+    SPIN_TRIES = 3
+    YIELD_TRIES = 3
+    SPIN_LIMIT = 0.005
+
+    # Seconds a "not locked" answer from is_locked is reused
+    NEGATIVE_CACHE_TTL = 0.05
+
+    # Keys per SCAN page / UNLINK call in clear_all
+    CLEAR_BATCH_SIZE = 500
+
     def __init__(self, redis_client: 'redis.Redis', key_prefix: str = 'givtcp:lock',
                  default_ttl: int = 30):
         """
@@ -56,18 +84,219 @@ class RedisLockManager(LockManager):
         self.redis = redis_client
         self.key_prefix = key_prefix
         self.default_ttl = default_ttl
+        self._key_cache = {}  # name -> prefixed Redis key
+        self._absent_until = {}  # name -> monotonic time a "not locked" answer expires
+        self._lease_deadlines = {}  # name -> monotonic time a held lock expires
+
+        # One keyspace subscription per manager, started by the first
+        # contended acquire; release events are routed to waiters by key
+        self._waiters_lock = threading.Lock()
+        self._release_waiters = {}  # lock key -> set of waiting Events
+        self._pubsub = None
+        self._pubsub_thread = None
+        self._keyspace_checked = False
+
+        # Sent once via SCRIPT LOAD, then invoked by EVALSHA on each release
+        self._release_script = self.redis.register_script(RELEASE_LUA)
+
+        # Verify Redis connection (once per client)
+        self.verify_connection()
+        logger.info("RedisLockManager initialized successfully")
+
+    def verify_connection(self) -> None:
+        """
+        Ping Redis, skipping clients that have already answered.
 
-        # Verify Redis connection
-        try:
-            self.redis.ping()
-            logger.info("RedisLockManager initialized successfully")
-        except redis.ConnectionError as e:
-            logger.error(f"Redis connection failed: {e}")
-            raise
+        Managers are cheap to construct around a shared client; only the
+        first manager of any kind (lock or status) built for a given client
+        pays the PING round trip.
+
+        Raises:
+            redis.ConnectionError: If Redis cannot be reached
+        """
+        verify_client(self.redis)
 
     def _get_lock_key(self, resource_name: str) -> str:
-        """Generate Redis key for a resource lock."""
-        return f"{self.key_prefix}:{resource_name}"
+        """Generate Redis key for a resource lock (memoised per name)."""
+        key = self._key_cache.get(resource_name)
+        if key is None:
+            key = self._key_cache[resource_name] = f"{self.key_prefix}:{resource_name}"
+        return key
+
+    def _try_set(self, lock_key: str, lock_value: str, lock_ttl: int) -> Optional[int]:
+        """
+        Attempt to take a lock and read its TTL in one round trip.
+
+        Sends SET key value NX EX ttl (NX = only set if not exists,
+        EX = expiration in seconds) and PTTL in a single MULTI/EXEC.
+
+        Args:
+            lock_key: Redis key of the lock
+            lock_value: Unique token identifying this holder
+            lock_ttl: Lock time-to-live in seconds
+
+        Returns:
+            int: Remaining TTL in milliseconds if acquired, None otherwise
+        """
+        pipe = self.redis.pipeline()
+        pipe.set(lock_key, lock_value, nx=True, ex=lock_ttl)
+        pipe.pttl(lock_key)
+        ok, pttl_ms = pipe.execute()
+        return pttl_ms if ok else None
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before the next acquisition attempt.
+
+        Uses capped exponential backoff with full jitter so contending
+        processes spread their retries instead of hitting Redis in lockstep.
+
+        Args:
+            attempt: Number of failed attempts so far (0-based)
+
+        Returns:
+            float: Delay in seconds
+        """
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * (2 ** attempt)))
+
+    def _check_keyspace_events(self) -> None:
+        """
+        Warn if the server won't publish the notifications waiters rely on.
+
+        Waiters need notify-keyspace-events to include keyspace (K), generic
+        (g) and expired (x) events, e.g. 'Kgx'. Servers that refuse CONFIG
+        are not checked.
+        """
+        try:
+            config = self.redis.config_get('notify-keyspace-events')
+            flags = next(iter(config.values()), '')
+            if isinstance(flags, bytes):
+                flags = flags.decode()
+        except Exception as e:
+            logger.debug("Could not read notify-keyspace-events: %s", e)
+            return
+        if 'K' not in flags or not ('A' in flags or {'g', 'x'} <= set(flags)):
+            logger.warning(
+                "Redis notify-keyspace-events is %r; lock waiters will poll instead "
+                "of waking on release (set it to include 'Kgx')", flags)
+
+    def _on_keyspace_event(self, message: dict) -> None:
+        """Wake the waiters for a lock key that was deleted or expired."""
+        if message['data'] not in (b'del', b'expired', 'del', 'expired'):
+            return
+        channel = message['channel']
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        lock_key = channel.split(':', 1)[1]
+        with self._waiters_lock:
+            events = list(self._release_waiters.get(lock_key, ()))
+        for event in events:
+            event.set()
+
+    def _on_pubsub_error(self, error: Exception, pubsub, thread) -> None:
+        """Drop a failed subscription so the next waiter subscribes again."""
+        logger.warning("Keyspace subscription failed, lock waiters will poll: %s", error)
+        thread.stop()
+        with self._waiters_lock:
+            if self._pubsub is pubsub:
+                self._pubsub = None
+                self._pubsub_thread = None
+        try:
+            pubsub.close()
+        except Exception as e:
+            logger.debug("Error closing keyspace subscription: %s", e)
+
+    def _ensure_subscription(self) -> bool:
+        """
+        Start the manager's keyspace subscription if it isn't running.
+
+        One pattern subscription covers every lock under key_prefix; its
+        messages are routed to waiters by key on a background thread.
+        Must be called with _waiters_lock held.
+
+        Returns:
+            bool: True if the subscription is running
+        """
+        if self._pubsub is not None:
+            return True
+        if not self._keyspace_checked:
+            self._keyspace_checked = True
+            self._check_keyspace_events()
+        db = self.redis.connection_pool.connection_kwargs.get('db', 0)
+        pubsub = None
+        try:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(**{f"__keyspace@{db}__:{self.key_prefix}:*": self._on_keyspace_event})
+            self._pubsub_thread = pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=self._on_pubsub_error)
+        except Exception as e:
+            logger.debug("Keyspace subscription failed, polling instead: %s", e)
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+            return False
+        self._pubsub = pubsub
+        return True
+
+    def _add_waiter(self, lock_key: str) -> Optional[threading.Event]:
+        """
+        Register for release notifications on a lock key.
+
+        Args:
+            lock_key: Redis key of the lock
+
+        Returns:
+            Event set when the key is deleted or expires, or None if the
+            subscription could not be started
+        """
+        with self._waiters_lock:
+            if not self._ensure_subscription():
+                return None
+            event = threading.Event()
+            self._release_waiters.setdefault(lock_key, set()).add(event)
+            return event
+
+    def _remove_waiter(self, lock_key: str, event: Optional[threading.Event]) -> None:
+        """Unregister a waiter added by _add_waiter."""
+        if event is None:
+            return
+        with self._waiters_lock:
+            events = self._release_waiters.get(lock_key)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del self._release_waiters[lock_key]
+
+    def _wait_for_release(self, event: Optional[threading.Event], timeout: float) -> bool:
+        """
+        Wait for a lock key to be deleted or to expire.
+
+        Args:
+            event: Waiter from _add_waiter (None = plain sleep)
+            timeout: Maximum time to wait (seconds)
+
+        Returns:
+            bool: True if a release notification was received, False on timeout
+        """
+        if event is None:
+            time.sleep(timeout)
+            return False
+        return event.wait(timeout)
+
+    def close(self) -> None:
+        """Stop the keyspace subscription thread, if one was started."""
+        with self._waiters_lock:
+            pubsub, thread = self._pubsub, self._pubsub_thread
+            self._pubsub = self._pubsub_thread = None
+        if thread is not None:
+            thread.stop()
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception as e:
+                logger.debug("Error closing keyspace subscription: %s", e)
 
     @contextmanager
     def acquire(self, resource_name: str, timeout: Optional[float] = None,
@@ -81,7 +310,8 @@ class RedisLockManager(LockManager):
             ttl: Lock time-to-live (seconds). If not specified, uses default_ttl
 
         Yields:
-            bool: True if lock acquired
+            bool: True when lock is acquired. The TTL read atomically with
+                  the acquire is available from lease_remaining()
 
         Raises:
             TimeoutError: If lock cannot be acquired within timeout
@@ -92,80 +322,133 @@ class RedisLockManager(LockManager):
                 write_to_inverter()
         """
         lock_key = self._get_lock_key(resource_name)
-        lock_value = str(uuid.uuid4())  # Unique identifier for this lock
+        lock_value = os.urandom(16).hex()  # Unique 128-bit identifier for this lock
         lock_ttl = ttl if ttl is not None else self.default_ttl
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        end_time = start_time + timeout if timeout is not None else None
         acquired = False
+        spins = 0
+        attempt = 0
+        subscribed = False
+        event = None
 
         try:
-            # Try to acquire lock
-            if timeout is None:
-                # Wait forever
-                while True:
-                    # SET key value NX EX ttl
-                    # NX = only set if not exists
-                    # EX = expiration time in seconds
-                    if self.redis.set(lock_key, lock_value, nx=True, ex=lock_ttl):
-                        acquired = True
-                        logger.debug(f"Redis lock acquired: {resource_name}")
-                        break
-                    time.sleep(0.1)  # Brief sleep before retry
-            else:
-                # Try with timeout
-                end_time = start_time + timeout
-                while time.time() < end_time:
-                    if self.redis.set(lock_key, lock_value, nx=True, ex=lock_ttl):
-                        acquired = True
-                        elapsed = time.time() - start_time
-                        logger.debug(f"Redis lock acquired: {resource_name} (waited {elapsed:.3f}s)")
+            while True:
+                if event is not None:
+                    # Cleared before each attempt so a release after it is seen
+                    event.clear()
+                pttl_ms = self._try_set(lock_key, lock_value, lock_ttl)
+                if pttl_ms is not None:
+                    acquired = True
+                    self._absent_until.pop(resource_name, None)
+                    self._lease_deadlines[resource_name] = time.monotonic() + pttl_ms / 1000
+                    elapsed = time.monotonic() - start_time
+                    logger.debug("Redis lock acquired: %s (waited %.3fs)", resource_name, elapsed)
+                    break
+
+                remaining = None
+                if end_time is not None:
+                    remaining = end_time - time.monotonic()
+                    if remaining <= 0:
                         break
-                    time.sleep(0.1)  # Brief sleep before retry
 
-                if not acquired:
-                    elapsed = time.time() - start_time
-                    logger.error(f"Timeout acquiring Redis lock: {resource_name} (waited {elapsed:.3f}s)")
-                    raise TimeoutError(f"Could not acquire lock for '{resource_name}' within {timeout}s")
+                # Short locks are usually free again within a few round trips,
+                # so retry immediately (then yielding the GIL) before backing off
+                if (spins < self.SPIN_TRIES + self.YIELD_TRIES and
+                        time.monotonic() - start_time < self.SPIN_LIMIT):
+                    if spins >= self.SPIN_TRIES:
+                        time.sleep(0)
+                    spins += 1
+                    continue
+
+                if not subscribed:
+                    # Subscribe then retry at once so a release in between isn't missed
+                    subscribed = True
+                    event = self._add_waiter(lock_key)
+                    if event is not None:
+                        continue
+
+                # Notifications may be disabled or lost, so never wait past the backoff
+                delay = self._backoff_delay(attempt)
+                self._wait_for_release(event, delay if remaining is None else min(delay, remaining))
+                attempt += 1
+
+            if not acquired:
+                elapsed = time.monotonic() - start_time
+                logger.error("Timeout acquiring Redis lock: %s (waited %.3fs)", resource_name, elapsed)
+                raise TimeoutError(f"Could not acquire lock for '{resource_name}' within {timeout}s")
+
+            self._remove_waiter(lock_key, event)
+            event = None
 
             yield True
 
         finally:
+            self._remove_waiter(lock_key, event)
             if acquired:
+                self._absent_until.pop(resource_name, None)
+                self._lease_deadlines.pop(resource_name, None)
                 # Only release if we own the lock (check value matches)
                 # Use Lua script for atomic check-and-delete
-                lua_script = """
-                if redis.call("get", KEYS[1]) == ARGV[1] then
-                    return redis.call("del", KEYS[1])
-                else
-                    return 0
-                end
-                """
                 try:
-                    result = self.redis.eval(lua_script, 1, lock_key, lock_value)
+                    result = self._release_script(keys=[lock_key], args=[lock_value])
                     if result == 1:
-                        logger.debug(f"Redis lock released: {resource_name}")
+                        logger.debug("Redis lock released: %s", resource_name)
                     else:
-                        logger.warning(f"Lock already released or expired: {resource_name}")
+                        logger.warning("Lock already released or expired: %s", resource_name)
                 except Exception as e:
-                    logger.error(f"Error releasing Redis lock {resource_name}: {e}")
+                    logger.error("Error releasing Redis lock %s: %s", resource_name, e)
 
     def is_locked(self, resource_name: str) -> bool:
         """
         Check if a resource is currently locked.
 
+        A "not locked" answer is reused for NEGATIVE_CACHE_TTL seconds, so a
+        lock taken by another process in that window may be reported late.
+        Acquires and releases through this manager drop the cached answer.
+
         Args:
             resource_name: Resource identifier
 
         Returns:
             bool: True if locked, False otherwise
         """
+        now = time.monotonic()
+        if self._absent_until.get(resource_name, 0.0) > now:
+            return False
+
         lock_key = self._get_lock_key(resource_name)
         try:
-            return self.redis.exists(lock_key) > 0
+            locked = self.redis.exists(lock_key) > 0
         except Exception as e:
-            logger.error(f"Error checking lock status for {resource_name}: {e}")
+            logger.error("Error checking lock status for %s: %s", resource_name, e)
             return False
 
+        if locked:
+            self._absent_until.pop(resource_name, None)
+        else:
+            self._absent_until[resource_name] = now + self.NEGATIVE_CACHE_TTL
+        return locked
+
+    def lease_remaining(self, resource_name: str) -> Optional[int]:
+        """
+        Get the remaining TTL of a lock held through this manager.
+
+        Worked out from the PTTL read atomically with the acquire, so no
+        round trip is made; use get_ttl() for locks held elsewhere.
+
+        Args:
+            resource_name: Resource identifier
+
+        Returns:
+            int: Remaining TTL in milliseconds, or None if not held here
+        """
+        deadline = self._lease_deadlines.get(resource_name)
+        if deadline is None:
+            return None
+        return max(0, int((deadline - time.monotonic()) * 1000))
+
     def get_ttl(self, resource_name: str) -> Optional[int]:
         """
         Get remaining TTL for a lock.
@@ -181,7 +464,7 @@ class RedisLockManager(LockManager):
             ttl = self.redis.ttl(lock_key)
             return ttl if ttl > 0 else None
         except Exception as e:
-            logger.error(f"Error getting TTL for {resource_name}: {e}")
+            logger.error("Error getting TTL for %s: %s", resource_name, e)
             return None
 
     def force_release(self, resource_name: str):
@@ -195,14 +478,15 @@ class RedisLockManager(LockManager):
             resource_name: Resource identifier
         """
         lock_key = self._get_lock_key(resource_name)
+        self._absent_until.pop(resource_name, None)
         try:
             deleted = self.redis.delete(lock_key)
             if deleted:
-                logger.warning(f"Force released lock: {resource_name}")
+                logger.warning("Force released lock: %s", resource_name)
             else:
-                logger.debug(f"No lock to force release: {resource_name}")
+                logger.debug("No lock to force release: %s", resource_name)
         except Exception as e:
-            logger.error(f"Error force releasing lock {resource_name}: {e}")
+            logger.error("Error force releasing lock %s: %s", resource_name, e)
 
     def clear_all(self):
         """
@@ -210,14 +494,27 @@ class RedisLockManager(LockManager):
 
         Warning: This clears ALL locks managed by this instance.
         Only use for testing or administrative cleanup.
+
+        Uses SCAN rather than KEYS so the server is never blocked walking the
+        whole keyspace, and UNLINK so memory is reclaimed in the background.
         """
+        self._absent_until.clear()
         try:
             pattern = f"{self.key_prefix}:*"
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
-                logger.warning(f"Cleared {deleted} locks with pattern: {pattern}")
+            deleted = 0
+            with self.redis.pipeline(transaction=False) as pipe:
+                batch = []
+                for key in self.redis.scan_iter(match=pattern, count=self.CLEAR_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= self.CLEAR_BATCH_SIZE:
+                        pipe.unlink(*batch)
+                        batch = []
+                if batch:
+                    pipe.unlink(*batch)
+                deleted = sum(pipe.execute())
+            if deleted:
+                logger.warning("Cleared %s locks with pattern: %s", deleted, pattern)
             else:
                 logger.debug("No locks to clear")
         except Exception as e:
-            logger.error(f"Error clearing all locks: {e}")
+            logger.error("Error clearing all locks: %s", e)
@@ -10,7 +10,9 @@ that can work with either files (legacy) or Redis (distributed).
 from abc import ABC, abstractmethod
 import os
 from os.path import exists
+from typing import Iterable
 import logging
+import time
 
 try:
     import redis
@@ -18,9 +20,14 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+from .redis_health import verify_client
+
 
 logger = logging.getLogger(__name__)
 
+# Create-if-missing without truncating; O_CLOEXEC where the platform has it
+_FLAG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0)
+
 
 class StatusManager(ABC):
     """Abstract base class for status management."""
@@ -69,8 +76,16 @@ class FileStatusManager(StatusManager):
     File-based status manager (legacy implementation).
 
     Uses hidden files as status flags. Compatible with existing code.
+
+    Existence checks are served from a short-lived snapshot of the hidden
+    files in base_path, so polling several flags costs one directory scan
+    rather than one stat per flag. Flags changed by other processes become
+    visible within CACHE_TTL seconds.
     """
 
+    # Seconds a directory snapshot is reused by is_status_set
+    CACHE_TTL = 0.05
+
     def __init__(self, base_path: str = "."):
         """
         Initialize file status manager.
@@ -79,7 +94,9 @@ class FileStatusManager(StatusManager):
             base_path: Base directory for status files
         """
         self.base_path = base_path
-        logger.debug(f"FileStatusManager initialized with base_path: {base_path}")
+        self._cache = None  # Hidden filenames in base_path at _cache_ts
+        self._cache_ts = 0.0
+        logger.debug("FileStatusManager initialized with base_path: %s", base_path)
 
     def _get_status_file(self, status_name: str) -> str:
         """Get full path to status file."""
@@ -89,25 +106,37 @@ class FileStatusManager(StatusManager):
         """Create a status file to indicate operation is active."""
         filepath = self._get_status_file(status_name)
         try:
-            open(filepath, 'w').close()
-            logger.debug(f"Status set: {status_name}")
+            os.close(os.open(filepath, _FLAG_OPEN_FLAGS, 0o644))
+            logger.debug("Status set: %s", status_name)
         except Exception as e:
-            logger.error(f"Error setting status {status_name}: {e}")
+            logger.error("Error setting status %s: %s", status_name, e)
+        self._cache = None
 
     def clear_status(self, status_name: str) -> None:
         """Remove a status file to indicate operation completed."""
         filepath = self._get_status_file(status_name)
         try:
-            if exists(filepath):
-                os.remove(filepath)
-                logger.debug(f"Status cleared: {status_name}")
+            os.unlink(filepath)
+            logger.debug("Status cleared: %s", status_name)
+        except FileNotFoundError:
+            pass  # Not set
         except Exception as e:
-            logger.error(f"Error clearing status {status_name}: {e}")
+            logger.error("Error clearing status %s: %s", status_name, e)
+        self._cache = None
 
     def is_status_set(self, status_name: str) -> bool:
-        """Check if status file exists."""
-        filepath = self._get_status_file(status_name)
-        return exists(filepath)
+        """Check if status file exists (using the cached directory snapshot)."""
+        cache = self._cache
+        now = time.monotonic()
+        if cache is None or now - self._cache_ts > self.CACHE_TTL:
+            try:
+                with os.scandir(self.base_path) as entries:
+                    cache = {e.name for e in entries if e.name.startswith('.')}
+            except OSError as e:
+                logger.error("Error scanning status directory %s: %s", self.base_path, e)
+                return exists(self._get_status_file(status_name))
+            self._cache, self._cache_ts = cache, now
+        return f".{status_name}" in cache
 
     def clear_all(self) -> None:
         """Clear all known status files."""
@@ -124,6 +153,9 @@ class RedisStatusManager(StatusManager):
     Uses Redis keys as status flags. Better for multi-process/multi-machine deployments.
     """
 
+    # Keys per SCAN page / UNLINK call in clear_all
+    CLEAR_BATCH_SIZE = 500
+
     def __init__(self, redis_client: 'redis.Redis', key_prefix: str = 'givtcp:status',
                  default_ttl: int = 3600):
         """
@@ -140,18 +172,31 @@ class RedisStatusManager(StatusManager):
         self.redis = redis_client
         self.key_prefix = key_prefix
         self.default_ttl = default_ttl
+        self._key_cache = {}  # name -> prefixed Redis key
 
-        # Verify Redis connection
-        try:
-            self.redis.ping()
-            logger.info("RedisStatusManager initialized successfully")
-        except redis.ConnectionError as e:
-            logger.error(f"Redis connection failed: {e}")
-            raise
+        # Verify Redis connection (once per client)
+        self.verify_connection()
+        logger.info("RedisStatusManager initialized successfully")
+
+    def verify_connection(self) -> None:
+        """
+        Ping Redis, skipping clients that have already answered.
+
+        Managers are cheap to construct around a shared client; only the
+        first manager of any kind (lock or status) built for a given client
+        pays the PING round trip.
+
+        Raises:
+            redis.ConnectionError: If Redis cannot be reached
+        """
+        verify_client(self.redis)
 
     def _get_status_key(self, status_name: str) -> str:
-        """Generate Redis key for a status flag."""
-        return f"{self.key_prefix}:{status_name}"
+        """Generate Redis key for a status flag (memoised per name)."""
+        key = self._key_cache.get(status_name)
+        if key is None:
+            key = self._key_cache[status_name] = f"{self.key_prefix}:{status_name}"
+        return key
 
     def set_status(self, status_name: str, ttl: int = None) -> None:
         """
@@ -159,25 +204,86 @@ class RedisStatusManager(StatusManager):
 
         Args:
             status_name: Name of the status flag
-            ttl: Time-to-live in seconds (prevents stuck statuses). Uses default_ttl if not specified
+            ttl: Time-to-live in seconds (prevents stuck statuses). Uses default_ttl
+                 if not specified; 0 sets a flag that never expires
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+
+        try:
+            self.redis.set(self._get_status_key(status_name), '1', ex=ttl or None)
+            logger.debug("Redis status set: %s (TTL: %ss)", status_name, ttl)
+        except Exception as e:
+            logger.error("Error setting Redis status %s: %s", status_name, e)
+
+    def set_status_if_absent(self, status_name: str, ttl: int = None) -> bool:
+        """
+        Set a status flag only if it is not already set (atomic test-and-set).
+
+        Args:
+            status_name: Name of the status flag
+            ttl: Time-to-live in seconds. Uses default_ttl if not specified; 0 = no expiry
+
+        Returns:
+            bool: True if the flag was set by this call, False if it was already set
         """
         key = self._get_status_key(status_name)
         ttl = ttl if ttl is not None else self.default_ttl
 
         try:
-            self.redis.setex(key, ttl, '1')
-            logger.debug(f"Redis status set: {status_name} (TTL: {ttl}s)")
+            if self.redis.set(key, '1', nx=True, ex=ttl or None):
+                logger.debug("Redis status set: %s (TTL: %ss)", status_name, ttl)
+                return True
+            logger.debug("Redis status already set: %s", status_name)
+            return False
         except Exception as e:
-            logger.error(f"Error setting Redis status {status_name}: {e}")
+            logger.error("Error setting Redis status %s: %s", status_name, e)
+            return False
 
     def clear_status(self, status_name: str) -> None:
         """Clear a status flag from Redis."""
         key = self._get_status_key(status_name)
         try:
             self.redis.delete(key)
-            logger.debug(f"Redis status cleared: {status_name}")
+            logger.debug("Redis status cleared: %s", status_name)
+        except Exception as e:
+            logger.error("Error clearing Redis status %s: %s", status_name, e)
+
+    def set_many(self, status_names: Iterable[str], ttl: int = None) -> None:
+        """
+        Set several status flags in a single round trip.
+
+        Args:
+            status_names: Names of the status flags
+            ttl: Time-to-live in seconds. Uses default_ttl if not specified; 0 = no expiry
+        """
+        names = list(status_names)
+        ttl = ttl if ttl is not None else self.default_ttl
+
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                for status_name in names:
+                    pipe.set(self._get_status_key(status_name), '1', ex=ttl or None)
+                pipe.execute()
+            logger.debug("Redis statuses set: %s (TTL: %ss)", names, ttl)
         except Exception as e:
-            logger.error(f"Error clearing Redis status {status_name}: {e}")
+            logger.error("Error setting Redis statuses %s: %s", names, e)
+
+    def clear_many(self, status_names: Iterable[str]) -> None:
+        """
+        Clear several status flags in a single round trip.
+
+        Args:
+            status_names: Names of the status flags
+        """
+        names = list(status_names)
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                for status_name in names:
+                    pipe.delete(self._get_status_key(status_name))
+                pipe.execute()
+            logger.debug("Redis statuses cleared: %s", names)
+        except Exception as e:
+            logger.error("Error clearing Redis statuses %s: %s", names, e)
 
     def is_status_set(self, status_name: str) -> bool:
         """Check if a status flag is set in Redis."""
@@ -185,7 +291,7 @@ class RedisStatusManager(StatusManager):
         try:
             return self.redis.exists(key) > 0
         except Exception as e:
-            logger.error(f"Error checking Redis status {status_name}: {e}")
+            logger.error("Error checking Redis status %s: %s", status_name, e)
             return False
 
     def get_ttl(self, status_name: str) -> int:
@@ -202,18 +308,32 @@ class RedisStatusManager(StatusManager):
         try:
             return self.redis.ttl(key)
         except Exception as e:
-            logger.error(f"Error getting TTL for {status_name}: {e}")
+            logger.error("Error getting TTL for %s: %s", status_name, e)
             return -2
 
     def clear_all(self) -> None:
-        """Clear all status flags with this prefix."""
+        """
+        Clear all status flags with this prefix.
+
+        Uses SCAN rather than KEYS so the server is never blocked walking the
+        whole keyspace, and UNLINK so memory is reclaimed in the background.
+        """
         try:
             pattern = f"{self.key_prefix}:*"
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
-                logger.info(f"Cleared {deleted} Redis status flags")
+            deleted = 0
+            with self.redis.pipeline(transaction=False) as pipe:
+                batch = []
+                for key in self.redis.scan_iter(match=pattern, count=self.CLEAR_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= self.CLEAR_BATCH_SIZE:
+                        pipe.unlink(*batch)
+                        batch = []
+                if batch:
+                    pipe.unlink(*batch)
+                deleted = sum(pipe.execute())
+            if deleted:
+                logger.info("Cleared %s Redis status flags", deleted)
             else:
                 logger.debug("No Redis status flags to clear")
         except Exception as e:
-            logger.error(f"Error clearing all Redis statuses: {e}")
+            logger.error("Error clearing all Redis statuses: %s", e)
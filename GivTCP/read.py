@@ -17,7 +17,7 @@ from settings import GiV_Settings
 from os.path import exists
 import os
 # Import utility functions (Phase 1 refactoring: testing infrastructure)
-from utils import dicttoList, iterate_dict, dataSmoother2
+from utils import iter_keys, iterate_dict, dataSmoother2
 
 # Phase 2 refactoring: Repository pattern for thread-safe cache operations
 from repositories import PickleCacheRepository
@@ -34,6 +34,7 @@ from services import (
     ControlModeService,
     DataProcessingService
 )
+from services.hardware_service import LockHeldError, file_lock
 
 logging.getLogger("givenergy_modbus").setLevel(logging.CRITICAL)
 logging.getLogger("rq.worker").setLevel(logging.CRITICAL)
@@ -91,7 +92,7 @@ if USE_NEW_SERVICES:
         rate_calc_func=None,  # Will be passed at call time
         battery_value_func=None,  # Will be passed at call time
         data_cleansing_func=None,  # Will be passed at call time
-        dict_to_list_func=dicttoList
+        dict_to_list_func=iter_keys
     )
     logger.info("Using new service-based implementation for getData")
 else:
@@ -136,8 +137,7 @@ def getData_with_services(fullrefresh):
         energy_today = energy_service.calculate_daily_energy(inverter)
 
         # 3. Power calculations
-        power = power_service.calculate_power_stats(inverter)
-        flows = power_service.calculate_power_flows(power)
+        power, flows = power_service.calculate_power_stats_and_flows(inverter)
 
         # 4. Battery metrics (if batteries present)
         battery_metrics = {}
@@ -187,10 +187,7 @@ def getData_with_services(fullrefresh):
             energy_total.update(battery_energy_totals)
 
         # 5. Control mode and configuration
-        cache_stack = processing_service.load_cache_stack()
-        cache_data = cache_stack[4] if cache_stack and len(cache_stack) > 4 and cache_stack[4] != 0 else None
-
-        control_mode = control_service.detect_control_mode(inverter, cache_data)
+        control_mode = control_service.detect_control_mode(inverter)
         timeslots = control_service.get_timeslots(inverter)
         inverter_details = control_service.get_inverter_details(inverter)
 
@@ -281,31 +278,17 @@ def getData_legacy(fullrefresh):  # Read from Invertor put in cache
                 result['result'] = "Error: Timeout waiting for inverter read lock"
                 return json.dumps(result)
         else:
-            # Legacy: File-based locking (has TOCTOU vulnerability)
-            # Only run if no lockfile present
-            if exists(GivLUT.lockfile):
-                logger.error("Lockfile set so aborting getData")
-                result['result'] = "Error: Lockfile set so aborting getData"
-                return json.dumps(result)
-
-            # SET Lockfile to prevent clashes
-            logger.info("setting lock file")
+            # Legacy: flock on the lock file, shared with the service layer.
+            # The file itself persists, so its existence is not the lock.
             logger.info("Connecting to: " + GiV_Settings.invertorIP)
-            open(GivLUT.lockfile, 'w').close()
-
             try:
-                plant = GivClient.getData(fullrefresh)
-                GEInv = plant.inverter
-                GEBat = plant.batteries
-                # Close Lockfile to allow access
-                logger.info("Removing lock file")
-                os.remove(GivLUT.lockfile)
-            except:
-                # Close Lockfile to allow access in the event of an error
-                logger.info("Removing lock file due to read error")
-                if exists(GivLUT.lockfile):
-                    os.remove(GivLUT.lockfile)
-                raise  # Re-raise to be caught by outer except
+                with file_lock(GivLUT.lockfile):
+                    plant = GivClient.getData(fullrefresh)
+                    GEInv = plant.inverter
+                    GEBat = plant.batteries
+            except LockHeldError as e:
+                result['result'] = "Error: " + str(e)
+                return json.dumps(result)
 
         # Common code for both locking mechanisms
         multi_output['Last_Updated_Time'] = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
@@ -381,8 +364,8 @@ def getData_legacy(fullrefresh):  # Read from Invertor put in cache
         if checksum == 0 and GEInv.system_time.hour == 0 and GEInv.system_time.minute == 0:
             logger.info("Energy Today is Zero and its midnight so resetting regCache")
             if USE_NEW_CACHE:
-                if cache_repo.exists('regCache_' + str(GiV_Settings.givtcp_instance)):
-                    cache_repo.delete('regCache_' + str(GiV_Settings.givtcp_instance))
+                # delete() is a no-op for missing keys, no exists() check needed
+                cache_repo.delete('regCache_' + str(GiV_Settings.givtcp_instance))
             else:
                 # Legacy pickle operations
                 if exists(GivLUT.regcache):
@@ -761,9 +744,7 @@ def getData_legacy(fullrefresh):  # Read from Invertor put in cache
         # only update cache if its the same set of keys as previous (don't update if data missing)
 
         if 'multi_output_old' in locals():
-            MOList = dicttoList(multi_output)
-            MOOList = dicttoList(multi_output_old)
-            dataDiff = set(MOOList) - set(MOList)
+            dataDiff = set(iter_keys(multi_output_old)) - set(iter_keys(multi_output))
             if len(dataDiff) > 0:
                 for key in dataDiff:
                     logger.critical(str(key)+" is missing from new data, publishing all other data")
@@ -1010,14 +991,17 @@ def dataCleansing(data, regCacheStack):
     logger.info("Running the data cleansing process")
     # iterate multi_output to get each end result dict.
     # Loop that dict to validate against
-    new_multi_output = loop_dict(data, regCacheStack, data["Last_Updated_Time"])
+    # Parse the timestamps once for every value smoothed in this pass
+    lastUpdate = datetime.datetime.fromisoformat(data["Last_Updated_Time"])
+    now = datetime.datetime.now(GivLUT.timezone)
+    new_multi_output = loop_dict(data, regCacheStack, lastUpdate, now)
     return(new_multi_output)
 
 
 # dicttoList function moved to utils.py (Phase 1 refactoring)
 
 
-def loop_dict(array, regCacheStack, lastUpdate):
+def loop_dict(array, regCacheStack, lastUpdate, now=None):
     safeoutput = {}
     # finaloutput={}
     # arrayout={}
@@ -1028,7 +1012,7 @@ def loop_dict(array, regCacheStack, lastUpdate):
             continue
         if isinstance(output, dict):
             if p_load in regCacheStack:
-                temp = loop_dict(output, regCacheStack[p_load], lastUpdate)
+                temp = loop_dict(output, regCacheStack[p_load], lastUpdate, now)
                 safeoutput[p_load] = temp
                 logger.info('Data cleansed for: '+str(p_load))
             else:
@@ -1038,7 +1022,7 @@ def loop_dict(array, regCacheStack, lastUpdate):
             # run datasmoother on the data item
             # only run if old data exists otherwise return the existing value
             if p_load in regCacheStack:
-                safeoutput[p_load] = dataSmoother2([p_load, output], [p_load, regCacheStack[p_load]], lastUpdate, givLUT, GivLUT.timezone, GiV_Settings.data_smoother)
+                safeoutput[p_load] = dataSmoother2([p_load, output], [p_load, regCacheStack[p_load]], lastUpdate, givLUT, GivLUT.timezone, GiV_Settings.data_smoother, now)
             else:
                 logger.critical(p_load+" has no data in the cache so using new value.")
                 safeoutput[p_load] = output
@@ -1051,8 +1035,10 @@ def loop_dict(array, regCacheStack, lastUpdate):
 def calcBatteryValue(multi_output):
     # get current data from cache (Phase 2: using repository if enabled)
     batterystats = {}
+    battery_stats_cached = False
     if USE_NEW_CACHE:
-        batterystats = cache_repo.get('battery_' + str(GiV_Settings.givtcp_instance))
+        batterystats = cache_repo.get_or_default('battery_' + str(GiV_Settings.givtcp_instance))
+        battery_stats_cached = batterystats is not None
         if not batterystats:
             # First time running
             logger.critical("First time running so saving AC Charge status")
@@ -1077,7 +1063,7 @@ def calcBatteryValue(multi_output):
 
     if GiV_Settings.first_run or datetime.datetime.now(GivLUT.timezone).minute == 59 or datetime.datetime.now(GivLUT.timezone).minute == 29:
         # Check for touchfile and battery stats (Phase 2: using repository if enabled)
-        has_battery_stats = USE_NEW_CACHE and cache_repo.exists('battery_' + str(GiV_Settings.givtcp_instance)) or (not USE_NEW_CACHE and exists(GivLUT.batterypkl))
+        has_battery_stats = USE_NEW_CACHE and battery_stats_cached or (not USE_NEW_CACHE and exists(GivLUT.batterypkl))
         if not exists(GivLUT.ppkwhtouch) and has_battery_stats:      # only run this if there is no touchfile but there is a battery stat
             battery_kwh = multi_output['Power']['Power']['SOC_kWh']
             ac_charge = float(multi_output['Energy']['Total']['AC_Charge_Energy_Total_kWh'])-float(batterystats['AC Charge last'])
@@ -15,15 +15,177 @@ Key improvements:
 """
 
 from abc import ABC, abstractmethod
-from threading import RLock
-from typing import Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Event, Lock, RLock, Thread
+from typing import Any, Dict, Iterable, Optional
+import copy
+import itertools
 import pickle
 import os
+import struct
+import weakref
 from contextlib import contextmanager
 import logging
 
+# fastrlock provides a C-level RLock that is much cheaper to acquire and
+# release when uncontended (optional dependency)
+try:
+    from fastrlock.rlock import RLock as _RLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    _RLock = RLock
+    FASTRLOCK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Pickle entry points bound once; get/set run per key on every poll cycle
+_pickle_loads = pickle.loads
+_pickle_dumps = pickle.dumps
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+_UnpicklingError = pickle.UnpicklingError
+
+# Flags for an unnamed temp file in the cache dir (Linux O_TMPFILE)
+_O_TMPFILE_FLAGS = (os.O_TMPFILE | os.O_WRONLY | getattr(os, 'O_CLOEXEC', 0)
+                    if hasattr(os, 'O_TMPFILE') else None)
+
+# Flags for claiming a named temp file that must not already exist
+_NAMED_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0)
+
+# Per-process sequence for temp file names
+_TMP_COUNTER = itertools.count()
+
+# Header marking a pickle with out-of-band buffers: magic, a little-endian
+# uint32 buffer count, then a uint64 length for the main stream and each buffer
+OOB_MAGIC = b'PKB\x00'
+_OOB_COUNT = struct.Struct('<I')
+_OOB_LEN = struct.Struct('<Q')
+
+
+def _encode_value(value: Any) -> bytes:
+    """
+    Pickle a value, moving large buffers out of the pickle stream.
+
+    With protocol 5, objects that support it (PickleBuffer, NumPy arrays)
+    hand their data to buffer_callback instead of copying it into the
+    stream. Those buffers are appended raw after the main stream. Values
+    without such buffers (plain register dicts) are written as an ordinary
+    pickle, so other modules can keep unpickling the cache files directly.
+
+    Args:
+        value: Data to serialize (must be picklable)
+
+    Returns:
+        Encoded bytes
+    """
+    buffers = []
+    main = _pickle_dumps(value, _PICKLE_PROTOCOL, buffer_callback=buffers.append)
+    if not buffers:
+        return main
+
+    raws = [buf.raw() for buf in buffers]
+    lengths = [len(main)] + [raw.nbytes for raw in raws]
+    header = OOB_MAGIC + _OOB_COUNT.pack(len(raws)) + b''.join(
+        _OOB_LEN.pack(length) for length in lengths)
+    return b''.join([header, main, *raws])
+
+
+def _decode_value(data) -> Any:
+    """
+    Rebuild a value encoded by _encode_value.
+
+    Out-of-band buffers are passed to pickle as memoryview slices of data,
+    so arrays are reconstructed over the file contents without a copy.
+
+    Args:
+        data: Encoded bytes (a bytearray gives writable buffers)
+
+    Returns:
+        The decoded value
+    """
+    if data[:len(OOB_MAGIC)] != OOB_MAGIC:
+        return _pickle_loads(data)
+
+    view = memoryview(data)
+    offset = len(OOB_MAGIC)
+    (count,) = _OOB_COUNT.unpack_from(data, offset)
+    offset += _OOB_COUNT.size
+    lengths = [_OOB_LEN.unpack_from(data, offset + i * _OOB_LEN.size)[0]
+               for i in range(count + 1)]
+    offset += (count + 1) * _OOB_LEN.size
+
+    chunks = []
+    for length in lengths:
+        if offset + length > len(data):
+            raise EOFError("Truncated out-of-band pickle")
+        chunks.append(view[offset:offset + length])
+        offset += length
+    return _pickle_loads(chunks[0], buffers=chunks[1:])
+
+
+def _write_all(f, data: bytes) -> None:
+    """
+    Write all of data to an unbuffered file, looping over short writes.
+
+    Args:
+        f: Raw (buffering=0) binary file
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _read_file(filepath: str) -> bytearray:
+    """
+    Read a whole file with one unbuffered readinto() into an exact-size buffer.
+
+    Skips the BufferedReader's internal copy, and a bytearray lets decoders
+    hand out writable views of the contents.
+
+    Args:
+        filepath: File to read
+
+    Returns:
+        The file contents
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    with open(filepath, 'rb', buffering=0) as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        view = memoryview(data)
+        filled = 0
+        while filled < len(data):
+            n = f.readinto(view[filled:])
+            if not n:
+                break  # File shrank since fstat
+            filled += n
+        view.release()
+    del data[filled:]
+    return data
+
+
+def _temp_path(filepath: str) -> str:
+    """
+    Return a temp file name for filepath that is unique to this attempt.
+
+    The process id and a per-process counter keep concurrent writers, in
+    this or another process, from ever sharing a temp file.
+    """
+    return f"{filepath}.{os.getpid()}.{next(_TMP_COUNTER)}.tmp"
+
+
+@lru_cache(maxsize=2048)
+def _cache_filepath(cache_location: str, key: str) -> str:
+    """
+    Build (and memoise) the pickle file path for a cache key.
+
+    The set of cache keys is small and reused every poll, so this avoids
+    re-joining the same path on every cache operation.
+    """
+    return os.path.join(cache_location, key + '.pkl')
+
 
 class CacheRepository(ABC):
     """
@@ -57,11 +219,32 @@ class CacheRepository(ABC):
         """
         pass
 
+    def get_or_default(self, key: str, default: Any = None) -> Any:
+        """
+        Retrieve cached data, or a default if the key is missing.
+
+        This is the canonical read API: one lookup answers both "is it
+        there?" and "what is it?", so callers should not pair exists()
+        with get().
+
+        Args:
+            key: Cache key identifier
+            default: Value returned when the key is missing or unreadable
+
+        Returns:
+            Cached data if exists, default otherwise
+        """
+        value = self.get(key)
+        return default if value is None else value
+
     @abstractmethod
     def exists(self, key: str) -> bool:
         """
         Check if key exists in cache.
 
+        Intended for diagnostics; use get_or_default() to read, rather
+        than exists() followed by get().
+
         Args:
             key: Cache key identifier
 
@@ -80,13 +263,39 @@ class CacheRepository(ABC):
         """
         pass
 
+    def mget(self, keys: Iterable[str]) -> Dict[str, Optional[Any]]:
+        """
+        Retrieve several cached values.
+
+        Backends override this when they can fetch in bulk.
+
+        Args:
+            keys: Cache key identifiers
+
+        Returns:
+            Dict mapping each key to its cached data, or None if missing
+        """
+        return {key: self.get(key) for key in keys}
+
+    def mset(self, items: Dict[str, Any]) -> None:
+        """
+        Store several values.
+
+        Backends override this when they can write in bulk.
+
+        Args:
+            items: Mapping of cache key to data (must be picklable)
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
 
 class PickleCacheRepository(CacheRepository):
     """
     Thread-safe pickle-based cache implementation.
 
     This implementation fixes the race conditions in the original code by:
-    1. Using per-file RLock for thread-safe access
+    1. Using per-file RLock to serialize writers (reads are lock-free)
     2. Atomic writes via temp file + os.replace()
     3. Proper exception handling
     4. Automatic cleanup on errors
@@ -94,25 +303,70 @@ class PickleCacheRepository(CacheRepository):
     Example:
         >>> cache = PickleCacheRepository('/path/to/cache')
         >>> cache.set('regCache_1', {'data': 'value'})
-        >>> data = cache.get('regCache_1')
-        >>> if cache.exists('regCache_1'):
-        ...     cache.delete('regCache_1')
+        >>> data = cache.get_or_default('regCache_1', {})
+        >>> cache.delete('regCache_1')
     """
 
-    def __init__(self, cache_location: str):
+    # Number of unpickled values kept in memory for repeated reads
+    MEM_CACHE_SIZE = 128
+
+    # Per-file lock table size above which idle locks are pruned
+    LOCK_TABLE_LIMIT = 1024
+
+    def __init__(self, cache_location: str, write_behind: float = 0,
+                 durable: bool = False):
         """
         Initialize the pickle cache repository.
 
         Args:
             cache_location: Directory path where cache files are stored
+            write_behind: Debounce delay in seconds for coalesced background
+                writes (default: 0 = write synchronously in set()). When
+                enabled, call close() on shutdown to flush pending writes.
+            durable: fsync each file and the directory around os.replace()
+                (default: False). Cache contents are rebuilt from the
+                inverter on restart, so by default writes rely only on
+                os.replace() atomicity and skip the much slower syncs.
         """
         self.cache_location = cache_location
+        self._durable = durable
         self._locks = {}  # Per-file locks: {filepath: RLock}
-        self._global_lock = RLock()  # Lock for _locks dict access
+        self._prune_lock = _RLock()  # Serializes pruning of idle _locks entries
+        # In-memory LRU of encoded file contents: {key: ((ino, mtime_ns, size), bytes)}
+        self._mem = OrderedDict()
+        self._mem_lock = _RLock()
+
+        # Write-behind state: latest unwritten value per key, and the batch
+        # currently being written by the flusher
+        self.write_behind = write_behind
+        self._pending = {}
+        self._inflight = {}
+        self._pending_lock = Lock()
+        self._flush_lock = Lock()  # Orders batches so newer values land last
+        self._write_event = Event()
+        self._stop_event = Event()
+        self._writer = None
 
         # Ensure cache directory exists
         os.makedirs(cache_location, exist_ok=True)
 
+        # Write via unnamed O_TMPFILE inodes where the platform supports it.
+        # Linking one in needs linkat() relative to a directory fd.
+        self._tmpfile_supported = False
+        self._dir_fd = None
+        if _O_TMPFILE_FLAGS is not None:
+            try:
+                self._dir_fd = os.open(cache_location, os.O_RDONLY | os.O_DIRECTORY)
+                weakref.finalize(self, os.close, self._dir_fd)
+                self._tmpfile_supported = True
+            except OSError:
+                pass
+
+        if write_behind:
+            self._writer = Thread(target=self._writer_loop,
+                                  name='PickleCacheWriter', daemon=True)
+            self._writer.start()
+
         logger.info(f"PickleCacheRepository initialized at {cache_location}")
 
     @contextmanager
@@ -129,15 +383,44 @@ class PickleCacheRepository(CacheRepository):
         Yields:
             None (lock is held within context)
         """
-        # Get or create lock for this specific file
-        with self._global_lock:
-            if filepath not in self._locks:
-                self._locks[filepath] = RLock()
-            file_lock = self._locks[filepath]
+        while True:
+            # Get or create lock for this specific file; setdefault is atomic
+            # so racing first users agree on a single lock without a global lock
+            file_lock = self._locks.get(filepath)
+            if file_lock is None:
+                if len(self._locks) >= self.LOCK_TABLE_LIMIT:
+                    self._prune_locks()
+                file_lock = self._locks.setdefault(filepath, _RLock())
+
+            # Acquire the file-specific lock
+            with file_lock:
+                # The lock may have been pruned while we waited; retry with
+                # the current one so all users of this file share a lock
+                if self._locks.get(filepath) is not file_lock:
+                    continue
+                yield
+                return
+
+    def _prune_locks(self) -> None:
+        """
+        Drop per-file locks that are not currently held.
 
-        # Acquire the file-specific lock
-        with file_lock:
-            yield
+        Keeps the lock table bounded under key churn. A lock is only removed
+        while the pruner holds it, and _file_lock re-checks the table after
+        acquiring, so a removed lock is never used to guard a file.
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return  # Another thread is already pruning
+        try:
+            for filepath, file_lock in list(self._locks.items()):
+                if file_lock.acquire(blocking=False):
+                    try:
+                        if self._locks.get(filepath) is file_lock:
+                            del self._locks[filepath]
+                    finally:
+                        file_lock.release()
+        finally:
+            self._prune_lock.release()
 
     def _get_filepath(self, key: str) -> str:
         """
@@ -149,36 +432,120 @@ class PickleCacheRepository(CacheRepository):
         Returns:
             Full path to cache file
         """
-        return os.path.join(self.cache_location, f"{key}.pkl")
+        return _cache_filepath(self.cache_location, key)
 
     def get(self, key: str) -> Optional[Any]:
         """
         Retrieve cached data with thread-safe read.
 
+        The encoded bytes of recently read files are kept in memory and
+        revalidated against the file's inode/mtime/size with a single stat,
+        so repeated reads of an unchanged key skip the open + read. Every
+        call still unpickles, so each caller gets its own object and may
+        modify it freely.
+
+        Reads take no lock: writers publish complete files with os.replace(),
+        so an open() sees either the old or the new file, never a partial
+        one. A truncated read (from a writer outside this repository that
+        rewrites the file in place) is retried once.
+
         Args:
             key: Cache key identifier
 
         Returns:
             Cached data if exists and readable, None otherwise
         """
+        if self.write_behind:
+            with self._pending_lock:
+                for batch in (self._pending, self._inflight):
+                    if key in batch:
+                        # Hand out a copy so callers can't mutate the value
+                        # still queued for writing
+                        return copy.deepcopy(batch[key])
+
         filepath = self._get_filepath(key)
 
-        if not os.path.exists(filepath):
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             return None
+        # Every atomic write publishes a new inode, so the inode number tells
+        # rewrites apart even within one coarse mtime tick
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        # Serve from memory if the file hasn't changed since it was read
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._mem.move_to_end(key)
+                raw = entry[1]
+            else:
+                raw = None
+        if raw is not None:
+            try:
+                # Out-of-band buffers are decoded as views, so give them a
+                # private writable copy rather than the shared bytes
+                if raw[:len(OOB_MAGIC)] == OOB_MAGIC:
+                    raw = bytearray(raw)
+                data = _decode_value(raw)
+                logger.debug(f"Cache hit (memory): {key}")
+                return data
+            except Exception as e:
+                logger.error(f"Unexpected error decoding cache {key}: {e}")
+                self._forget(key)
+                return None
 
-        with self._file_lock(filepath):
+        for retry in (True, False):
             try:
-                with open(filepath, 'rb') as f:
-                    data = pickle.load(f)
+                # A bytearray gives out-of-band buffers back writable
+                # without copying them out of the file contents
+                raw = _read_file(filepath)
+                encoded = bytes(raw)
+                data = _decode_value(raw)
                 logger.debug(f"Cache hit: {key}")
-                return data
-            except (EOFError, pickle.UnpicklingError) as e:
+                break
+            except FileNotFoundError:
+                return None
+            except (EOFError, _UnpicklingError, struct.error) as e:
+                if retry:
+                    continue
                 logger.error(f"Failed to read cache {key}: {e}")
                 return None
             except Exception as e:
                 logger.error(f"Unexpected error reading cache {key}: {e}")
                 return None
 
+        self._remember(key, stamp, encoded)
+        return data
+
+    def _remember(self, key: str, stamp: tuple, encoded: bytes) -> None:
+        """
+        Store a file's encoded bytes in the in-memory LRU, evicting the oldest entry.
+
+        Only bytes are kept, never decoded objects, so no mutable value is
+        shared between callers.
+
+        Args:
+            key: Cache key identifier
+            stamp: (ino, mtime_ns, size) of the file the bytes were read from
+            encoded: Immutable file contents
+        """
+        with self._mem_lock:
+            self._mem[key] = (stamp, encoded)
+            self._mem.move_to_end(key)
+            if len(self._mem) > self.MEM_CACHE_SIZE:
+                self._mem.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        """
+        Drop a key from the in-memory LRU.
+
+        Args:
+            key: Cache key identifier
+        """
+        with self._mem_lock:
+            self._mem.pop(key, None)
+
     def set(self, key: str, value: Any) -> None:
         """
         Store data with thread-safe atomic write.
@@ -190,6 +557,10 @@ class PickleCacheRepository(CacheRepository):
 
         This prevents corruption from concurrent writes or crashes mid-write.
 
+        With write_behind enabled, the value is queued instead and written by
+        the background writer; repeated sets of the same key before a flush
+        are coalesced so only the latest value is written.
+
         Args:
             key: Cache key identifier
             value: Data to cache (must be picklable)
@@ -197,33 +568,250 @@ class PickleCacheRepository(CacheRepository):
         Raises:
             Exception: If write fails (after cleanup)
         """
-        filepath = self._get_filepath(key)
-        temp_filepath = filepath + '.tmp'
+        if self.write_behind:
+            with self._pending_lock:
+                self._pending[key] = value
+            self._forget(key)
+            self._write_event.set()
+            return
+
+        self._write(key, value)
+
+    def mset(self, items: Dict[str, Any]) -> None:
+        """
+        Store several values.
+
+        With write_behind enabled the whole batch is queued under one lock
+        and handed to the writer with a single wake-up.
+
+        Args:
+            items: Mapping of cache key to data (must be picklable)
+
+        Raises:
+            Exception: If a synchronous write fails (after cleanup)
+        """
+        if not self.write_behind:
+            for key, value in items.items():
+                self._write(key, value)
+            return
+
+        with self._pending_lock:
+            self._pending.update(items)
+        for key in items:
+            self._forget(key)
+        self._write_event.set()
 
+    def _write(self, key: str, value: Any) -> None:
+        """
+        Atomically write a value to its cache file.
+
+        Args:
+            key: Cache key identifier
+            value: Data to cache (must be picklable)
+
+        Raises:
+            Exception: If write fails (after cleanup)
+        """
+        # Serialize up front, outside the file lock, so the file is written
+        # with a single unbuffered write() instead of many small pickler writes
+        try:
+            data = _encode_value(value)
+        except Exception as e:
+            logger.error(f"Failed to write cache {key}: {e}")
+            raise
+
+        self._write_file(key, self._get_filepath(key), data)
+
+    def _write_file(self, key: str, filepath: str, data: bytes) -> None:
+        """
+        Atomically replace a cache file with already-serialized bytes.
+
+        Args:
+            key: Cache key identifier (for logging and memory invalidation)
+            filepath: Destination file path
+            data: Bytes to write
+
+        Raises:
+            Exception: If write fails (after cleanup)
+        """
         with self._file_lock(filepath):
+            self._forget(key)
+            temp_filepath = None
             try:
-                # Write to temp file first
-                with open(temp_filepath, 'wb') as f:
-                    pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+                # Write to temp file first; prefer an unnamed inode so a
+                # crash mid-write leaves nothing behind in the cache dir
+                temp_filepath = self._write_unnamed_tmpfile(filepath, data)
+                if temp_filepath is None:
+                    temp_filepath = self._write_named_tmpfile(filepath, data)
 
                 # Atomic rename (works on Windows and Unix)
                 # os.replace() is atomic on both platforms
                 os.replace(temp_filepath, filepath)
+                if self._durable:
+                    self._fsync_dir()
 
                 logger.debug(f"Cache written: {key}")
 
             except Exception as e:
                 logger.error(f"Failed to write cache {key}: {e}")
 
-                # Clean up temp file if it exists
-                if os.path.exists(temp_filepath):
+                # Clean up the temp file, but only one this call created
+                if temp_filepath is not None:
                     try:
                         os.remove(temp_filepath)
-                    except:
+                    except OSError:
                         pass  # Best effort cleanup
 
                 raise  # Re-raise the original exception
 
+    def _fsync_dir(self) -> None:
+        """
+        Flush the cache directory entry so a replaced file survives power loss.
+        """
+        if self._dir_fd is not None:
+            os.fsync(self._dir_fd)
+            return
+        try:
+            dir_fd = os.open(self.cache_location, os.O_RDONLY)
+        except OSError:
+            return  # Directories can't be opened for sync on this platform
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _write_named_tmpfile(self, filepath: str, data: bytes) -> str:
+        """
+        Write data to a newly created, uniquely named temp file.
+
+        The name is claimed with O_EXCL, so a temp file left by a crashed
+        writer, or being written by another process, is never reused.
+
+        Args:
+            filepath: Destination file path the temp name is derived from
+            data: Bytes to write
+
+        Returns:
+            Path of the written temp file
+        """
+        while True:
+            temp_filepath = _temp_path(filepath)
+            try:
+                fd = os.open(temp_filepath, _NAMED_TMP_FLAGS, 0o666)
+            except FileExistsError:
+                continue
+            break
+
+        try:
+            with open(fd, 'wb', buffering=0) as f:
+                _write_all(f, data)
+                if self._durable:
+                    os.fsync(fd)
+        except BaseException:
+            try:
+                os.remove(temp_filepath)
+            except OSError:
+                pass
+            raise
+        return temp_filepath
+
+    def _write_unnamed_tmpfile(self, filepath: str, data: bytes) -> Optional[str]:
+        """
+        Write data to an O_TMPFILE inode and link it in under a unique temp name.
+
+        The file only gets a name once its contents are complete; if the
+        process dies before that the kernel reclaims the inode. Linux only.
+
+        Args:
+            filepath: Destination file path the temp name is derived from
+            data: Bytes to write
+
+        Returns:
+            Path of the linked temp file, or None if O_TMPFILE is unavailable
+            here (caller should fall back to a named temp file)
+        """
+        if not self._tmpfile_supported:
+            return None
+        try:
+            fd = os.open(self.cache_location, _O_TMPFILE_FLAGS, 0o666)
+        except OSError:
+            # Kernel or filesystem without O_TMPFILE support
+            self._tmpfile_supported = False
+            return None
+
+        with open(fd, 'wb', buffering=0) as f:
+            _write_all(f, data)
+            if self._durable:
+                os.fsync(fd)
+            proc_path = f'/proc/self/fd/{fd}'
+            while True:
+                temp_filepath = _temp_path(filepath)
+                try:
+                    self._link_tmpfile(proc_path, os.path.basename(temp_filepath))
+                except FileExistsError:
+                    # Name taken (e.g. left by a crashed writer); try the next
+                    continue
+                except OSError:
+                    # No /proc, or linking through it is not permitted
+                    self._tmpfile_supported = False
+                    return None
+                return temp_filepath
+
+    def _link_tmpfile(self, proc_path: str, temp_name: str) -> None:
+        """
+        Give an O_TMPFILE inode a name in the cache directory.
+
+        Passing a dir fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which
+        follows the /proc/self/fd magic link to the unnamed inode.
+        """
+        os.link(proc_path, temp_name, dst_dir_fd=self._dir_fd, follow_symlinks=True)
+
+    def _writer_loop(self) -> None:
+        """
+        Background loop that flushes coalesced writes after a short debounce.
+        """
+        while not self._stop_event.is_set():
+            self._write_event.wait()
+            # Let a burst of set() calls land before draining; close() cuts
+            # the debounce short
+            self._stop_event.wait(self.write_behind)
+            self._write_event.clear()
+            self.flush()
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all pending values to disk.
+
+        Failed writes are logged and dropped; the previous file is left intact.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return
+                self._inflight, self._pending = self._pending, {}
+
+            for key, value in self._inflight.items():
+                try:
+                    self._write(key, value)
+                except Exception:
+                    pass  # Already logged by _write
+
+            with self._pending_lock:
+                self._inflight = {}
+
+    def close(self) -> None:
+        """
+        Flush pending writes and stop the background writer.
+        """
+        if self._writer is None:
+            self.flush()
+            return
+        self._stop_event.set()
+        self._write_event.set()
+        self._writer.join()
+        self._writer = None
+
     def exists(self, key: str) -> bool:
         """
         Check if cache key exists.
@@ -234,6 +822,11 @@ class PickleCacheRepository(CacheRepository):
         Returns:
             True if cache file exists, False otherwise
         """
+        if self.write_behind:
+            with self._pending_lock:
+                if key in self._pending or key in self._inflight:
+                    return True
+
         filepath = self._get_filepath(key)
         return os.path.exists(filepath)
 
@@ -244,17 +837,21 @@ class PickleCacheRepository(CacheRepository):
         Args:
             key: Cache key identifier
         """
-        filepath = self._get_filepath(key)
+        if self.write_behind:
+            # Wait out any in-progress batch so it can't recreate the file
+            with self._flush_lock:
+                with self._pending_lock:
+                    self._pending.pop(key, None)
 
-        if not os.path.exists(filepath):
-            return
+        filepath = self._get_filepath(key)
+        self._forget(key)
 
         with self._file_lock(filepath):
             try:
                 os.remove(filepath)
                 logger.debug(f"Cache deleted: {key}")
             except FileNotFoundError:
-                # Race condition: another process deleted it
+                # Never existed, or another process deleted it
                 # This is fine, the file is gone
                 pass
             except Exception as e:
@@ -267,11 +864,19 @@ class PickleCacheRepository(CacheRepository):
 
         WARNING: This removes ALL .pkl files in the cache directory.
         """
-        for filename in os.listdir(self.cache_location):
-            if filename.endswith('.pkl'):
-                filepath = os.path.join(self.cache_location, filename)
-                try:
-                    os.remove(filepath)
-                    logger.debug(f"Cleared cache file: {filename}")
-                except Exception as e:
-                    logger.warning(f"Failed to clear cache file {filename}: {e}")
+        if self.write_behind:
+            with self._flush_lock:
+                with self._pending_lock:
+                    self._pending.clear()
+        with self._mem_lock:
+            self._mem.clear()
+        # scandir entries carry the name, path and file type from the
+        # directory read, so no extra stat/path join is needed per file
+        with os.scandir(self.cache_location) as entries:
+            for entry in entries:
+                if entry.name.endswith('.pkl') and entry.is_file(follow_symlinks=False):
+                    try:
+                        os.remove(entry.path)
+                        logger.debug(f"Cleared cache file: {entry.name}")
+                    except OSError as e:
+                        logger.warning(f"Failed to clear cache file {entry.name}: {e}")
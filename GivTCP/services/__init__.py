@@ -13,6 +13,11 @@ Services:
 - BatteryMetricsService: Battery-specific calculations and flows
 - ControlModeService: Mode detection and configuration
 - DataProcessingService: Post-processing, validation, and caching
+
+Calculation services return plain dicts keyed by the published register
+names. These dicts are merged straight into the output tree, pickled into
+the cache stack and read back by key by the legacy modules, so they are the
+serialization format rather than an intermediate record.
 """
 
 # Services will be imported here as they're created
@@ -13,11 +13,102 @@ This service handles battery-specific calculations:
 """
 
 import logging
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# Battery pack voltage used to convert the nominal capacity register (Ah)
+_PACK_VOLTAGE = 51.2
+
+
+@lru_cache(maxsize=8)
+def capacity_kwh(nominal_capacity) -> float:
+    """
+    Convert the nominal battery capacity register to kWh.
+
+    The register only changes when batteries are added or removed, so the
+    converted value is memoized per raw value.
+
+    Args:
+        nominal_capacity: battery_nominal_capacity register value (Ah)
+
+    Returns:
+        float: Battery capacity in kWh
+    """
+    # Same operation order as the published values have always used, so
+    # results match bit for bit
+    return (nominal_capacity * _PACK_VOLTAGE) / 1000
+
+
+# Per-battery output keys and the battery attributes they are read from,
+# after Battery_Serial_Number and Battery_SOC: scalar hardware fields, cell
+# voltages (16 cells) and cell temperatures (4 sensors). DETAIL_GETTER
+# fetches every attribute in one call, in DETAIL_KEYS order.
+SCALAR_FIELDS = (
+    ('Battery_Capacity', 'battery_full_capacity'),
+    ('Battery_Design_Capacity', 'battery_design_capacity'),
+    ('Battery_Remaining_Capacity', 'battery_remaining_capacity'),
+    ('Battery_Firmware_Version', 'bms_firmware_version'),
+    ('Battery_Cells', 'battery_num_cells'),
+    ('Battery_Cycles', 'battery_num_cycles'),
+    ('Battery_USB_present', 'usb_inserted'),
+    ('Battery_Temperature', 'temp_bms_mos'),
+    ('Battery_Voltage', 'v_battery_cells_sum'),
+)
+SCALAR_KEYS = tuple(key for key, _ in SCALAR_FIELDS)
+CELL_V_KEYS = tuple(f'Battery_Cell_{i}_Voltage' for i in range(1, 17))
+CELL_T_KEYS = tuple(f'Battery_Cell_{i}_Temperature' for i in range(1, 5))
+
+DETAIL_KEYS = SCALAR_KEYS + CELL_V_KEYS + CELL_T_KEYS
+DETAIL_GETTER = attrgetter(
+    *(attr for _, attr in SCALAR_FIELDS),
+    *(f'v_battery_cell_{i:02d}' for i in range(1, 17)),
+    *(f'temp_battery_cells_{i}' for i in range(1, 5))
+)
+
+# Output keys of calculate_battery_flows, in the order _flows_core returns them
+FLOW_KEYS = (
+    'Solar_to_House', 'Solar_to_Battery', 'Solar_to_Grid', 'Battery_to_House',
+    'Grid_to_Battery', 'Grid_to_House', 'Battery_to_Grid'
+)
+
+
+def _flows_core(pv, load, exp, imp, chg, dis):
+    """
+    Battery routing arithmetic behind calculate_battery_flows.
+
+    Kept free of logging and dict handling.
+
+    Returns:
+        tuple: Flow values in FLOW_KEYS order
+    """
+    # Local aliases: LOAD_FAST instead of a globals/builtins lookup per call
+    _min = min
+    _max = max
+
+    # Solar flows: house first, then battery, remainder to grid
+    if pv > 0:
+        s2h = _min(pv, load)
+        s2b = _max((pv - s2h) - exp, 0)
+        s2g = _max(pv - s2h - s2b, 0)
+    else:
+        s2h = s2b = s2g = 0
+
+    b2h = _max(dis - exp, 0)
+
+    if imp > 0:
+        g2b = chg - _max(pv - load, 0)
+        g2h = _max(imp - chg, 0)
+    else:
+        g2b = g2h = 0
+
+    b2g = _max(dis - b2h, 0) if exp > 0 else 0
+
+    return s2h, s2b, s2g, b2h, g2b, g2h, b2g
+
 
 class BatteryMetricsService:
     """
@@ -59,35 +150,40 @@ class BatteryMetricsService:
             return {}
 
         logger.info("Getting SOC")
-        metrics = {}
 
-        # SOC calculation with fallback
-        soc = self._calculate_soc(inverter.battery_percent, previous_soc)
-        metrics['SOC'] = soc
+        # SOC calculation with fallback if the inverter reports zero
+        soc = inverter.battery_percent
+        if soc == 0:
+            if previous_soc is not None:
+                logger.error("Battery SOC reported as: %s%% so using previous value", soc)
+                soc = previous_soc
+            else:
+                logger.error("Battery SOC reported as: %s%% and no previous value so setting to 1%%", soc)
+                soc = 1
 
         # SOC in kWh
-        battery_capacity_kwh = (inverter.battery_nominal_capacity * 51.2) / 1000
-        metrics['SOC_kWh'] = (soc * battery_capacity_kwh) / 100
+        battery_capacity_kwh = capacity_kwh(inverter.battery_nominal_capacity)
 
         # Battery energy (today)
-        metrics['Battery_Charge_Energy_Today_kWh'] = inverter.e_battery_charge_day
-        metrics['Battery_Discharge_Energy_Today_kWh'] = inverter.e_battery_discharge_day
-        metrics['Battery_Throughput_Today_kWh'] = (
-            inverter.e_battery_charge_day + inverter.e_battery_discharge_day
-        )
+        charge_today = inverter.e_battery_charge_day
+        discharge_today = inverter.e_battery_discharge_day
 
-        # Battery energy (total) - handle firmware version differences
-        metrics['Battery_Throughput_Total_kWh'] = inverter.e_battery_throughput_total
-
-        # Battery power decomposition
+        # Battery power decomposition: positive = discharging, negative = charging
         battery_power = inverter.p_battery
-        charge_power, discharge_power = self._decompose_battery_power(battery_power)
-
-        metrics['Battery_Power'] = battery_power
-        metrics['Charge_Power'] = charge_power
-        metrics['Discharge_Power'] = discharge_power
-
-        return metrics
+        charge_power = -battery_power if battery_power < 0 else 0
+        discharge_power = battery_power if battery_power > 0 else 0
+
+        return {
+            'SOC': soc,
+            'SOC_kWh': (soc * battery_capacity_kwh) / 100,
+            'Battery_Charge_Energy_Today_kWh': charge_today,
+            'Battery_Discharge_Energy_Today_kWh': discharge_today,
+            'Battery_Throughput_Today_kWh': charge_today + discharge_today,
+            'Battery_Throughput_Total_kWh': inverter.e_battery_throughput_total,
+            'Battery_Power': battery_power,
+            'Charge_Power': charge_power,
+            'Discharge_Power': discharge_power
+        }
 
     def get_battery_energy_totals(
         self,
@@ -107,19 +203,18 @@ class BatteryMetricsService:
         Returns:
             dict: Total energy values
         """
-        if (inverter.e_battery_charge_total == 0 and
-            inverter.e_battery_discharge_total == 0 and
-            len(batteries) > 0):
+        charge_total = inverter.e_battery_charge_total
+        discharge_total = inverter.e_battery_discharge_total
+
+        if charge_total == 0 and discharge_total == 0 and batteries:
             # Use backup registers for some firmware versions
-            return {
-                'Battery_Charge_Energy_Total_kWh': batteries[0].e_battery_charge_total_2,
-                'Battery_Discharge_Energy_Total_kWh': batteries[0].e_battery_discharge_total_2
-            }
-        else:
-            return {
-                'Battery_Charge_Energy_Total_kWh': inverter.e_battery_charge_total,
-                'Battery_Discharge_Energy_Total_kWh': inverter.e_battery_discharge_total
-            }
+            charge_total = batteries[0].e_battery_charge_total_2
+            discharge_total = batteries[0].e_battery_discharge_total_2
+
+        return {
+            'Battery_Charge_Energy_Total_kWh': charge_total,
+            'Battery_Discharge_Energy_Total_kWh': discharge_total
+        }
 
     def calculate_battery_flows(
         self,
@@ -150,48 +245,18 @@ class BatteryMetricsService:
         Returns:
             dict: Refined power flows
         """
-        logger.info("Getting Solar to H/B/G Power Flows")
-        flows = {}
-
-        # Solar flows
-        if pv_power > 0:
-            # Solar to House: minimum of PV and load
-            s2h = min(pv_power, load_power)
-            flows['Solar_to_House'] = s2h
-
-            # Solar to Battery: remaining PV after house and export
-            s2b = max((pv_power - s2h) - export_power, 0)
-            flows['Solar_to_Battery'] = s2b
-
-            # Solar to Grid: remaining PV after house and battery
-            flows['Solar_to_Grid'] = max(pv_power - s2h - s2b, 0)
-        else:
-            flows['Solar_to_House'] = 0
-            flows['Solar_to_Battery'] = 0
-            flows['Solar_to_Grid'] = 0
-
-        # Battery to House
-        logger.info("Getting Battery to House Power Flow")
-        b2h = max(discharge_power - export_power, 0)
-        flows['Battery_to_House'] = b2h
-
-        # Grid to Battery/House
-        logger.info("Getting Grid to Battery/House Power Flow")
-        if import_power > 0:
-            flows['Grid_to_Battery'] = charge_power - max(pv_power - load_power, 0)
-            flows['Grid_to_House'] = max(import_power - charge_power, 0)
-        else:
-            flows['Grid_to_Battery'] = 0
-            flows['Grid_to_House'] = 0
-
-        # Battery to Grid
-        logger.info("Getting Battery to Grid Power Flow")
-        if export_power > 0:
-            flows['Battery_to_Grid'] = max(discharge_power - b2h, 0)
-        else:
-            flows['Battery_to_Grid'] = 0
-
-        return flows
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Getting Solar to H/B/G Power Flows")
+            logger.info("Getting Battery to House Power Flow")
+            logger.info("Getting Grid to Battery/House Power Flow")
+            logger.info("Getting Battery to Grid Power Flow")
+
+        values = _flows_core(
+            pv_power, load_power, export_power,
+            import_power, charge_power, discharge_power
+        )
+
+        return dict(zip(FLOW_KEYS, values))
 
     def get_battery_details(
         self,
@@ -223,9 +288,11 @@ class BatteryMetricsService:
         """
         logger.info("Getting Battery Details")
         battery_details = {}
+        log_info = logger.isEnabledFor(logging.INFO)
 
         for b in batteries:
-            logger.info("Building battery output: ")
+            if log_info:
+                logger.info("Building battery output: ")
             battery = {}
 
             battery['Battery_Serial_Number'] = b.battery_serial_number
@@ -238,45 +305,12 @@ class BatteryMetricsService:
             else:
                 battery['Battery_SOC'] = 1
 
-            # Capacity and status
-            battery['Battery_Capacity'] = b.battery_full_capacity
-            battery['Battery_Design_Capacity'] = b.battery_design_capacity
-            battery['Battery_Remaining_Capacity'] = b.battery_remaining_capacity
-            battery['Battery_Firmware_Version'] = b.bms_firmware_version
-            battery['Battery_Cells'] = b.battery_num_cells
-            battery['Battery_Cycles'] = b.battery_num_cycles
-            battery['Battery_USB_present'] = b.usb_inserted
-
-            # Temperature and voltage
-            battery['Battery_Temperature'] = b.temp_bms_mos
-            battery['Battery_Voltage'] = b.v_battery_cells_sum
-
-            # Cell voltages (16 cells)
-            battery['Battery_Cell_1_Voltage'] = b.v_battery_cell_01
-            battery['Battery_Cell_2_Voltage'] = b.v_battery_cell_02
-            battery['Battery_Cell_3_Voltage'] = b.v_battery_cell_03
-            battery['Battery_Cell_4_Voltage'] = b.v_battery_cell_04
-            battery['Battery_Cell_5_Voltage'] = b.v_battery_cell_05
-            battery['Battery_Cell_6_Voltage'] = b.v_battery_cell_06
-            battery['Battery_Cell_7_Voltage'] = b.v_battery_cell_07
-            battery['Battery_Cell_8_Voltage'] = b.v_battery_cell_08
-            battery['Battery_Cell_9_Voltage'] = b.v_battery_cell_09
-            battery['Battery_Cell_10_Voltage'] = b.v_battery_cell_10
-            battery['Battery_Cell_11_Voltage'] = b.v_battery_cell_11
-            battery['Battery_Cell_12_Voltage'] = b.v_battery_cell_12
-            battery['Battery_Cell_13_Voltage'] = b.v_battery_cell_13
-            battery['Battery_Cell_14_Voltage'] = b.v_battery_cell_14
-            battery['Battery_Cell_15_Voltage'] = b.v_battery_cell_15
-            battery['Battery_Cell_16_Voltage'] = b.v_battery_cell_16
-
-            # Cell temperatures (4 sensors)
-            battery['Battery_Cell_1_Temperature'] = b.temp_battery_cells_1
-            battery['Battery_Cell_2_Temperature'] = b.temp_battery_cells_2
-            battery['Battery_Cell_3_Temperature'] = b.temp_battery_cells_3
-            battery['Battery_Cell_4_Temperature'] = b.temp_battery_cells_4
+            # Hardware fields, cell voltages and cell temperatures
+            battery.update(zip(DETAIL_KEYS, DETAIL_GETTER(b)))
 
             battery_details[b.battery_serial_number] = battery
-            logger.info(f"Battery {b.battery_serial_number} added")
+            if log_info:
+                logger.info("Battery %s added", b.battery_serial_number)
 
         return battery_details
 
@@ -293,56 +327,5 @@ class BatteryMetricsService:
         Raises:
             ValueError: If all values are zero
         """
-        checksum = sum(energy_total.values())
-        if checksum == 0:
+        if not any(energy_total.values()):
             raise ValueError("All zeros returned by Invertor, skipping update")
-
-    def _calculate_soc(
-        self,
-        current_soc: float,
-        previous_soc: Optional[float] = None
-    ) -> float:
-        """
-        Calculate SOC with fallback if current value is zero.
-
-        Args:
-            current_soc: Current SOC from inverter
-            previous_soc: Previous SOC for fallback
-
-        Returns:
-            float: Validated SOC value
-        """
-        if current_soc != 0:
-            return current_soc
-        elif previous_soc is not None:
-            logger.error(f"Battery SOC reported as: {current_soc}% so using previous value")
-            return previous_soc
-        else:
-            logger.error(f"Battery SOC reported as: {current_soc}% and no previous value so setting to 1%")
-            return 1
-
-    def _decompose_battery_power(self, battery_power: float) -> tuple[float, float]:
-        """
-        Decompose battery power into charge and discharge components.
-
-        Battery power convention:
-        - Positive value = discharging
-        - Negative value = charging
-        - Zero = no battery flow
-
-        Args:
-            battery_power: Net battery power
-
-        Returns:
-            tuple: (charge_power, discharge_power) both as positive values
-        """
-        if battery_power >= 0:
-            # Discharging
-            discharge_power = abs(battery_power)
-            charge_power = 0
-        else:
-            # Charging
-            discharge_power = 0
-            charge_power = abs(battery_power)
-
-        return charge_power, discharge_power
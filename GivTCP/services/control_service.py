@@ -13,9 +13,12 @@ This service handles control mode detection and system configuration:
 """
 
 import logging
+import time
 from os.path import exists
 from typing import Dict, Optional
 
+from .battery_service import capacity_kwh
+
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +32,40 @@ class ControlModeService:
     and inverter hardware details.
     """
 
+    # Status flag files: (filename, output key, log label)
+    STATUS_FLAGS = (
+        (".FCRunning", 'Force_Charge', "Force Charge"),
+        (".FERunning", 'Force_Export', "Force_Export"),
+        (".tpcRunning", 'Temp_Pause_Charge', "Temp Pause Charge"),
+        (".tpdRunning", 'Temp_Pause_Discharge', "Temp_Pause_Discharge"),
+    )
+
+    # (battery_power_mode, enable_discharge, battery_soc_reserve) -> mode name
+    MODE_TABLE = {
+        (1, False, 4): "Eco",
+        (1, False, 100): "Eco (Paused)",
+        (1, True, 100): "Timed Demand",
+        (0, True, 100): "Timed Export",
+    }
+
+    # Seconds a status flag lookup is reused before the files are checked again
+    FLAG_CACHE_TTL = 2.0
+
+    def __init__(self):
+        """Initialize control mode service."""
+        self._flag_cache: Optional[Dict[str, str]] = None
+        self._flag_cache_ts: float = 0.0
+        self._timeslot_key: Optional[tuple] = None
+        self._timeslots: Dict[str, str] = {}
+
     def detect_control_mode(self, inverter, cache_data: Optional[dict] = None) -> Dict[str, str]:
         """
         Determine current system operating mode and control settings.
 
         Args:
             inverter: Inverter object with control register data
-            cache_data: Optional previous cache data for temp pause status
+            cache_data: Previous cache data. Unused: Temp_Pause_* always
+                reflect the status flag files. Kept for caller compatibility.
 
         Returns:
             dict: Control mode data including:
@@ -77,8 +107,9 @@ class ControlModeService:
         mode = self._classify_mode(inverter)
         logger.info(f"Mode is: {mode}")
 
-        # Build control mode dictionary
-        controlmode = {
+        # Temp_Pause_* come from the status flag files written by write.py;
+        # they are authoritative, so cached values are never consulted
+        return {
             'Mode': mode,
             'Battery_Power_Reserve': battery_reserve,
             'Target_SOC': target_soc,
@@ -86,24 +117,10 @@ class ControlModeService:
             'Enable_Discharge_Schedule': discharge_schedule,
             'Enable_Discharge': discharge_enable,
             'Battery_Charge_Rate': charge_rate,
-            'Battery_Discharge_Rate': discharge_rate
+            'Battery_Discharge_Rate': discharge_rate,
+            **self._check_status_flags()
         }
 
-        # Get temp pause status from cache if available
-        if cache_data and not isinstance(cache_data, int):
-            if "Temp_Pause_Discharge" in cache_data.get("Control", {}):
-                controlmode['Temp_Pause_Discharge'] = cache_data["Control"]["Temp_Pause_Discharge"]
-            if "Temp_Pause_Charge" in cache_data.get("Control", {}):
-                controlmode['Temp_Pause_Charge'] = cache_data["Control"]["Temp_Pause_Charge"]
-        else:
-            controlmode['Temp_Pause_Charge'] = "Normal"
-            controlmode['Temp_Pause_Discharge'] = "Normal"
-
-        # Check status flags
-        controlmode.update(self._check_status_flags())
-
-        return controlmode
-
     def get_timeslots(self, inverter) -> Dict[str, str]:
         """
         Extract charge and discharge timeslot configuration.
@@ -120,18 +137,28 @@ class ControlModeService:
         """
         logger.info("Getting TimeSlot data")
 
-        timeslots = {
-            'Discharge_start_time_slot_1': inverter.discharge_slot_1[0].isoformat(),
-            'Discharge_end_time_slot_1': inverter.discharge_slot_1[1].isoformat(),
-            'Discharge_start_time_slot_2': inverter.discharge_slot_2[0].isoformat(),
-            'Discharge_end_time_slot_2': inverter.discharge_slot_2[1].isoformat(),
-            'Charge_start_time_slot_1': inverter.charge_slot_1[0].isoformat(),
-            'Charge_end_time_slot_1': inverter.charge_slot_1[1].isoformat(),
-            'Charge_start_time_slot_2': inverter.charge_slot_2[0].isoformat(),
-            'Charge_end_time_slot_2': inverter.charge_slot_2[1].isoformat()
-        }
-
-        return timeslots
+        discharge_1 = inverter.discharge_slot_1
+        discharge_2 = inverter.discharge_slot_2
+        charge_1 = inverter.charge_slot_1
+        charge_2 = inverter.charge_slot_2
+
+        # Slots are user configuration and rarely change, so reuse the
+        # formatted strings until any slot differs from the previous poll
+        key = (discharge_1, discharge_2, charge_1, charge_2)
+        if key != self._timeslot_key:
+            self._timeslots = {
+                'Discharge_start_time_slot_1': discharge_1[0].isoformat(),
+                'Discharge_end_time_slot_1': discharge_1[1].isoformat(),
+                'Discharge_start_time_slot_2': discharge_2[0].isoformat(),
+                'Discharge_end_time_slot_2': discharge_2[1].isoformat(),
+                'Charge_start_time_slot_1': charge_1[0].isoformat(),
+                'Charge_end_time_slot_1': charge_1[1].isoformat(),
+                'Charge_start_time_slot_2': charge_2[0].isoformat(),
+                'Charge_end_time_slot_2': charge_2[1].isoformat()
+            }
+            self._timeslot_key = key
+
+        return dict(self._timeslots)
 
     def get_inverter_details(self, inverter) -> Dict[str, any]:
         """
@@ -159,7 +186,7 @@ class ControlModeService:
         meter_type = "EM115" if inverter.meter_type == 1 else "EM418"
 
         # Battery capacity calculation
-        battery_capacity = (inverter.battery_nominal_capacity * 51.2) / 1000
+        battery_capacity = capacity_kwh(inverter.battery_nominal_capacity)
 
         invertor = {
             'Battery_Type': battery_type,
@@ -190,28 +217,10 @@ class ControlModeService:
         Returns:
             str: Mode name
         """
-        if (inverter.battery_power_mode == 1 and
-            inverter.enable_discharge == False and
-            inverter.battery_soc_reserve == 4):
-            return "Eco"
-
-        elif (inverter.battery_power_mode == 1 and
-              inverter.enable_discharge == False and
-              inverter.battery_soc_reserve == 100):
-            return "Eco (Paused)"
-
-        elif (inverter.battery_power_mode == 1 and
-              inverter.enable_discharge == True and
-              inverter.battery_soc_reserve == 100):
-            return "Timed Demand"
-
-        elif (inverter.battery_power_mode == 0 and
-              inverter.enable_discharge == True and
-              inverter.battery_soc_reserve == 100):
-            return "Timed Export"
-
-        else:
-            return "Unknown"
+        return self.MODE_TABLE.get(
+            (inverter.battery_power_mode, inverter.enable_discharge, inverter.battery_soc_reserve),
+            "Unknown"
+        )
 
     def _check_status_flags(self) -> Dict[str, str]:
         """
@@ -223,33 +232,25 @@ class ControlModeService:
         - .tpcRunning: Temp Pause Charge running
         - .tpdRunning: Temp Pause Discharge running
 
+        The result is reused for FLAG_CACHE_TTL seconds, so flags created or
+        removed by other processes are picked up on a later poll rather than
+        costing four stat calls on every one.
+
         Returns:
             dict: Status flag values ("Running" or "Normal")
         """
-        flags = {}
-
-        if exists(".FCRunning"):
-            logger.info("Force Charge is Running")
-            flags['Force_Charge'] = "Running"
-        else:
-            flags['Force_Charge'] = "Normal"
-
-        if exists(".FERunning"):
-            logger.info("Force_Export is Running")
-            flags['Force_Export'] = "Running"
-        else:
-            flags['Force_Export'] = "Normal"
+        now = time.monotonic()
+        if self._flag_cache is not None and now - self._flag_cache_ts < self.FLAG_CACHE_TTL:
+            return dict(self._flag_cache)
 
-        if exists(".tpcRunning"):
-            logger.info("Temp Pause Charge is Running")
-            flags['Temp_Pause_Charge'] = "Running"
-        else:
-            flags['Temp_Pause_Charge'] = "Normal"
-
-        if exists(".tpdRunning"):
-            logger.info("Temp_Pause_Discharge is Running")
-            flags['Temp_Pause_Discharge'] = "Running"
-        else:
-            flags['Temp_Pause_Discharge'] = "Normal"
-
-        return flags
+        flags = {}
+        for filename, key, label in self.STATUS_FLAGS:
+            if exists(filename):
+                logger.info(f"{label} is Running")
+                flags[key] = "Running"
+            else:
+                flags[key] = "Normal"
+
+        self._flag_cache = flags
+        self._flag_cache_ts = now
+        return dict(flags)
@@ -11,12 +11,24 @@ This service handles all energy-related calculations including:
 """
 
 import logging
+from operator import attrgetter
 from givenergy_modbus.model.inverter import Model
 from typing import Optional
 
 
 logger = logging.getLogger(__name__)
 
+# Inverter registers read by calculate_total_energy / calculate_daily_energy,
+# fetched in a single attrgetter call each
+_TOTAL_GETTER = attrgetter(
+    'e_grid_out_total', 'e_grid_in_total', 'e_inverter_out_total',
+    'e_pv_total', 'e_inverter_in_total', 'inverter_model'
+)
+_DAILY_GETTER = attrgetter(
+    'e_pv1_day', 'e_pv2_day', 'e_grid_in_day', 'e_grid_out_day',
+    'e_inverter_in_day', 'e_inverter_out_day', 'inverter_model'
+)
+
 
 class EnergyCalculationService:
     """
@@ -45,32 +57,27 @@ class EnergyCalculationService:
         """
         logger.info("Calculating total energy data")
 
-        total = {
-            'Export_Energy_Total_kWh': inverter.e_grid_out_total,
-            'Import_Energy_Total_kWh': inverter.e_grid_in_total,
-            'Invertor_Energy_Total_kWh': inverter.e_inverter_out_total,
-            'PV_Energy_Total_kWh': inverter.e_pv_total,
-            'AC_Charge_Energy_Total_kWh': inverter.e_inverter_in_total
-        }
+        export, imported, inverter_out, pv, ac_charge, model = _TOTAL_GETTER(inverter)
 
         # Model-dependent load calculation
-        total['Load_Energy_Total_kWh'] = self._calculate_load_energy(
-            inverter_energy=total['Invertor_Energy_Total_kWh'],
-            ac_charge_energy=total['AC_Charge_Energy_Total_kWh'],
-            export_energy=total['Export_Energy_Total_kWh'],
-            import_energy=total['Import_Energy_Total_kWh'],
-            pv_energy=total['PV_Energy_Total_kWh'],
-            model=inverter.inverter_model
+        load = self._calculate_load_energy(
+            inverter_energy=inverter_out,
+            ac_charge_energy=ac_charge,
+            export_energy=export,
+            import_energy=imported,
+            pv_energy=pv,
+            is_hybrid=model == Model.Hybrid
         )
 
-        # Self-consumption calculation
-        total['Self_Consumption_Energy_Total_kWh'] = round(
-            total['PV_Energy_Total_kWh'], 2
-        ) - round(
-            total['Export_Energy_Total_kWh'], 2
-        )
-
-        return total
+        return {
+            'Export_Energy_Total_kWh': export,
+            'Import_Energy_Total_kWh': imported,
+            'Invertor_Energy_Total_kWh': inverter_out,
+            'PV_Energy_Total_kWh': pv,
+            'AC_Charge_Energy_Total_kWh': ac_charge,
+            'Load_Energy_Total_kWh': load,
+            'Self_Consumption_Energy_Total_kWh': round(pv - export, 2)
+        }
 
     def calculate_daily_energy(self, inverter) -> dict:
         """
@@ -91,32 +98,28 @@ class EnergyCalculationService:
         """
         logger.info("Calculating today's energy data")
 
-        daily = {
-            'PV_Energy_Today_kWh': inverter.e_pv1_day + inverter.e_pv2_day,
-            'Import_Energy_Today_kWh': inverter.e_grid_in_day,
-            'Export_Energy_Today_kWh': inverter.e_grid_out_day,
-            'AC_Charge_Energy_Today_kWh': inverter.e_inverter_in_day,
-            'Invertor_Energy_Today_kWh': inverter.e_inverter_out_day
-        }
-
-        # Self-consumption calculation
-        daily['Self_Consumption_Energy_Today_kWh'] = round(
-            daily['PV_Energy_Today_kWh'], 2
-        ) - round(
-            daily['Export_Energy_Today_kWh'], 2
-        )
+        pv1, pv2, imported, export, ac_charge, inverter_out, model = _DAILY_GETTER(inverter)
+        pv = pv1 + pv2
 
         # Model-dependent load calculation
-        daily['Load_Energy_Today_kWh'] = self._calculate_load_energy(
-            inverter_energy=daily['Invertor_Energy_Today_kWh'],
-            ac_charge_energy=daily['AC_Charge_Energy_Today_kWh'],
-            export_energy=daily['Export_Energy_Today_kWh'],
-            import_energy=daily['Import_Energy_Today_kWh'],
-            pv_energy=daily['PV_Energy_Today_kWh'],
-            model=inverter.inverter_model
+        load = self._calculate_load_energy(
+            inverter_energy=inverter_out,
+            ac_charge_energy=ac_charge,
+            export_energy=export,
+            import_energy=imported,
+            pv_energy=pv,
+            is_hybrid=model == Model.Hybrid
         )
 
-        return daily
+        return {
+            'PV_Energy_Today_kWh': pv,
+            'Import_Energy_Today_kWh': imported,
+            'Export_Energy_Today_kWh': export,
+            'AC_Charge_Energy_Today_kWh': ac_charge,
+            'Invertor_Energy_Today_kWh': inverter_out,
+            'Self_Consumption_Energy_Today_kWh': round(pv - export, 2),
+            'Load_Energy_Today_kWh': load
+        }
 
     def _calculate_load_energy(
         self,
@@ -125,7 +128,7 @@ class EnergyCalculationService:
         export_energy: float,
         import_energy: float,
         pv_energy: float,
-        model: Model
+        is_hybrid: bool
     ) -> float:
         """
         Calculate load energy with model-specific logic.
@@ -142,7 +145,8 @@ class EnergyCalculationService:
             export_energy: Energy exported to grid
             import_energy: Energy imported from grid
             pv_energy: Solar PV energy generated
-            model: Inverter model (Hybrid or non-Hybrid)
+            is_hybrid: True for Hybrid inverters (callers compare the model
+                once and pass the result)
 
         Returns:
             float: Calculated load energy in kWh (rounded to 2 decimal places)
@@ -150,7 +154,7 @@ class EnergyCalculationService:
         net_inverter = inverter_energy - ac_charge_energy
         net_grid = export_energy - import_energy
 
-        if model == Model.Hybrid:
+        if is_hybrid:
             # Hybrid: Load = (Inverter - AC_Charge) - (Export - Import)
             load = net_inverter - net_grid
         else:
@@ -170,9 +174,9 @@ class EnergyCalculationService:
         Returns:
             bool: True if midnight reset detected, False otherwise
         """
-        checksum = sum(daily_energy.values())
-
-        if checksum == 0 and system_time.hour == 0 and system_time.minute == 0:
+        # Cheap time checks first: the values only need scanning at 00:00
+        if (system_time.minute == 0 and system_time.hour == 0 and
+                not any(daily_energy.values())):
             logger.info("Energy Today is Zero and it's midnight - midnight reset detected")
             return True
 
@@ -13,14 +13,113 @@ This service handles inverter communication with proper locking:
 
 import datetime
 import logging
+import os
 import pickle
+import sys
+import time
+import weakref
+from contextlib import contextmanager
 from os.path import exists
 from typing import Optional, NamedTuple
 
+from .write_behind import CoalescingWriter
+
+# flock is POSIX only; elsewhere the legacy touch-file lock is used
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 logger = logging.getLogger(__name__)
 
 
+class LockHeldError(RuntimeError):
+    """Raised when another reader holds the inverter lock file."""
+
+
+@contextmanager
+def flock_held(fd: int):
+    """
+    Hold an exclusive, non-blocking flock on an open lock file descriptor.
+
+    The lock is released on exit, even on error, and by the kernel if the
+    process dies, so the lock file existing does not mean the lock is held.
+
+    Args:
+        fd: Descriptor of the lock file
+
+    Raises:
+        LockHeldError: If another reader holds the lock
+    """
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        logger.error("Lockfile set so aborting getData")
+        raise LockHeldError("Lockfile set so aborting getData") from None
+
+    logger.debug("Lock file acquired")
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        logger.debug("Lock file released")
+
+
+@contextmanager
+def file_lock(lock_file_path: str):
+    """
+    Open a lock file and hold flock_held() on it for the duration.
+
+    For callers without a long-lived descriptor, such as the legacy getData
+    path, so they exclude each other and the service on the same file.
+    Without fcntl (non-POSIX platforms) the file's existence is the lock,
+    as before flock was used.
+
+    Args:
+        lock_file_path: Path to the lock file (created if missing)
+
+    Raises:
+        LockHeldError: If another reader holds the lock
+    """
+    if fcntl is None:
+        with _touch_file_lock(lock_file_path):
+            yield
+        return
+
+    fd = os.open(lock_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        with flock_held(fd):
+            yield
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _touch_file_lock(lock_file_path: str):
+    """
+    Legacy lock: abort if the lock file exists, else create it and remove it on exit.
+
+    Args:
+        lock_file_path: Path to the lock file
+
+    Raises:
+        LockHeldError: If the lock file is already present
+    """
+    if exists(lock_file_path):
+        logger.error("Lockfile set so aborting getData")
+        raise LockHeldError("Lockfile set so aborting getData")
+
+    open(lock_file_path, 'w').close()
+    try:
+        yield
+    finally:
+        try:
+            os.remove(lock_file_path)
+        except FileNotFoundError:
+            pass
+
+
 class InverterReadResult(NamedTuple):
     """Result of reading data from inverter."""
     inverter: object
@@ -49,7 +148,8 @@ class HardwareCommunicationService:
         inverter_ip: str = "",
         instance_id: str = "1",
         use_new_locks: bool = False,
-        use_new_cache: bool = False
+        use_new_cache: bool = False,
+        write_behind: bool = False
     ):
         """
         Initialize hardware communication service.
@@ -64,6 +164,9 @@ class HardwareCommunicationService:
             instance_id: GivTCP instance identifier
             use_new_locks: Use new lock manager instead of file locks
             use_new_cache: Use new cache repository instead of pickle
+            write_behind: Store the last update timestamp on a background
+                thread, coalescing stores that arrive while one is pending
+                (default: False). Only use in a long-lived process.
         """
         self.giv_client = giv_client
         self.lock_manager = lock_manager
@@ -72,9 +175,26 @@ class HardwareCommunicationService:
         self.last_update_path = last_update_path
         self.inverter_ip = inverter_ip
         self.instance_id = instance_id
+        # Cache key built once rather than concatenated on every read
+        self._last_update_key = sys.intern('lastUpdate_' + instance_id)
         self.use_new_locks = use_new_locks
         self.use_new_cache = use_new_cache
 
+        # Timestamp tracking: the previous read is kept in-process and the
+        # stored timestamp is only read once, to seed the first delta
+        self._last_mono_ns: Optional[int] = None
+        self._last_update_iso: Optional[str] = None
+        self._timestamp_writer: Optional[CoalescingWriter] = None
+        if write_behind:
+            self._timestamp_writer = CoalescingWriter(self._store_last_update,
+                                                      name='last-update-save')
+
+        # Legacy locking: flock on a descriptor held for the service lifetime
+        self._lock_fd: Optional[int] = None
+        if not use_new_locks and lock_file_path and fcntl is not None:
+            self._lock_fd = os.open(lock_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+            weakref.finalize(self, os.close, self._lock_fd)
+
     def read_inverter_data(self, fullrefresh: bool) -> InverterReadResult:
         """
         Read data from inverter with proper locking.
@@ -112,39 +232,23 @@ class HardwareCommunicationService:
         Raises:
             TimeoutError: If lock acquisition times out
         """
+        logger.debug("Connecting to: %s", self.inverter_ip)
         try:
+            # Only the inverter read needs the lock
             with self.lock_manager.acquire('inverter_read', timeout=30.0):
-                logger.info("Lock acquired for inverter read")
-                logger.info(f"Connecting to: {self.inverter_ip}")
-
-                # Get data from inverter
+                logger.debug("Lock acquired for inverter read")
                 plant = self.giv_client.getData(fullrefresh)
-                inverter = plant.inverter
-                batteries = plant.batteries
-
-                # Lock will be released automatically when context exits
-                logger.info("Lock released for inverter read")
-
-                # Calculate timestamp and time since last update
-                timestamp, time_since_last = self._update_timestamp()
-
-                logger.info("Invertor connection successful, registers retrieved")
-
-                return InverterReadResult(
-                    inverter=inverter,
-                    batteries=batteries,
-                    timestamp=timestamp,
-                    time_since_last=time_since_last,
-                    status="online"
-                )
+            logger.debug("Lock released for inverter read")
 
         except TimeoutError:
             logger.error("Timeout waiting for inverter read lock")
             raise
 
+        return self._build_result(plant)
+
     def _read_with_file_lock(self, fullrefresh: bool) -> InverterReadResult:
         """
-        Read inverter data using legacy file-based locking.
+        Read inverter data using legacy file-based locking (flock on lock_file_path).
 
         Args:
             fullrefresh: Whether to perform full register refresh
@@ -153,83 +257,118 @@ class HardwareCommunicationService:
             InverterReadResult with data
 
         Raises:
-            RuntimeError: If lockfile is already set
+            LockHeldError: If another reader holds the lock file
             Exception: If inverter communication fails
         """
-        # Check for existing lock
-        if exists(self.lock_file_path):
-            logger.error("Lockfile set so aborting getData")
-            raise RuntimeError("Lockfile set so aborting getData")
+        logger.debug("Connecting to: %s", self.inverter_ip)
+        with self._flock():
+            plant = self.giv_client.getData(fullrefresh)
 
-        # Create lock file
-        logger.info("setting lock file")
-        logger.info(f"Connecting to: {self.inverter_ip}")
-        open(self.lock_file_path, 'w').close()
+        return self._build_result(plant)
 
-        try:
-            # Get data from inverter
-            plant = self.giv_client.getData(fullrefresh)
-            inverter = plant.inverter
-            batteries = plant.batteries
+    def _build_result(self, plant) -> InverterReadResult:
+        """
+        Wrap a completed read, after the inverter lock has been released.
+
+        Timestamp bookkeeping may touch the cache or the pickle file, so it is
+        kept out of the critical section.
+
+        Args:
+            plant: Plant object returned by the client
+
+        Returns:
+            InverterReadResult with data
+        """
+        timestamp, time_since_last = self._update_timestamp()
 
-            # Calculate timestamp and time since last update
-            timestamp, time_since_last = self._update_timestamp()
+        logger.info("Invertor connection successful, registers retrieved")
 
-            logger.info("Invertor connection successful, registers retrieved")
+        return InverterReadResult(
+            inverter=plant.inverter,
+            batteries=plant.batteries,
+            timestamp=timestamp,
+            time_since_last=time_since_last,
+            status="online"
+        )
+
+    def _flock(self):
+        """
+        Hold the legacy flock on the descriptor kept open for the service lifetime.
 
-            return InverterReadResult(
-                inverter=inverter,
-                batteries=batteries,
-                timestamp=timestamp,
-                time_since_last=time_since_last,
-                status="online"
-            )
+        Falls back to the touch-file lock where fcntl is unavailable.
 
-        finally:
-            # Always remove lock file, even on error
-            logger.info("Removing lock file")
-            if exists(self.lock_file_path):
-                import os
-                os.remove(self.lock_file_path)
+        Raises:
+            LockHeldError: If another reader holds the lock
+        """
+        if self._lock_fd is None:
+            return _touch_file_lock(self.lock_file_path)
+        return flock_held(self._lock_fd)
 
     def _update_timestamp(self) -> tuple[str, float]:
         """
         Update timestamp and calculate time since last update.
 
-        Uses cache repository (new) or pickle file (legacy) to track timestamps.
+        The delta comes from time.monotonic_ns() after the first read; the
+        stored timestamp (cache repository or legacy pickle file) is only
+        parsed to seed the first delta. The stored timestamp is updated on
+        every read so other processes see it; with write_behind the store
+        runs on a background thread.
 
         Returns:
             tuple: (current_timestamp_iso, time_since_last_seconds)
         """
-        # Get current timestamp
-        current_time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc)
+        current_time = datetime.datetime.now(datetime.timezone.utc)
         timestamp = current_time.isoformat()
+        now_ns = time.monotonic_ns()
 
         # Calculate time since last update
         time_since_last = 0.0
-
-        if self.use_new_cache:
-            # New: Use cache repository
-            previous_update = self.cache_repo.get('lastUpdate_' + self.instance_id)
+        if self._last_mono_ns is not None:
+            time_since_last = (now_ns - self._last_mono_ns) / 1e9
+        else:
+            previous_update = self._load_last_update()
             if previous_update:
                 previous_time = datetime.datetime.fromisoformat(previous_update)
-                timediff = current_time - previous_time
-                time_since_last = (timediff.seconds * 1000000 + timediff.microseconds) / 1000000
+                time_since_last = (current_time - previous_time).total_seconds()
 
-            # Save new timestamp
-            self.cache_repo.set('lastUpdate_' + self.instance_id, timestamp)
+        self._last_mono_ns = now_ns
+        self._last_update_iso = timestamp
 
+        if self._timestamp_writer is not None:
+            self._timestamp_writer.submit(timestamp)
         else:
-            # Legacy: Use pickle file
-            if exists(self.last_update_path):
-                with open(self.last_update_path, 'rb') as inp:
-                    previous_update = pickle.load(inp)
-                previous_time = datetime.datetime.fromisoformat(previous_update)
-                timediff = current_time - previous_time
-                time_since_last = (timediff.seconds * 1000000 + timediff.microseconds) / 1000000
+            self._store_last_update(timestamp)
+
+        return timestamp, time_since_last
+
+    def _load_last_update(self) -> Optional[str]:
+        """Return the stored last update timestamp, or None if there is none."""
+        if self.use_new_cache:
+            return self.cache_repo.get(self._last_update_key)
+        if exists(self.last_update_path):
+            with open(self.last_update_path, 'rb') as inp:
+                return pickle.load(inp)
+        return None
+
+    def _store_last_update(self, timestamp: str) -> None:
+        """
+        Store a last update timestamp in the cache repository or pickle file.
 
-            # Save new timestamp
+        Args:
+            timestamp: ISO timestamp of the read
+        """
+        if self.use_new_cache:
+            self.cache_repo.set(self._last_update_key, timestamp)
+            return
+        try:
             with open(self.last_update_path, 'wb') as outp:
                 pickle.dump(timestamp, outp, pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.error(f"Error saving last update time: {e}")
 
-        return timestamp, time_since_last
+    def flush(self) -> None:
+        """
+        Block until any write-behind timestamp store has completed.
+        """
+        if self._timestamp_writer is not None:
+            self._timestamp_writer.flush()
@@ -12,11 +12,18 @@ This service handles all power-related calculations including:
 """
 
 import logging
+from operator import attrgetter
 from typing import Dict
 
 
 logger = logging.getLogger(__name__)
 
+# Inverter registers read by calculate_power_stats, fetched in one call
+_STATS_GETTER = attrgetter(
+    'p_pv1', 'p_pv2', 'v_pv1', 'v_pv2', 'i_pv1', 'i_pv2',
+    'p_grid_out', 'p_eps_backup', 'p_inverter_out', 'p_load_demand'
+)
+
 
 class PowerCalculationService:
     """
@@ -50,14 +57,34 @@ class PowerCalculationService:
                 - Load_Power
                 - Self_Consumption_Power
         """
-        logger.info("Calculating power statistics")
-        power = {}
+        return self.calculate_power_stats_and_flows(inverter)[0]
+
+    def calculate_power_stats_and_flows(
+        self, inverter
+    ) -> tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Calculate power measurements and solar/grid flows in one pass.
+
+        Same results as calculate_power_stats followed by
+        calculate_power_flows, but the flows are taken from the validated
+        locals instead of being looked up again in the power dict.
+
+        Args:
+            inverter: Inverter object with instantaneous power data
+
+        Returns:
+            tuple: (power, flows) as returned by calculate_power_stats and
+                calculate_power_flows
+        """
+        (pv_power_1, pv_power_2, v_pv1, v_pv2, i_pv1, i_pv2,
+         grid_power, eps_power, inverter_power, load_power) = _STATS_GETTER(inverter)
 
-        # PV Power
-        logger.info("Getting PV Power")
-        pv_power_1 = inverter.p_pv1
-        pv_power_2 = inverter.p_pv2
         pv_power = pv_power_1 + pv_power_2
+        # Grid power: negative = importing, positive = exporting
+        import_power = -grid_power if grid_power < 0 else 0
+        export_power = grid_power if grid_power > 0 else 0
+
+        power = {}
 
         # Validate PV power (reject if > threshold)
         if pv_power < self.PV_POWER_MAX:
@@ -66,49 +93,46 @@ class PowerCalculationService:
             power['PV_Power'] = pv_power
 
         # PV voltage and current (always include)
-        power['PV_Voltage_String_1'] = inverter.v_pv1
-        power['PV_Voltage_String_2'] = inverter.v_pv2
-        power['PV_Current_String_1'] = inverter.i_pv1 * 10
-        power['PV_Current_String_2'] = inverter.i_pv2 * 10
-
-        # Grid Power - decompose into import/export
-        logger.info("Getting Grid Power")
-        grid_power = inverter.p_grid_out
-        import_power, export_power = self._decompose_grid_power(grid_power)
+        power['PV_Voltage_String_1'] = v_pv1
+        power['PV_Voltage_String_2'] = v_pv2
+        power['PV_Current_String_1'] = i_pv1 * 10
+        power['PV_Current_String_2'] = i_pv2 * 10
 
         power['Grid_Power'] = grid_power
         power['Import_Power'] = import_power
         power['Export_Power'] = export_power
 
         # EPS (backup) Power
-        logger.info("Getting EPS Power")
-        power['EPS_Power'] = inverter.p_eps_backup
+        power['EPS_Power'] = eps_power
 
-        # Invertor Power with validation
-        logger.info("Getting Inverter Power")
-        inverter_power = inverter.p_inverter_out
-
-        # Only include if within valid range
+        # Only include inverter power if within valid range
         if self.INVERTER_POWER_MIN <= inverter_power <= self.INVERTER_POWER_MAX:
             power['Invertor_Power'] = inverter_power
 
         # AC Charge Power (negative inverter power)
-        if inverter_power < 0:
-            power['AC_Charge_Power'] = abs(inverter_power)
-        else:
-            power['AC_Charge_Power'] = 0
+        power['AC_Charge_Power'] = -inverter_power if inverter_power < 0 else 0
 
         # Load Power with validation
-        logger.info("Getting Load Power")
-        load_power = inverter.p_load_demand
         if load_power < self.LOAD_POWER_MAX:
             power['Load_Power'] = load_power
 
-        # Self Consumption
-        logger.info("Getting Self Consumption Power")
         power['Self_Consumption_Power'] = max(load_power - import_power, 0)
 
-        return power
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Power stats: PV {pv_power}W, grid {grid_power}W, "
+                         f"inverter {inverter_power}W, load {load_power}W")
+
+        # Flows only see values that passed validation (rejected count as 0)
+        flow_pv = pv_power if pv_power < self.PV_POWER_MAX else 0
+        flow_load = load_power if load_power < self.LOAD_POWER_MAX else 0
+        has_pv = flow_pv > 0
+        flows = {
+            'Solar_to_House': min(flow_pv, flow_load) if has_pv else 0,
+            'Solar_to_Grid': export_power if has_pv else 0,
+            'Grid_to_House': import_power if import_power > 0 else 0,
+        }
+
+        return power, flows
 
     def calculate_power_flows(self, power: Dict[str, float]) -> Dict[str, float]:
         """
@@ -126,7 +150,6 @@ class PowerCalculationService:
                 - Solar_to_Grid
                 - Grid_to_House
         """
-        logger.info("Calculating power flows")
         flows = {}
 
         pv_power = power.get('PV_Power', 0)
@@ -135,7 +158,6 @@ class PowerCalculationService:
         import_power = power.get('Import_Power', 0)
 
         # Solar to House/Grid flows
-        logger.info("Getting Solar to House/Grid Power Flows")
         if pv_power > 0:
             # Solar to House: minimum of PV production and load demand
             flows['Solar_to_House'] = min(pv_power, load_power)
@@ -145,40 +167,9 @@ class PowerCalculationService:
             flows['Solar_to_Grid'] = 0
 
         # Grid to House flow
-        logger.info("Getting Grid to House Power Flow")
         if import_power > 0:
             flows['Grid_to_House'] = import_power
         else:
             flows['Grid_to_House'] = 0
 
         return flows
-
-    def _decompose_grid_power(self, grid_power: float) -> tuple[float, float]:
-        """
-        Decompose grid power into import and export components.
-
-        Grid power convention:
-        - Negative value = importing from grid
-        - Positive value = exporting to grid
-        - Zero = no grid flow
-
-        Args:
-            grid_power: Net grid power (negative = import, positive = export)
-
-        Returns:
-            tuple: (import_power, export_power) both as positive values
-        """
-        if grid_power < 0:
-            # Importing from grid
-            import_power = abs(grid_power)
-            export_power = 0
-        elif grid_power > 0:
-            # Exporting to grid
-            import_power = 0
-            export_power = abs(grid_power)
-        else:
-            # No grid flow
-            import_power = 0
-            export_power = 0
-
-        return import_power, export_power
@@ -8,17 +8,24 @@ This service handles post-processing, validation, and caching:
 - Battery value tracking
 - Data cleansing/smoothing against historical data
 - Output consistency checks (compare keys with previous)
-- Cache stack management (5-element FIFO)
-- Cache persistence
+- Cache stack management (5-element FIFO deque)
+- Cache persistence (atomic, optionally write-behind)
 """
 
 import logging
+import os
 import pickle
-from typing import Dict, List, Optional, Callable
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Callable
 
+from .write_behind import CoalescingWriter
 
 logger = logging.getLogger(__name__)
 
+# Number of previous outputs kept for comparison/smoothing
+CACHE_STACK_SIZE = 5
+
 
 class DataProcessingService:
     """
@@ -37,7 +44,8 @@ class DataProcessingService:
         rate_calc_func: Optional[Callable] = None,
         battery_value_func: Optional[Callable] = None,
         data_cleansing_func: Optional[Callable] = None,
-        dict_to_list_func: Optional[Callable] = None
+        dict_to_list_func: Optional[Callable] = None,
+        write_behind: bool = False
     ):
         """
         Initialize data processing service.
@@ -50,21 +58,34 @@ class DataProcessingService:
             rate_calc_func: Function for rate calculations
             battery_value_func: Function for battery value calculations
             data_cleansing_func: Function for data smoothing
-            dict_to_list_func: Function for flattening dict to list
+            dict_to_list_func: Function returning (or yielding) all keys of a
+                nested dict, e.g. utils.iter_keys
+            write_behind: Save on a background thread, coalescing saves that
+                arrive while one is pending (default: False). Only use in a
+                long-lived process; pending writes are lost on os._exit().
         """
+
         self.cache_repo = cache_repo
         self.cache_file_path = cache_file_path
         self.instance_id = instance_id
+        # Cache key built once rather than concatenated on every load/save
+        self._reg_cache_key = sys.intern('regCache_' + instance_id)
         self.use_new_cache = use_new_cache
         self.rate_calc_func = rate_calc_func
         self.battery_value_func = battery_value_func
         self.data_cleansing_func = data_cleansing_func
         self.dict_to_list_func = dict_to_list_func
+        self.write_behind = write_behind
+
+        self._save_writer: Optional[CoalescingWriter] = None
+        if write_behind:
+            self._save_writer = CoalescingWriter(self._write_cache_stack,
+                                                 name='regcache-save')
 
     def process_output(
         self,
         multi_output: Dict,
-        cache_stack: List[Dict]
+        cache_stack: Deque[Dict]
     ) -> Dict:
         """
         Apply post-processing pipeline to multi_output.
@@ -78,8 +99,9 @@ class DataProcessingService:
         """
         logger.info("Processing output data")
 
-        # Get previous output (most recent from cache stack)
-        multi_output_old = cache_stack[4] if cache_stack and len(cache_stack) > 4 else multi_output
+        # Previous output (most recent entry of the cache stack), resolved once
+        has_previous = cache_stack is not None and len(cache_stack) > 4
+        multi_output_old = cache_stack[4] if has_previous else multi_output
 
         # 1. Rate calculations
         if self.rate_calc_func:
@@ -89,79 +111,126 @@ class DataProcessingService:
         if self.battery_value_func:
             multi_output = self.battery_value_func(multi_output)
 
-        # 3. Data cleansing/smoothing
-        if self.data_cleansing_func and cache_stack and len(cache_stack) > 4:
-            multi_output = self.data_cleansing_func(multi_output, cache_stack[4])
+        if has_previous:
+            # 3. Data cleansing/smoothing
+            if self.data_cleansing_func:
+                multi_output = self.data_cleansing_func(multi_output, multi_output_old)
 
-        # 4. Consistency check - warn if keys are missing
-        if cache_stack and len(cache_stack) > 4:
-            self._check_consistency(multi_output, cache_stack[4])
+            # 4. Consistency check - warn if keys are missing
+            self._check_consistency(multi_output, multi_output_old)
 
         return multi_output
 
     def update_cache_stack(
         self,
-        cache_stack: List[Dict],
+        cache_stack: Deque[Dict],
         new_data: Dict
-    ) -> List[Dict]:
+    ) -> Deque[Dict]:
         """
         Update cache stack with new data (FIFO).
 
-        Maintains a 5-element cache stack by removing oldest and adding newest.
+        The stack is a deque(maxlen=5), so appending the newest entry drops
+        the oldest. A plain list is converted first.
 
         Args:
             cache_stack: Current cache stack
             new_data: New data to add
 
         Returns:
-            list: Updated cache stack
+            deque: Updated cache stack
         """
-        # Remove oldest element
-        if len(cache_stack) >= 5:
-            cache_stack.pop(0)
+        if not isinstance(cache_stack, deque):
+            cache_stack = deque(cache_stack, maxlen=CACHE_STACK_SIZE)
 
-        # Add new data
         cache_stack.append(new_data)
 
         return cache_stack
 
-    def save_cache_stack(self, cache_stack: List[Dict]) -> None:
+    def save_cache_stack(self, cache_stack: Deque[Dict]) -> None:
         """
-        Persist cache stack to storage (repository or pickle).
+        Persist cache stack to storage (repository or cache file).
+
+        The stack is stored as a plain list so legacy readers of the cache
+        can still unpickle it. With write_behind the entries must not be
+        mutated after the call, as they are serialized later.
 
         Args:
             cache_stack: Cache stack to save
         """
+        cache_stack = list(cache_stack)
+
+        if not self.write_behind:
+            self._write_cache_stack(cache_stack)
+            return
+
+        # Only the newest stack matters, so a save already queued just
+        # picks up this one instead of queueing another write
+        self._save_writer.submit(cache_stack)
+
+    def flush(self) -> None:
+        """
+        Block until any write-behind save has completed.
+        """
+        if self._save_writer is not None:
+            self._save_writer.flush()
+
+    def _write_cache_stack(self, cache_stack: List) -> None:
+        """
+        Store an already-prepared cache stack.
+
+        The cache file is replaced atomically, so a crash mid-write leaves
+        the previous stack intact instead of a truncated file.
+
+        Args:
+            cache_stack: Cache stack as a plain list
+        """
         if self.use_new_cache:
             # New: Use cache repository
-            self.cache_repo.set('regCache_' + self.instance_id, cache_stack)
-        else:
-            # Legacy: Use pickle file
-            with open(self.cache_file_path, 'wb') as outp:
-                pickle.dump(cache_stack, outp, pickle.HIGHEST_PROTOCOL)
+            self.cache_repo.set(self._reg_cache_key, cache_stack)
+            return
 
-    def load_cache_stack(self) -> List[Dict]:
+        # Legacy: Use cache file
+        data = pickle.dumps(cache_stack, pickle.HIGHEST_PROTOCOL)
+
+        temp_path = self.cache_file_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as outp:
+                outp.write(data)
+            os.replace(temp_path, self.cache_file_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def load_cache_stack(self) -> Deque[Dict]:
         """
-        Load cache stack from storage (repository or pickle).
+        Load cache stack from storage (repository or cache file).
+
+        Waits for a pending write-behind save first, so the previous poll's
+        stack is always seen.
 
         Returns:
-            list: Loaded cache stack, or empty 5-element list if not found
+            deque: Loaded cache stack (maxlen 5), or five zeros if not found
         """
+        self.flush()
+
         if self.use_new_cache:
             # New: Use cache repository
-            cache_stack = self.cache_repo.get('regCache_' + self.instance_id)
+            cache_stack = self.cache_repo.get(self._reg_cache_key)
             if cache_stack:
-                return cache_stack
+                return deque(cache_stack, maxlen=CACHE_STACK_SIZE)
         else:
-            # Legacy: Use pickle file
+            # Legacy: Use cache file
             try:
                 with open(self.cache_file_path, 'rb') as inp:
-                    return pickle.load(inp)
+                    return deque(pickle.load(inp), maxlen=CACHE_STACK_SIZE)
             except (FileNotFoundError, EOFError):
                 pass
 
         # Return empty stack if not found
-        return [0, 0, 0, 0, 0]
+        return deque([0] * CACHE_STACK_SIZE, maxlen=CACHE_STACK_SIZE)
 
     def _check_consistency(
         self,
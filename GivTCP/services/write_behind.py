@@ -0,0 +1,91 @@
+"""
+Write-behind helper for persisting service state off the polling thread.
+
+Phase 3 Refactoring: Extract Service Layer
+
+Provides a single background writer with a one-slot "latest value wins"
+buffer: a value submitted while an earlier one is still waiting replaces it,
+so a slow disk never builds a backlog of stale writes.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Marks an empty pending slot (None is a valid value to write)
+_EMPTY = object()
+
+
+class CoalescingWriter:
+    """
+    Run a write function on one background thread, keeping only the newest value.
+
+    Writes happen in submission order on a single worker, so the file or key
+    being written never sees concurrent writers. The worker thread is joined
+    at interpreter exit, but not on os._exit(), so only use this in a
+    long-lived process.
+
+    Example:
+        writer = CoalescingWriter(save_to_disk, name='regcache-save')
+        writer.submit(stack)   # Returns immediately
+        writer.flush()         # Block until everything submitted is written
+    """
+
+    def __init__(self, write: Callable[[Any], None], name: str = 'write-behind'):
+        """
+        Initialize the writer.
+
+        Args:
+            write: Function called on the worker thread with each value
+            name: Thread name prefix, also used in error logs
+        """
+        self._write = write
+        self.name = name
+        self._lock = Lock()
+        self._pending: Any = _EMPTY
+        self._future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pending(self) -> bool:
+        """True if a submitted value is still waiting for the worker."""
+        return self._pending is not _EMPTY
+
+    def submit(self, value: Any) -> None:
+        """
+        Queue a value to be written, replacing one that hasn't been picked up yet.
+
+        The value must not be mutated afterwards, as it is written later.
+
+        Args:
+            value: Value passed to the write function
+        """
+        with self._lock:
+            queued = self._pending is not _EMPTY
+            self._pending = value
+            if not queued:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1,
+                                                        thread_name_prefix=self.name)
+                self._future = self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        """Write the latest pending value (worker thread)."""
+        with self._lock:
+            value, self._pending = self._pending, _EMPTY
+        try:
+            self._write(value)
+        except Exception as e:
+            logger.error(f"{self.name}: write failed: {e}")
+
+    def flush(self) -> None:
+        """
+        Block until every submitted value has been written.
+        """
+        future = self._future
+        if future is not None:
+            future.result()
@@ -13,11 +13,59 @@ Critical tests:
 - Fallback values for zero SOC
 """
 
+import copy
 import pytest
-from unittest.mock import Mock
+from types import SimpleNamespace
 from GivTCP.services import BatteryMetricsService
 
 
+# Plain namespaces rather than Mock: attribute writes and reads skip Mock's
+# child bookkeeping, and each template is built once at import
+_BASE_INVERTER = SimpleNamespace(
+    battery_percent=75,
+    battery_nominal_capacity=100,
+    e_battery_charge_day=5.2,
+    e_battery_discharge_day=8.3,
+    e_battery_throughput_total=1250.5,
+    e_battery_charge_total=650.0,
+    e_battery_discharge_total=600.5,
+    p_battery=1500,  # Discharging
+)
+
+_CELL_VOLTAGES = (3.20, 3.21, 3.19, 3.20, 3.20, 3.21, 3.20, 3.19,
+                  3.20, 3.21, 3.20, 3.20, 3.19, 3.21, 3.20, 3.20)
+_CELL_TEMPERATURES = (24.5, 25.0, 24.8, 25.2)
+
+
+def _battery(cell_voltage=None, cell_temperature=None, **fields):
+    """Build a battery namespace; cell values default to _CELL_* per cell."""
+    return SimpleNamespace(
+        **{f'v_battery_cell_{i:02d}': cell_voltage if cell_voltage is not None else v
+           for i, v in enumerate(_CELL_VOLTAGES, start=1)},
+        **{f'temp_battery_cells_{i}': cell_temperature if cell_temperature is not None else t
+           for i, t in enumerate(_CELL_TEMPERATURES, start=1)},
+        **fields
+    )
+
+
+_BASE_BATTERY = _battery(
+    battery_serial_number="BX1234567890",
+    battery_soc=75,
+    battery_full_capacity=160,
+    battery_design_capacity=170,
+    battery_remaining_capacity=120,
+    bms_firmware_version="3001",
+    battery_num_cells=16,
+    battery_num_cycles=245,
+    usb_inserted=False,
+    temp_bms_mos=25.5,
+    v_battery_cells_sum=51.2,
+    # Backup energy registers
+    e_battery_charge_total_2=0,
+    e_battery_discharge_total_2=0,
+)
+
+
 class TestBatteryMetricsService:
     """Tests for BatteryMetricsService."""
 
@@ -28,59 +76,13 @@ class TestBatteryMetricsService:
 
     @pytest.fixture
     def mock_inverter_with_battery(self):
-        """Create a mock inverter with battery data."""
-        inverter = Mock()
-        inverter.battery_percent = 75
-        inverter.battery_nominal_capacity = 100
-        inverter.e_battery_charge_day = 5.2
-        inverter.e_battery_discharge_day = 8.3
-        inverter.e_battery_throughput_total = 1250.5
-        inverter.e_battery_charge_total = 650.0
-        inverter.e_battery_discharge_total = 600.5
-        inverter.p_battery = 1500  # Discharging
-        return inverter
+        """Create an inverter stand-in with battery data (fresh copy per test)."""
+        return copy.copy(_BASE_INVERTER)
 
-    @pytest.fixture
-    def mock_battery(self):
-        """Create a mock battery object with detailed data."""
-        battery = Mock()
-        battery.battery_serial_number = "BX1234567890"
-        battery.battery_soc = 75
-        battery.battery_full_capacity = 160
-        battery.battery_design_capacity = 170
-        battery.battery_remaining_capacity = 120
-        battery.bms_firmware_version = "3001"
-        battery.battery_num_cells = 16
-        battery.battery_num_cycles = 245
-        battery.usb_inserted = False
-        battery.temp_bms_mos = 25.5
-        battery.v_battery_cells_sum = 51.2
-        # Cell voltages
-        battery.v_battery_cell_01 = 3.20
-        battery.v_battery_cell_02 = 3.21
-        battery.v_battery_cell_03 = 3.19
-        battery.v_battery_cell_04 = 3.20
-        battery.v_battery_cell_05 = 3.20
-        battery.v_battery_cell_06 = 3.21
-        battery.v_battery_cell_07 = 3.20
-        battery.v_battery_cell_08 = 3.19
-        battery.v_battery_cell_09 = 3.20
-        battery.v_battery_cell_10 = 3.21
-        battery.v_battery_cell_11 = 3.20
-        battery.v_battery_cell_12 = 3.20
-        battery.v_battery_cell_13 = 3.19
-        battery.v_battery_cell_14 = 3.21
-        battery.v_battery_cell_15 = 3.20
-        battery.v_battery_cell_16 = 3.20
-        # Cell temperatures
-        battery.temp_battery_cells_1 = 24.5
-        battery.temp_battery_cells_2 = 25.0
-        battery.temp_battery_cells_3 = 24.8
-        battery.temp_battery_cells_4 = 25.2
-        # Backup energy registers
-        battery.e_battery_charge_total_2 = 0
-        battery.e_battery_discharge_total_2 = 0
-        return battery
+    @pytest.fixture(scope="module")
+    def mock_battery_template(self):
+        """Shared battery stand-in with detailed data; copy it before mutating."""
+        return _BASE_BATTERY
 
     def test_calculate_battery_metrics_typical(self, service, mock_inverter_with_battery):
         """Test battery metrics calculation with typical values."""
@@ -134,44 +136,25 @@ class TestBatteryMetricsService:
         # Should default to 1%
         assert result['SOC'] == 1
 
-    def test_battery_power_discharging(self, service, mock_inverter_with_battery):
-        """Test battery power decomposition when discharging (positive)."""
-        mock_inverter_with_battery.p_battery = 2500
-
-        result = service.calculate_battery_metrics(
-            mock_inverter_with_battery,
-            num_batteries=1
-        )
-
-        assert result['Battery_Power'] == 2500
-        assert result['Discharge_Power'] == 2500
-        assert result['Charge_Power'] == 0
-
-    def test_battery_power_charging(self, service, mock_inverter_with_battery):
-        """Test battery power decomposition when charging (negative)."""
-        mock_inverter_with_battery.p_battery = -3000
-
-        result = service.calculate_battery_metrics(
-            mock_inverter_with_battery,
-            num_batteries=1
-        )
-
-        assert result['Battery_Power'] == -3000
-        assert result['Charge_Power'] == 3000
-        assert result['Discharge_Power'] == 0
-
-    def test_battery_power_zero(self, service, mock_inverter_with_battery):
-        """Test battery power when zero (no flow)."""
-        mock_inverter_with_battery.p_battery = 0
+    @pytest.mark.parametrize("p_battery, charge, discharge", [
+        (2500, 0, 2500),    # Discharging (positive)
+        (-3000, 3000, 0),   # Charging (negative)
+        (0, 0, 0),          # No flow
+    ])
+    def test_battery_power_split(
+        self, service, mock_inverter_with_battery, p_battery, charge, discharge
+    ):
+        """Test battery power is split into charge and discharge power."""
+        mock_inverter_with_battery.p_battery = p_battery
 
         result = service.calculate_battery_metrics(
             mock_inverter_with_battery,
             num_batteries=1
         )
 
-        assert result['Battery_Power'] == 0
-        assert result['Charge_Power'] == 0
-        assert result['Discharge_Power'] == 0
+        assert result['Battery_Power'] == p_battery
+        assert result['Charge_Power'] == charge
+        assert result['Discharge_Power'] == discharge
 
     def test_get_battery_energy_totals_normal_registers(self, service, mock_inverter_with_battery):
         """Test battery energy totals from normal registers."""
@@ -187,9 +170,10 @@ class TestBatteryMetricsService:
         mock_inverter_with_battery.e_battery_charge_total = 0
         mock_inverter_with_battery.e_battery_discharge_total = 0
 
-        mock_battery = Mock()
-        mock_battery.e_battery_charge_total_2 = 450.0
-        mock_battery.e_battery_discharge_total_2 = 420.0
+        mock_battery = SimpleNamespace(
+            e_battery_charge_total_2=450.0,
+            e_battery_discharge_total_2=420.0
+        )
         batteries = [mock_battery]
 
         result = service.get_battery_energy_totals(mock_inverter_with_battery, batteries)
@@ -296,9 +280,9 @@ class TestBatteryMetricsService:
         assert flows['Grid_to_Battery'] == 0
         assert flows['Grid_to_House'] == 0
 
-    def test_get_battery_details(self, service, mock_battery):
+    def test_get_battery_details(self, service, mock_battery_template):
         """Test extraction of battery details."""
-        batteries = [mock_battery]
+        batteries = [mock_battery_template]
 
         result = service.get_battery_details(batteries)
 
@@ -317,9 +301,9 @@ class TestBatteryMetricsService:
         assert battery['Battery_Temperature'] == 25.5
         assert battery['Battery_Voltage'] == 51.2
 
-    def test_get_battery_details_cell_voltages(self, service, mock_battery):
+    def test_get_battery_details_cell_voltages(self, service, mock_battery_template):
         """Test extraction of all 16 cell voltages."""
-        batteries = [mock_battery]
+        batteries = [mock_battery_template]
 
         result = service.get_battery_details(batteries)
         battery = result["BX1234567890"]
@@ -330,9 +314,9 @@ class TestBatteryMetricsService:
             assert key in battery
             assert isinstance(battery[key], float)
 
-    def test_get_battery_details_cell_temperatures(self, service, mock_battery):
+    def test_get_battery_details_cell_temperatures(self, service, mock_battery_template):
         """Test extraction of all 4 cell temperatures."""
-        batteries = [mock_battery]
+        batteries = [mock_battery_template]
 
         result = service.get_battery_details(batteries)
         battery = result["BX1234567890"]
@@ -344,41 +328,22 @@ class TestBatteryMetricsService:
 
     def test_get_battery_details_multiple_batteries(self, service):
         """Test extraction of details for multiple batteries."""
-        battery1 = Mock()
-        battery1.battery_serial_number = "BX1111111111"
-        battery1.battery_soc = 70
-        battery1.battery_full_capacity = 160
-        battery1.battery_design_capacity = 170
-        battery1.battery_remaining_capacity = 112
-        battery1.bms_firmware_version = "3001"
-        battery1.battery_num_cells = 16
-        battery1.battery_num_cycles = 100
-        battery1.usb_inserted = False
-        battery1.temp_bms_mos = 25.0
-        battery1.v_battery_cells_sum = 51.0
-        # Add cell voltages and temps
-        for i in range(1, 17):
-            setattr(battery1, f'v_battery_cell_{i:02d}', 3.2)
-        for i in range(1, 5):
-            setattr(battery1, f'temp_battery_cells_{i}', 25.0)
-
-        battery2 = Mock()
-        battery2.battery_serial_number = "BX2222222222"
-        battery2.battery_soc = 75
-        battery2.battery_full_capacity = 160
-        battery2.battery_design_capacity = 170
-        battery2.battery_remaining_capacity = 120
-        battery2.bms_firmware_version = "3001"
-        battery2.battery_num_cells = 16
-        battery2.battery_num_cycles = 120
-        battery2.usb_inserted = False
-        battery2.temp_bms_mos = 26.0
-        battery2.v_battery_cells_sum = 51.5
-        # Add cell voltages and temps
-        for i in range(1, 17):
-            setattr(battery2, f'v_battery_cell_{i:02d}', 3.21)
-        for i in range(1, 5):
-            setattr(battery2, f'temp_battery_cells_{i}', 26.0)
+        battery1 = _battery(
+            cell_voltage=3.2, cell_temperature=25.0,
+            battery_serial_number="BX1111111111", battery_soc=70,
+            battery_full_capacity=160, battery_design_capacity=170,
+            battery_remaining_capacity=112, bms_firmware_version="3001",
+            battery_num_cells=16, battery_num_cycles=100, usb_inserted=False,
+            temp_bms_mos=25.0, v_battery_cells_sum=51.0,
+        )
+        battery2 = _battery(
+            cell_voltage=3.21, cell_temperature=26.0,
+            battery_serial_number="BX2222222222", battery_soc=75,
+            battery_full_capacity=160, battery_design_capacity=170,
+            battery_remaining_capacity=120, bms_firmware_version="3001",
+            battery_num_cells=16, battery_num_cycles=120, usb_inserted=False,
+            temp_bms_mos=26.0, v_battery_cells_sum=51.5,
+        )
 
         batteries = [battery1, battery2]
 
@@ -390,8 +355,9 @@ class TestBatteryMetricsService:
         assert result["BX1111111111"]['Battery_SOC'] == 70
         assert result["BX2222222222"]['Battery_SOC'] == 75
 
-    def test_get_battery_details_zero_soc_with_previous(self, service, mock_battery):
+    def test_get_battery_details_zero_soc_with_previous(self, service, mock_battery_template):
         """Test battery details with zero SOC uses previous value."""
+        mock_battery = copy.copy(mock_battery_template)
         mock_battery.battery_soc = 0
         batteries = [mock_battery]
 
@@ -407,8 +373,9 @@ class TestBatteryMetricsService:
         # Should use previous SOC
         assert battery['Battery_SOC'] == 65
 
-    def test_get_battery_details_zero_soc_no_previous(self, service, mock_battery):
+    def test_get_battery_details_zero_soc_no_previous(self, service, mock_battery_template):
         """Test battery details with zero SOC and no previous defaults to 1."""
+        mock_battery = copy.copy(mock_battery_template)
         mock_battery.battery_soc = 0
         batteries = [mock_battery]
 
@@ -429,6 +396,19 @@ class TestBatteryMetricsService:
         # Should not raise
         service.validate_energy_data(energy_total)
 
+    def test_validate_energy_data_includes_battery_totals(self, service):
+        """Test validation counts battery totals merged into the energy dict."""
+        energy_total = {
+            'Export_Energy_Total_kWh': 0.0,
+            'Import_Energy_Total_kWh': 0.0,
+            'PV_Energy_Total_kWh': 0.0,
+            'Battery_Charge_Energy_Total_kWh': 450.0,
+            'Battery_Discharge_Energy_Total_kWh': 0.0
+        }
+
+        # Should not raise
+        service.validate_energy_data(energy_total)
+
     def test_validate_energy_data_fails_all_zeros(self, service):
         """Test validation raises ValueError when all energy data is zero."""
         energy_total = {
@@ -440,27 +420,6 @@ class TestBatteryMetricsService:
         with pytest.raises(ValueError, match="All zeros returned by Invertor"):
             service.validate_energy_data(energy_total)
 
-    def test_decompose_battery_power_discharging(self, service):
-        """Test battery power decomposition for discharging."""
-        charge, discharge = service._decompose_battery_power(2000)
-
-        assert charge == 0
-        assert discharge == 2000
-
-    def test_decompose_battery_power_charging(self, service):
-        """Test battery power decomposition for charging."""
-        charge, discharge = service._decompose_battery_power(-1500)
-
-        assert charge == 1500
-        assert discharge == 0
-
-    def test_decompose_battery_power_zero(self, service):
-        """Test battery power decomposition for zero."""
-        charge, discharge = service._decompose_battery_power(0)
-
-        assert charge == 0
-        assert discharge == 0
-
     def test_soc_kwh_calculation(self, service, mock_inverter_with_battery):
         """Test SOC_kWh calculation formula."""
         # SOC = 75%, nominal_capacity = 100
@@ -472,3 +431,18 @@ class TestBatteryMetricsService:
         )
 
         assert result['SOC_kWh'] == pytest.approx(3.84, abs=0.01)
+
+    @pytest.mark.parametrize("nominal_capacity, soc", [(1, 1), (186, 37), (372, 99)])
+    def test_soc_kwh_matches_published_formula_exactly(
+        self, service, mock_inverter_with_battery, nominal_capacity, soc
+    ):
+        """Test SOC_kWh is bit-identical to the published (x * 51.2) / 1000 / 100 order."""
+        mock_inverter_with_battery.battery_nominal_capacity = nominal_capacity
+        mock_inverter_with_battery.battery_percent = soc
+
+        result = service.calculate_battery_metrics(
+            mock_inverter_with_battery,
+            num_batteries=1
+        )
+
+        assert result['SOC_kWh'] == (soc * ((nominal_capacity * 51.2) / 1000)) / 100
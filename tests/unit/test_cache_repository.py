@@ -14,9 +14,11 @@ import pytest
 import os
 import tempfile
 import shutil
+import pickle
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Barrier
+from unittest.mock import MagicMock
 from GivTCP.repositories import PickleCacheRepository
 
 
@@ -66,6 +68,14 @@ class TestPickleCacheRepository:
         result = cache_repo.get('nonexistent')
         assert result is None
 
+    def test_get_or_default(self, cache_repo):
+        """Test get_or_default returns the cached value or the default."""
+        assert cache_repo.get_or_default('missing') is None
+        assert cache_repo.get_or_default('missing', {}) == {}
+
+        cache_repo.set('present', {'value': 1})
+        assert cache_repo.get_or_default('present', {}) == {'value': 1}
+
     def test_exists(self, cache_repo):
         """Test exists method."""
         assert not cache_repo.exists('test_key')
@@ -352,6 +362,49 @@ class TestPickleCacheRepository:
         # This is a loose check - mainly ensures no deadlocks
         assert elapsed < 5.0  # Should be much faster, but give headroom
 
+    def test_held_file_lock_blocks_only_its_key(self, cache_repo):
+        """Test that a writer holding one key's lock does not stall other keys."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with cache_repo._file_lock(cache_repo._get_filepath('busy')):
+                same_key = executor.submit(cache_repo.set, 'busy', 1)
+                other_key = executor.submit(cache_repo.set, 'idle', 2)
+
+                other_key.result(timeout=5)
+                assert not same_key.done()
+
+            same_key.result(timeout=5)
+
+        assert cache_repo.get('busy') == 1
+        assert cache_repo.get('idle') == 2
+
+    def test_get_does_not_wait_for_writer_lock(self, cache_repo):
+        """Test that reads proceed while a writer holds the key's lock."""
+        cache_repo.set('published', {'value': 1})
+
+        with cache_repo._file_lock(cache_repo._get_filepath('published')):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(cache_repo.get, 'published').result(timeout=5)
+
+        assert result == {'value': 1}
+
+    def test_get_retries_truncated_read(self, cache_repo, monkeypatch):
+        """Test that a read racing an in-place rewrite is retried once."""
+        from GivTCP.repositories import cache_repository
+
+        cache_repo.set('rewritten', {'value': 1})
+        real_read_file = cache_repository._read_file
+        reads = []
+
+        def truncated_first(filepath):
+            data = real_read_file(filepath)
+            reads.append(filepath)
+            return data[:3] if len(reads) == 1 else data
+
+        monkeypatch.setattr(cache_repository, '_read_file', truncated_first)
+
+        assert cache_repo.get('rewritten') == {'value': 1}
+        assert len(reads) == 2
+
     def test_get_filepath(self, cache_repo, temp_cache_dir):
         """Test internal _get_filepath method."""
         key = 'test_key'
@@ -359,6 +412,260 @@ class TestPickleCacheRepository:
         actual_path = cache_repo._get_filepath(key)
         assert actual_path == expected_path
 
+    def test_repeated_get_served_from_memory(self, cache_repo, monkeypatch):
+        """Test that an unchanged key is not read from disk again on repeated reads."""
+        cache_repo.set('hot_key', {'value': 1})
+        first = cache_repo.get('hot_key')
+
+        def fail_read(filepath):
+            raise AssertionError("file read for cached key")
+
+        monkeypatch.setattr('GivTCP.repositories.cache_repository._read_file', fail_read)
+        second = cache_repo.get('hot_key')
+        assert second == first
+        assert second is not first
+
+    def test_mutating_result_does_not_affect_cache(self, cache_repo):
+        """Test that in-place changes by one caller are not seen by the next."""
+        cache_repo.set('stack', [1, 2, 3])
+
+        stack = cache_repo.get('stack')
+        stack.pop(0)
+        stack.append(4)
+
+        assert cache_repo.get('stack') == [1, 2, 3]
+
+    def test_write_behind_get_returns_copy(self, temp_cache_dir):
+        """Test that a queued value is not handed out for mutation."""
+        repo = PickleCacheRepository(temp_cache_dir, write_behind=10)
+        try:
+            repo.set('queued', {'values': [1]})
+            repo.get('queued')['values'].append(2)
+
+            assert repo.get('queued') == {'values': [1]}
+        finally:
+            repo.close()
+
+    def test_memory_cache_revalidated_on_external_write(self, cache_repo, temp_cache_dir):
+        """Test that a file rewritten outside the repository is re-read."""
+        cache_repo.set('shared', {'value': 1})
+        assert cache_repo.get('shared') == {'value': 1}
+
+        other = PickleCacheRepository(temp_cache_dir)
+        other.set('shared', {'value': 2, 'extra': 'x' * 10})
+
+        assert cache_repo.get('shared') == {'value': 2, 'extra': 'x' * 10}
+
+    def test_memory_cache_invalidated_on_delete(self, cache_repo):
+        """Test that deleted keys are not served from memory."""
+        cache_repo.set('gone', 'value')
+        assert cache_repo.get('gone') == 'value'
+
+        cache_repo.delete('gone')
+        assert cache_repo.get('gone') is None
+
+    def test_memory_cache_bounded(self, cache_repo):
+        """Test that the in-memory layer evicts least recently used keys."""
+        for i in range(cache_repo.MEM_CACHE_SIZE + 10):
+            cache_repo.set(f'lru_{i}', i)
+            cache_repo.get(f'lru_{i}')
+
+        assert len(cache_repo._mem) == cache_repo.MEM_CACHE_SIZE
+        assert 'lru_0' not in cache_repo._mem
+
+    def test_lock_table_pruned(self, cache_repo, monkeypatch):
+        """Test that idle per-file locks are pruned once the table is full."""
+        monkeypatch.setattr(cache_repo, 'LOCK_TABLE_LIMIT', 8)
+
+        for i in range(50):
+            cache_repo.set(f'churn_{i}', i)
+
+        assert len(cache_repo._locks) <= 8
+        assert all(cache_repo.get(f'churn_{i}') == i for i in range(50))
+
+    def test_held_lock_not_pruned(self, cache_repo, monkeypatch):
+        """Test that a lock held by a writer survives pruning."""
+        monkeypatch.setattr(cache_repo, 'LOCK_TABLE_LIMIT', 1)
+        held_path = cache_repo._get_filepath('held')
+
+        with cache_repo._file_lock(held_path):
+            held_lock = cache_repo._locks[held_path]
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(cache_repo.set, 'other', 1).result()
+
+            assert cache_repo._locks.get(held_path) is held_lock
+
+    def test_write_behind_coalesces_writes(self, temp_cache_dir, monkeypatch):
+        """Test that queued writes to the same key are coalesced into one."""
+        repo = PickleCacheRepository(temp_cache_dir, write_behind=0.05)
+        writes = []
+        original_write = repo._write
+        monkeypatch.setattr(repo, '_write',
+                            lambda k, v: (writes.append(k), original_write(k, v)))
+        try:
+            for i in range(20):
+                repo.set('burst', i)
+
+            # Visible to this process before it reaches disk
+            assert repo.get('burst') == 19
+            assert repo.exists('burst')
+
+            repo.flush()
+            assert writes == ['burst']
+        finally:
+            repo.close()
+
+        assert PickleCacheRepository(temp_cache_dir).get('burst') == 19
+
+    def test_write_behind_background_flush(self, temp_cache_dir):
+        """Test that the background writer persists queued values."""
+        repo = PickleCacheRepository(temp_cache_dir, write_behind=0.01)
+        try:
+            repo.set('bg_key', {'value': 1})
+
+            deadline = time.monotonic() + 2
+            filepath = repo._get_filepath('bg_key')
+            while not os.path.exists(filepath) and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert os.path.exists(filepath)
+        finally:
+            repo.close()
+
+    def test_write_behind_delete_drops_pending(self, temp_cache_dir):
+        """Test that deleting a queued key prevents it being written."""
+        repo = PickleCacheRepository(temp_cache_dir, write_behind=10)
+        try:
+            repo.set('doomed', 'value')
+            repo.delete('doomed')
+            repo.flush()
+
+            assert not repo.exists('doomed')
+            assert repo.get('doomed') is None
+        finally:
+            repo.close()
+
+    def test_mset_and_mget(self, cache_repo):
+        """Test bulk set and get, including missing keys."""
+        cache_repo.mset({'bulk_1': {'value': 1}, 'bulk_2': {'value': 2}})
+
+        result = cache_repo.mget(['bulk_1', 'bulk_2', 'missing'])
+
+        assert result == {'bulk_1': {'value': 1}, 'bulk_2': {'value': 2}, 'missing': None}
+
+    @pytest.mark.parametrize("unnamed", [True, False])
+    def test_write_over_stale_temp_file(self, cache_repo, temp_cache_dir, monkeypatch, unnamed):
+        """Test that a temp file owned by another writer is skipped, not removed."""
+        import itertools
+        from GivTCP.repositories import cache_repository
+        monkeypatch.setattr(cache_repository, '_TMP_COUNTER', itertools.count())
+        if not unnamed:
+            cache_repo._tmpfile_supported = False
+
+        # Another writer (or a crashed one) holds the first name we would pick
+        taken = f'stale.pkl.{os.getpid()}.0.tmp'
+        with open(os.path.join(temp_cache_dir, taken), 'wb') as f:
+            f.write(b'partial')
+
+        cache_repo.set('stale', {'value': 1})
+
+        assert cache_repo.get('stale') == {'value': 1}
+        assert sorted(os.listdir(temp_cache_dir)) == ['stale.pkl', taken]
+        with open(os.path.join(temp_cache_dir, taken), 'rb') as f:
+            assert f.read() == b'partial'
+
+    def test_failed_write_leaves_other_temp_files(self, cache_repo, temp_cache_dir, monkeypatch):
+        """Test that cleanup after a failed write only removes its own temp file."""
+        other = os.path.join(temp_cache_dir, 'busy.pkl.tmp')
+        with open(other, 'wb') as f:
+            f.write(b'in progress')
+
+        def fail_replace(src, dst):
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(os, 'replace', fail_replace)
+        with pytest.raises(OSError):
+            cache_repo.set('busy', {'value': 1})
+
+        assert os.listdir(temp_cache_dir) == ['busy.pkl.tmp']
+
+    def test_named_temp_file_fallback(self, cache_repo, temp_cache_dir):
+        """Test writes without O_TMPFILE support use a named temp file."""
+        cache_repo._tmpfile_supported = False
+
+        cache_repo.set('fallback', [1, 2, 3])
+
+        assert cache_repo.get('fallback') == [1, 2, 3]
+        assert os.listdir(temp_cache_dir) == ['fallback.pkl']
+
+    def test_write_is_single_syscall(self, cache_repo, monkeypatch):
+        """Test that a value is written to the temp file with one write call."""
+        from GivTCP.repositories import cache_repository
+
+        writes = []
+        real_write_all = cache_repository._write_all
+
+        class CountingFile:
+            def __init__(self, f):
+                self._f = f
+
+            def write(self, data):
+                writes.append(len(data))
+                return self._f.write(data)
+
+        monkeypatch.setattr(cache_repository, '_write_all',
+                            lambda f, data: real_write_all(CountingFile(f), data))
+
+        value = {'data': 'x' * 10000, 'regs': list(range(500))}
+        cache_repo.set('bulk', value)
+
+        assert len(writes) == 1
+        assert PickleCacheRepository(cache_repo.cache_location).get('bulk') == value
+
+    def test_fsync_only_when_durable(self, temp_cache_dir, monkeypatch):
+        """Test that writes skip fsync unless durable mode is requested."""
+        synced = []
+        monkeypatch.setattr(os, 'fsync', synced.append)
+
+        PickleCacheRepository(temp_cache_dir).set('fast', 1)
+        assert synced == []
+
+        durable_repo = PickleCacheRepository(temp_cache_dir, durable=True)
+        durable_repo.set('safe', 1)
+        assert len(synced) == 2  # File data, then the directory entry
+        assert durable_repo.get('safe') == 1
+
+    def test_out_of_band_buffers_round_trip(self, cache_repo, temp_cache_dir):
+        """Test that buffer payloads are stored out-of-band and plain values are not."""
+        from GivTCP.repositories.cache_repository import OOB_MAGIC
+
+        raw = bytearray(b'\x01\x02' * 5000)
+        cache_repo.set('blob', {'raw': pickle.PickleBuffer(raw), 'name': 'blob'})
+        with open(os.path.join(temp_cache_dir, 'blob.pkl'), 'rb') as f:
+            assert f.read(len(OOB_MAGIC)) == OOB_MAGIC
+
+        restored = PickleCacheRepository(temp_cache_dir).get('blob')
+        assert restored['name'] == 'blob'
+        assert bytes(restored['raw']) == bytes(raw)
+
+        # Values without buffers remain ordinary pickles for direct readers
+        cache_repo.set('plain', {'value': 1})
+        with open(os.path.join(temp_cache_dir, 'plain.pkl'), 'rb') as f:
+            assert pickle.load(f) == {'value': 1}
+
+    def test_write_behind_mset_single_flush(self, temp_cache_dir):
+        """Test that a queued bulk set is visible and persisted by one flush."""
+        repo = PickleCacheRepository(temp_cache_dir, write_behind=10)
+        try:
+            repo.mset({'a': 1, 'b': 2})
+            assert repo.mget(['a', 'b']) == {'a': 1, 'b': 2}
+
+            repo.flush()
+            assert os.path.exists(repo._get_filepath('a'))
+            assert os.path.exists(repo._get_filepath('b'))
+        finally:
+            repo.close()
+
 
 # Only run Redis tests if redis is available
 try:
@@ -444,6 +751,184 @@ try:
             assert len(results) == 50
             assert all(r is not None for r in results)
 
+    class TestRedisSerialization:
+        """Tests for the out-of-band pickle helpers used by RedisCacheRepository."""
+
+        def test_plain_value_has_no_buffers(self):
+            """Test that ordinary register dicts take the single-key path."""
+            from GivTCP.repositories.redis_cache_repository import _dumps
+
+            frame, buffers = _dumps({'register': 42, 'name': 'SOC'})
+            assert buffers == []
+            assert pickle.loads(frame) == {'register': 42, 'name': 'SOC'}
+
+        def test_out_of_band_round_trip(self):
+            """Test that a value with large buffers survives frame + buffer storage."""
+            from GivTCP.repositories.redis_cache_repository import (
+                _dumps, _loads_hash, FRAME_FIELD
+            )
+
+            payload = {'raw': pickle.PickleBuffer(bytearray(b'x' * 4096))}
+            frame, buffers = _dumps(payload)
+            assert len(buffers) == 1
+
+            fields = {FRAME_FIELD: frame}
+            fields.update({f'buf{i}'.encode(): bytes(b) for i, b in enumerate(buffers)})
+            restored = _loads_hash(fields)
+
+            assert bytes(restored['raw']) == b'x' * 4096
+
+        def test_plain_register_dict_round_trip(self):
+            """Test that plain register dicts round-trip through the fast codec."""
+            from GivTCP.repositories.redis_cache_repository import (
+                _encode_plain, _decode, msgpack, orjson
+            )
+
+            value = {'SOC': 85, 'Voltage': 52.4, 'Mode': 'Eco', 'Flags': [True, None]}
+            encoded = _encode_plain(value)
+
+            if msgpack is None and orjson is None:
+                assert encoded is None
+            else:
+                assert encoded[:1] in (b'M', b'J')
+                assert _decode(encoded) == value
+
+        def test_non_plain_values_use_pickle(self):
+            """Test that values a fast codec would alter fall back to pickle."""
+            import datetime
+            from GivTCP.repositories.redis_cache_repository import _encode_plain, _decode
+
+            assert _encode_plain({'pair': (1, 2)}) is None
+            assert _encode_plain({'when': datetime.datetime(2024, 1, 1)}) is None
+            assert _encode_plain({1: 'int key'}) is None
+
+            # Existing untagged pickles still decode
+            assert _decode(pickle.dumps({'pair': (1, 2)})) == {'pair': (1, 2)}
+
+        def test_strict_unpickle_allows_register_types(self):
+            """Test that strict mode still decodes containers and datetimes."""
+            import datetime
+            from GivTCP.repositories.redis_cache_repository import _decode
+
+            value = {'when': datetime.datetime(2024, 1, 1, 12, 30), 'pair': (1, 2)}
+            assert _decode(pickle.dumps(value), strict=True) == value
+
+        def test_strict_unpickle_refuses_other_globals(self):
+            """Test that strict mode refuses globals outside the allow-list."""
+            from GivTCP.repositories.redis_cache_repository import _decode
+
+            payload = pickle.dumps({'call': os.getcwd})
+            with pytest.raises(pickle.UnpicklingError):
+                _decode(payload, strict=True)
+            assert _decode(payload)['call'] is os.getcwd
+
+        def test_missing_codec_fails_loudly(self, monkeypatch):
+            """Test that a value tagged for an uninstalled codec is not read as a miss."""
+            from GivTCP.repositories import redis_cache_repository
+
+            monkeypatch.setattr(redis_cache_repository, 'msgpack', None)
+            monkeypatch.setattr(redis_cache_repository, 'orjson', None)
+
+            with pytest.raises(ImportError, match="msgpack"):
+                redis_cache_repository._decode(b'M\x81\xa3SOC\x55')
+            with pytest.raises(ImportError, match="orjson"):
+                redis_cache_repository._decode(b'J{"SOC": 85}')
+
+            client = MagicMock()
+            client.get.return_value = b'J{"SOC": 85}'
+            repo = RedisCacheRepository(client, key_prefix='test')
+            with pytest.raises(ImportError):
+                repo.get('regCache_1')
+
+    class TestRedisCacheRepositoryMockClient:
+        """Tests for RedisCacheRepository command usage against a mock client."""
+
+        @pytest.fixture
+        def mock_client(self):
+            """Create a mock Redis client."""
+            return MagicMock()
+
+        def test_clear_unlinks_in_one_pipeline(self, mock_client):
+            """Test that clear batches UNLINKs into a single pipeline execute."""
+            repo = RedisCacheRepository(mock_client, key_prefix='test')
+            repo.CLEAR_BATCH_SIZE = 2
+            mock_client.scan_iter.return_value = iter([b'test:a', b'test:b', b'test:c'])
+            pipe = mock_client.pipeline.return_value.__enter__.return_value
+            pipe.execute.return_value = [2, 1]
+
+            repo.clear()
+
+            mock_client.pipeline.assert_called_once_with(transaction=False)
+            assert pipe.unlink.call_count == 2
+            pipe.execute.assert_called_once()
+            mock_client.delete.assert_not_called()
+
+        def test_mget_single_round_trip(self, mock_client):
+            """Test that mget uses one MGET and only falls back for nil entries."""
+            repo = RedisCacheRepository(mock_client, key_prefix='test')
+            mock_client.mget.return_value = [pickle.dumps({'value': 1}), None]
+            pipe = mock_client.pipeline.return_value.__enter__.return_value
+            pipe.execute.return_value = [{}]
+
+            result = repo.mget(['present', 'missing'])
+
+            assert result == {'present': {'value': 1}, 'missing': None}
+            mock_client.mget.assert_called_once_with(['test:present', 'test:missing'])
+            pipe.hgetall.assert_called_once_with('test:missing')
+            mock_client.get.assert_not_called()
+
+        def test_mset_single_pipeline(self, mock_client):
+            """Test that mset queues every key on one transactional pipeline."""
+            repo = RedisCacheRepository(mock_client, key_prefix='test')
+            pipe = mock_client.pipeline.return_value
+
+            repo.mset({'a': {'value': 1}, 'b': {'value': 2}}, ttl=30)
+
+            mock_client.pipeline.assert_called_once_with()
+            assert pipe.set.call_count == 2
+            assert all(c.kwargs['ex'] == 30 for c in pipe.set.call_args_list)
+            pipe.execute.assert_called_once()
+            mock_client.set.assert_not_called()
+
+        def test_from_url_builds_keepalive_pool(self, monkeypatch):
+            """Test that from_url creates a bounded keepalive connection pool."""
+            client_cls = MagicMock()
+            monkeypatch.setattr(redis, 'Redis', client_cls)
+
+            repo = RedisCacheRepository.from_url('redis://localhost:6379/3',
+                                                 key_prefix='test', max_connections=4)
+
+            pool = client_cls.call_args.kwargs['connection_pool']
+            assert pool.max_connections == 4
+            assert pool.connection_kwargs['socket_keepalive'] is True
+            assert pool.connection_kwargs['db'] == 3
+            assert repo.key_prefix == 'test'
+
+        def test_from_url_local_cache_enables_tracking(self, monkeypatch):
+            """Test that local_cache_size configures a RESP3 tracked client cache."""
+            from GivTCP.repositories.redis_cache_repository import CacheConfig
+            if CacheConfig is None:
+                pytest.skip("redis-py too old for client-side caching")
+            client_cls = MagicMock()
+            monkeypatch.setattr(redis, 'Redis', client_cls)
+
+            RedisCacheRepository.from_url('redis://localhost:6379/0', local_cache_size=256)
+
+            pool = client_cls.call_args.kwargs['connection_pool']
+            assert pool.connection_kwargs['protocol'] == 3
+            assert pool.cache is not None
+
+        def test_get_refresh_ttl_uses_getex(self, mock_client):
+            """Test that refreshing the TTL on read is a single GETEX."""
+            repo = RedisCacheRepository(mock_client, key_prefix='test')
+            mock_client.getex.return_value = pickle.dumps({'value': 1})
+
+            assert repo.get('hot', refresh_ttl=60) == {'value': 1}
+
+            mock_client.getex.assert_called_once_with('test:hot', ex=60)
+            mock_client.get.assert_not_called()
+            mock_client.expire.assert_not_called()
+
 except ImportError:
     # Redis not available, skip tests
     pass
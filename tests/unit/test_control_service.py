@@ -184,6 +184,23 @@ class TestControlModeService:
         assert result['Temp_Pause_Charge'] == "Normal"
         assert result['Temp_Pause_Discharge'] == "Running"
 
+    @patch('GivTCP.services.control_service.exists')
+    def test_status_flags_cached_between_polls(self, mock_exists, service, mock_inverter_eco):
+        """Test status flag files are only checked again once the cache TTL expires."""
+        mock_exists.return_value = False
+        service.detect_control_mode(mock_inverter_eco)
+        assert mock_exists.call_count == 4
+
+        mock_exists.return_value = True
+        result = service.detect_control_mode(mock_inverter_eco)
+        assert mock_exists.call_count == 4
+        assert result['Force_Charge'] == "Normal"
+
+        service.FLAG_CACHE_TTL = 0
+        result = service.detect_control_mode(mock_inverter_eco)
+        assert mock_exists.call_count == 8
+        assert result['Force_Charge'] == "Running"
+
     def test_temp_pause_from_cache(self, service, mock_inverter_eco):
         """Test temp pause status from cache data."""
         cache_data = {
@@ -221,6 +238,17 @@ class TestControlModeService:
         assert result['Charge_start_time_slot_2'] == "14:00:00"
         assert result['Charge_end_time_slot_2'] == "17:00:00"
 
+    def test_get_timeslots_updates_when_slot_changes(self, service, mock_inverter_eco):
+        """Test cached timeslot strings are rebuilt once a slot changes."""
+        service.get_timeslots(mock_inverter_eco)
+
+        mock_inverter_eco.charge_slot_1 = (time(1, 0), time(4, 0))
+        result = service.get_timeslots(mock_inverter_eco)
+
+        assert result['Charge_start_time_slot_1'] == "01:00:00"
+        assert result['Charge_end_time_slot_1'] == "04:00:00"
+        assert result['Discharge_start_time_slot_1'] == "00:00:00"
+
     def test_get_inverter_details_lithium_em115(self, service, mock_inverter_eco):
         """Test inverter details extraction with Lithium battery and EM115 meter."""
         result = service.get_inverter_details(mock_inverter_eco)
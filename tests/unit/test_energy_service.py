@@ -133,7 +133,7 @@ class TestEnergyCalculationService:
             export_energy=30.0,
             import_energy=20.0,
             pv_energy=50.0,
-            model=Model.Hybrid
+            is_hybrid=True
         )
 
         # Hybrid: (100 - 10) - (30 - 20) = 90 - 10 = 80.0
@@ -147,7 +147,7 @@ class TestEnergyCalculationService:
             export_energy=30.0,
             import_energy=20.0,
             pv_energy=50.0,
-            model=Model.AC
+            is_hybrid=False
         )
 
         # Non-Hybrid: (100 - 10) - (30 - 20) + 50 = 90 - 10 + 50 = 130.0
@@ -229,7 +229,7 @@ class TestEnergyCalculationService:
             export_energy=10.0,  # Export less than import
             import_energy=30.0,  # Net import
             pv_energy=20.0,
-            model=Model.Hybrid
+            is_hybrid=True
         )
 
         # Hybrid: (50 - 10) - (10 - 30) = 40 - (-20) = 60.0
@@ -256,7 +256,7 @@ class TestEnergyCalculationService:
             export_energy=30.11111,
             import_energy=20.99999,
             pv_energy=50.88888,
-            model=Model.Hybrid
+            is_hybrid=True
         )
 
         # Verify result has at most 2 decimal places
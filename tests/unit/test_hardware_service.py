@@ -13,11 +13,13 @@ Critical tests:
 
 import pytest
 import datetime
+import fcntl
+import os
 import pickle
 import tempfile
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from GivTCP.services import HardwareCommunicationService
-from GivTCP.services.hardware_service import InverterReadResult
+from GivTCP.services.hardware_service import InverterReadResult, LockHeldError, file_lock
 
 
 class TestHardwareCommunicationService:
@@ -51,6 +53,18 @@ class TestHardwareCommunicationService:
         cache_repo.set = Mock()
         return cache_repo
 
+    @staticmethod
+    def _lock_is_free(path):
+        """Return True if the flock on path can be taken from a new descriptor."""
+        fd = os.open(path, os.O_RDWR)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+        finally:
+            os.close(fd)
+
     @pytest.fixture
     def temp_files(self, tmp_path):
         """Create temporary file paths for testing."""
@@ -142,9 +156,8 @@ class TestHardwareCommunicationService:
         # Verify GivClient was called
         mock_giv_client.getData.assert_called_once_with(True)
 
-        # Verify lock file was removed
-        import os
-        assert not os.path.exists(temp_files['lock_file'])
+        # Verify lock was released
+        assert self._lock_is_free(temp_files['lock_file'])
 
         # Verify result structure
         assert isinstance(result, InverterReadResult)
@@ -153,8 +166,32 @@ class TestHardwareCommunicationService:
     def test_read_with_file_lock_existing_lock(
         self, mock_giv_client, temp_files
     ):
-        """Test read fails when lockfile already exists."""
-        # Create existing lock file
+        """Test read fails when another reader holds the lock file."""
+        # Hold the lock through a separate descriptor
+        fd = os.open(temp_files['lock_file'], os.O_RDWR | os.O_CREAT)
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_file_path=temp_files['lock_file'],
+            last_update_path=temp_files['last_update'],
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=False,
+            use_new_cache=False
+        )
+
+        try:
+            with pytest.raises(RuntimeError, match="Lockfile set"):
+                service.read_inverter_data(fullrefresh=False)
+            mock_giv_client.getData.assert_not_called()
+        finally:
+            os.close(fd)
+
+    def test_read_with_file_lock_ignores_leftover_file(
+        self, mock_giv_client, temp_files
+    ):
+        """Test a lock file left behind without a held lock does not block reads."""
         open(temp_files['lock_file'], 'w').close()
 
         service = HardwareCommunicationService(
@@ -167,13 +204,13 @@ class TestHardwareCommunicationService:
             use_new_cache=False
         )
 
-        with pytest.raises(RuntimeError, match="Lockfile set"):
-            service.read_inverter_data(fullrefresh=False)
+        result = service.read_inverter_data(fullrefresh=False)
+        assert result.status == "online"
 
     def test_read_with_file_lock_removes_on_error(
         self, mock_giv_client, temp_files
     ):
-        """Test lock file is removed even when inverter read fails."""
+        """Test lock is released even when inverter read fails."""
         mock_giv_client.getData = Mock(side_effect=Exception("Connection failed"))
 
         service = HardwareCommunicationService(
@@ -189,9 +226,61 @@ class TestHardwareCommunicationService:
         with pytest.raises(Exception, match="Connection failed"):
             service.read_inverter_data(fullrefresh=False)
 
-        # Verify lock file was removed despite error
-        import os
-        assert not os.path.exists(temp_files['lock_file'])
+        # Verify lock was released despite error
+        assert self._lock_is_free(temp_files['lock_file'])
+
+    def test_legacy_file_lock_excludes_service(
+        self, mock_giv_client, temp_files
+    ):
+        """Test the legacy getData lock and the service lock exclude each other."""
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_file_path=temp_files['lock_file'],
+            last_update_path=temp_files['last_update'],
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=False,
+            use_new_cache=False
+        )
+
+        with file_lock(temp_files['lock_file']):
+            with pytest.raises(LockHeldError):
+                service.read_inverter_data(fullrefresh=False)
+
+        # The service's persistent lock file does not block the legacy path
+        assert os.path.exists(temp_files['lock_file'])
+        with file_lock(temp_files['lock_file']):
+            pass
+        assert service.read_inverter_data(fullrefresh=False).status == "online"
+
+    def test_file_lock_without_fcntl(
+        self, mock_giv_client, temp_files, monkeypatch
+    ):
+        """Test the touch-file lock is used where fcntl is unavailable."""
+        from GivTCP.services import hardware_service
+        monkeypatch.setattr(hardware_service, 'fcntl', None)
+        lock_file = temp_files['lock_file']
+        if os.path.exists(lock_file):
+            os.remove(lock_file)
+
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_file_path=lock_file,
+            last_update_path=temp_files['last_update'],
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=False,
+            use_new_cache=False
+        )
+
+        with file_lock(lock_file):
+            assert os.path.exists(lock_file)
+            with pytest.raises(LockHeldError):
+                service.read_inverter_data(fullrefresh=False)
+        assert not os.path.exists(lock_file)
+
+        assert service.read_inverter_data(fullrefresh=False).status == "online"
+        assert not os.path.exists(lock_file)
 
     def test_timestamp_calculation_with_cache_repo(
         self, mock_giv_client, mock_lock_manager, mock_cache_repo
@@ -222,6 +311,74 @@ class TestHardwareCommunicationService:
         assert result.time_since_last >= 0.9
         assert result.time_since_last <= 1.5
 
+    def test_timestamp_updated_after_lock_released(
+        self, mock_giv_client, mock_cache_repo
+    ):
+        """Test that cache timestamp writes happen outside the inverter read lock."""
+        from GivTCP.concurrency import ThreadLockManager
+        lock_manager = ThreadLockManager()
+        held_during_set = []
+        mock_cache_repo.set = Mock(side_effect=lambda key, value: held_during_set.append(
+            lock_manager._locks['inverter_read'].owner is not None))
+
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_manager=lock_manager,
+            cache_repo=mock_cache_repo,
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=True,
+            use_new_cache=True
+        )
+
+        service.read_inverter_data(fullrefresh=False)
+
+        mock_giv_client.getData.assert_called_once_with(False)
+        assert held_during_set == [False]
+
+    def test_timestamp_cache_read_once(
+        self, mock_giv_client, mock_lock_manager, mock_cache_repo
+    ):
+        """Test later reads take the delta in-process instead of from the cache."""
+        mock_cache_repo.get = Mock(return_value=None)
+
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_manager=mock_lock_manager,
+            cache_repo=mock_cache_repo,
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=True,
+            use_new_cache=True
+        )
+
+        service.read_inverter_data(fullrefresh=False)
+        result = service.read_inverter_data(fullrefresh=False)
+
+        mock_cache_repo.get.assert_called_once_with('lastUpdate_1')
+        assert mock_cache_repo.set.call_count == 2
+        assert 0.0 < result.time_since_last < 1.0
+
+    def test_timestamp_write_behind(
+        self, mock_giv_client, mock_lock_manager, mock_cache_repo
+    ):
+        """Test that write-behind stores the timestamp off the read path."""
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_manager=mock_lock_manager,
+            cache_repo=mock_cache_repo,
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=True,
+            use_new_cache=True,
+            write_behind=True
+        )
+
+        result = service.read_inverter_data(fullrefresh=False)
+        service.flush()
+
+        mock_cache_repo.set.assert_called_once_with('lastUpdate_1', result.timestamp)
+
     def test_timestamp_calculation_with_pickle(
         self, mock_giv_client, temp_files
     ):
@@ -298,6 +455,31 @@ class TestHardwareCommunicationService:
         import os
         assert os.path.exists(temp_files['last_update'])
 
+    def test_timestamp_pickle_read_once(
+        self, mock_giv_client, temp_files
+    ):
+        """Test later reads use the in-process timestamp instead of the pickle file."""
+        service = HardwareCommunicationService(
+            giv_client=mock_giv_client,
+            lock_file_path=temp_files['lock_file'],
+            last_update_path=temp_files['last_update'],
+            inverter_ip="192.168.1.100",
+            instance_id="1",
+            use_new_locks=False,
+            use_new_cache=False
+        )
+
+        service.read_inverter_data(fullrefresh=False)
+
+        import os
+        os.remove(temp_files['last_update'])
+        result = service.read_inverter_data(fullrefresh=False)
+
+        assert 0.0 <= result.time_since_last < 1.0
+        # Rewritten on every read so other processes see the latest read
+        with open(temp_files['last_update'], 'rb') as inp:
+            assert pickle.load(inp) == result.timestamp
+
     def test_fullrefresh_parameter_passed(
         self, mock_giv_client, mock_lock_manager, mock_cache_repo
     ):
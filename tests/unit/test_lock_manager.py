@@ -11,10 +11,12 @@ Critical tests:
 - Concurrent access scenarios
 """
 
+import logging
 import pytest
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Barrier, Event
+from unittest.mock import Mock, patch
 from GivTCP.concurrency import LockManager, ThreadLockManager
 
 
@@ -118,6 +120,13 @@ class TestThreadLockManager:
 
         assert locked_status[0] is True  # Was locked when checked from other thread
 
+    def test_is_locked_from_holder_thread(self, lock_manager):
+        """Test is_locked returns False when checked by the thread holding the lock."""
+        with lock_manager.acquire('test_resource'):
+            with lock_manager.acquire('test_resource'):
+                assert not lock_manager.is_locked('test_resource')
+            assert not lock_manager.is_locked('test_resource')
+
     def test_concurrent_access_blocks(self, lock_manager):
         """Test that concurrent threads block on the same resource."""
         execution_order = []
@@ -196,6 +205,94 @@ class TestThreadLockManager:
         expected = num_threads * increments_per_thread
         assert counter['value'] == expected
 
+    def test_get_lock_handle(self, lock_manager):
+        """Test that a reusable lock handle shares the resource's lock."""
+        handle = lock_manager.get_lock('test_resource', timeout=0.2)
+        locked_by_other = []
+
+        def check_from_other_thread():
+            locked_by_other.append(lock_manager.is_locked('test_resource'))
+            try:
+                with handle:
+                    locked_by_other.append('acquired')
+            except TimeoutError:
+                locked_by_other.append('timeout')
+
+        with handle as result:
+            assert result is True
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(check_from_other_thread).result()
+
+        assert locked_by_other == [True, 'timeout']
+        assert not lock_manager.is_locked('test_resource')
+
+        # Handle is reusable once released
+        with handle:
+            pass
+
+    def test_wait_for_release(self, lock_manager):
+        """Test that wait_for_release returns once the holder releases the lock."""
+        event = Event()
+        released_at = []
+
+        def lock_holder():
+            with lock_manager.acquire('shared_resource'):
+                event.set()
+                time.sleep(0.2)
+                released_at.append(time.time())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(lock_holder)
+            event.wait()
+            assert lock_manager.wait_for_release('shared_resource', timeout=5.0)
+            woke_at = time.time()
+            future.result()
+
+        assert woke_at >= released_at[0]
+        assert not lock_manager.is_locked('shared_resource')
+
+    def test_wait_for_release_timeout(self, lock_manager):
+        """Test that wait_for_release gives up after the timeout."""
+        event = Event()
+        done = Event()
+
+        def lock_holder():
+            with lock_manager.acquire('shared_resource'):
+                event.set()
+                done.wait()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(lock_holder)
+            event.wait()
+            assert not lock_manager.wait_for_release('shared_resource', timeout=0.2)
+            done.set()
+            future.result()
+
+    def test_wait_for_release_when_free(self, lock_manager):
+        """Test that wait_for_release returns immediately for a free resource."""
+        assert lock_manager.wait_for_release('test_resource', timeout=0.1)
+
+    def test_concurrent_first_use_creates_single_lock(self, lock_manager):
+        """Test that threads racing to create a resource's lock all share one lock."""
+        num_threads = 20
+        barrier = Barrier(num_threads)
+        counter = {'value': 0}
+
+        def worker():
+            barrier.wait()  # Race on the first acquire of a new resource
+            with lock_manager.acquire('new_resource', timeout=5.0):
+                current = counter['value']
+                time.sleep(0.001)
+                counter['value'] = current + 1
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [executor.submit(worker) for _ in range(num_threads)]
+            for future in as_completed(futures):
+                future.result()
+
+        assert len(lock_manager._locks) == 1
+        assert counter['value'] == num_threads
+
     def test_exception_in_critical_section_releases_lock(self, lock_manager):
         """Test that lock is released even if exception occurs."""
         try:
@@ -293,6 +390,32 @@ class TestThreadLockManager:
         # Timeout should have occurred
         assert len(timeout_occurred) == 1
 
+    def test_timeout_waiter_wakes_on_release(self, lock_manager):
+        """Test that a waiter with a timeout acquires as soon as the lock is released."""
+        event = Event()
+        waited = []
+
+        def lock_holder():
+            with lock_manager.acquire('shared_resource'):
+                event.set()
+                time.sleep(0.2)
+
+        def lock_waiter():
+            event.wait()
+            start = time.time()
+            with lock_manager.acquire('shared_resource', timeout=5.0):
+                waited.append(time.time() - start)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            f1 = executor.submit(lock_holder)
+            f2 = executor.submit(lock_waiter)
+            f1.result()
+            f2.result()
+
+        # Waiter should block for the hold time, not the full timeout
+        assert len(waited) == 1
+        assert waited[0] < 1.0
+
 
 # Only run Redis tests if redis is available
 try:
@@ -331,6 +454,133 @@ try:
             assert manager.key_prefix == 'test'
             assert manager.default_ttl == 60
 
+        def test_shared_client_pinged_once(self):
+            """Test that constructing several managers on one client pings it once."""
+            client = Mock()
+            RedisLockManager(client, key_prefix='test')
+            RedisLockManager(client, key_prefix='test')
+
+            client.ping.assert_called_once()
+
+        def test_shared_client_pinged_once_across_managers(self):
+            """Test that lock and status managers on one client share its PING."""
+            from GivTCP.concurrency import RedisStatusManager
+            client = Mock()
+            RedisLockManager(client, key_prefix='test')
+            RedisStatusManager(client, key_prefix='test')
+
+            client.ping.assert_called_once()
+
+        def test_is_locked_caches_negative_result(self):
+            """Test that a 'not locked' answer is reused briefly and dropped on acquire."""
+            client = Mock()
+            client.exists.return_value = 0
+            client.pipeline.return_value.execute.return_value = [True, 30000]
+            manager = RedisLockManager(client, key_prefix='test')
+
+            assert not manager.is_locked('resource')
+            assert not manager.is_locked('resource')
+            assert client.exists.call_count == 1
+
+            with manager.acquire('resource'):
+                client.exists.return_value = 1
+                assert manager.is_locked('resource')
+            assert client.exists.call_count == 2
+
+        def test_lease_remaining_from_acquire(self):
+            """Test that the TTL read with the acquire is exposed without yielding it."""
+            client = Mock()
+            client.pipeline.return_value.execute.return_value = [True, 30000]
+            client.register_script.return_value.return_value = 1
+            manager = RedisLockManager(client, key_prefix='test')
+
+            with manager.acquire('resource') as acquired:
+                assert acquired is True
+                assert 29000 < manager.lease_remaining('resource') <= 30000
+                client.ttl.assert_not_called()
+
+            assert manager.lease_remaining('resource') is None
+
+        def test_backoff_delay_bounds(self):
+            """Test that retry backoff grows exponentially and is capped."""
+            manager = RedisLockManager(Mock(), key_prefix='test')
+
+            for attempt in range(20):
+                ceiling = min(manager.BACKOFF_CAP, manager.BACKOFF_BASE * (2 ** attempt))
+                delay = manager._backoff_delay(attempt)
+                assert 0 <= delay <= ceiling
+
+        def test_waiter_subscribes_to_keyspace_release(self):
+            """Test that a contended acquire waits on the manager's keyspace subscription."""
+            client = Mock()
+            client.connection_pool.connection_kwargs = {'db': 15}
+            client.config_get.return_value = {'notify-keyspace-events': 'Kgx'}
+            pipe = client.pipeline.return_value
+            spins = RedisLockManager.SPIN_TRIES + RedisLockManager.YIELD_TRIES
+            pipe.execute.side_effect = [[None, 900]] * (spins + 2) + [[True, 30000]]
+            client.register_script.return_value.return_value = 1
+            pubsub = client.pubsub.return_value
+            manager = RedisLockManager(client, key_prefix='test')
+
+            def release(timeout):
+                manager._on_keyspace_event({'channel': b'__keyspace@15__:test:resource',
+                                            'data': b'del'})
+                return True
+            with patch.object(Event, 'wait', side_effect=release) as wait:
+                with manager.acquire('resource', timeout=1.0) as acquired:
+                    assert acquired is True
+                    assert manager._release_waiters == {}
+
+            wait.assert_called_once()
+            pubsub.psubscribe.assert_called_once()
+            assert list(pubsub.psubscribe.call_args.kwargs) == ['__keyspace@15__:test:*']
+            assert pipe.execute.call_count == spins + 3
+
+        def test_keyspace_subscription_shared_by_waiters(self):
+            """Test that waiters share one subscription and are woken by key."""
+            client = Mock()
+            client.connection_pool.connection_kwargs = {'db': 0}
+            client.config_get.return_value = {b'notify-keyspace-events': b'AK'}
+            manager = RedisLockManager(client, key_prefix='test')
+
+            first = manager._add_waiter('test:a')
+            second = manager._add_waiter('test:b')
+            manager._on_keyspace_event({'channel': '__keyspace@0__:test:a', 'data': 'expired'})
+
+            assert first.is_set() and not second.is_set()
+            client.pubsub.assert_called_once()
+            client.config_get.assert_called_once_with('notify-keyspace-events')
+            manager.close()
+            client.pubsub.return_value.run_in_thread.return_value.stop.assert_called_once()
+
+        def test_missing_keyspace_notifications_logged(self, caplog):
+            """Test that disabled keyspace notifications are reported once."""
+            client = Mock()
+            client.connection_pool.connection_kwargs = {'db': 0}
+            client.config_get.return_value = {'notify-keyspace-events': ''}
+            manager = RedisLockManager(client, key_prefix='test')
+
+            with caplog.at_level(logging.WARNING):
+                manager._add_waiter('test:a')
+                manager._add_waiter('test:b')
+
+            warnings = [r for r in caplog.records if 'notify-keyspace-events' in r.message]
+            assert len(warnings) == 1
+
+        def test_briefly_held_lock_acquired_by_spinning(self):
+            """Test that a lock freed within a few retries is taken without subscribing."""
+            client = Mock()
+            pipe = client.pipeline.return_value
+            pipe.execute.side_effect = [[None, 5], [None, 5], [True, 30000]]
+            client.register_script.return_value.return_value = 1
+            manager = RedisLockManager(client, key_prefix='test')
+
+            with manager.acquire('resource', timeout=1.0):
+                pass
+
+            client.pubsub.assert_not_called()
+            assert pipe.execute.call_count == 3
+
         def test_basic_lock_acquire(self, lock_manager):
             """Test basic lock acquisition and release."""
             with lock_manager.acquire('test_resource'):
@@ -131,6 +131,18 @@ class TestPowerCalculationService:
         assert result['Import_Power'] == 0
         assert result['Export_Power'] == 0
 
+    def test_grid_power_across_zero_crossing(self, service, mock_inverter_typical):
+        """Test import/export split stays consistent as grid power changes sign."""
+        for grid_power in (-150.5, -1, -0.5, 0, 0.5, 1, 150.5):
+            mock_inverter_typical.p_grid_out = grid_power
+
+            result = service.calculate_power_stats(mock_inverter_typical)
+
+            assert result['Import_Power'] >= 0
+            assert result['Export_Power'] >= 0
+            assert result['Export_Power'] - result['Import_Power'] == grid_power
+            assert result['Import_Power'] == 0 or result['Export_Power'] == 0
+
     def test_inverter_power_within_range(self, service, mock_inverter_typical):
         """Test inverter power within valid range."""
         mock_inverter_typical.p_inverter_out = 3000
@@ -284,26 +296,23 @@ class TestPowerCalculationService:
         assert flows['Solar_to_Grid'] == 0
         assert flows['Grid_to_House'] == 0
 
-    def test_decompose_grid_power_import(self, service):
-        """Test grid power decomposition for import."""
-        import_power, export_power = service._decompose_grid_power(-1500)
-
-        assert import_power == 1500
-        assert export_power == 0
-
-    def test_decompose_grid_power_export(self, service):
-        """Test grid power decomposition for export."""
-        import_power, export_power = service._decompose_grid_power(2000)
-
-        assert import_power == 0
-        assert export_power == 2000
-
-    def test_decompose_grid_power_zero(self, service):
-        """Test grid power decomposition for zero."""
-        import_power, export_power = service._decompose_grid_power(0)
-
-        assert import_power == 0
-        assert export_power == 0
+    def test_stats_and_flows_match_separate_calls(self, service, mock_inverter_typical):
+        """Test the fused calculation matches stats followed by flows."""
+        cases = [
+            {},
+            {'p_grid_out': -1200},
+            {'p_pv1': 0, 'p_pv2': 0},
+            {'p_pv1': 10000, 'p_pv2': 6000},  # PV rejected
+            {'p_load_demand': 16000},  # Load rejected
+        ]
+        for overrides in cases:
+            for attr, value in overrides.items():
+                setattr(mock_inverter_typical, attr, value)
+
+            power, flows = service.calculate_power_stats_and_flows(mock_inverter_typical)
+
+            assert power == service.calculate_power_stats(mock_inverter_typical)
+            assert flows == service.calculate_power_flows(power)
 
     def test_zero_power_values(self, service):
         """Test handling of all zero power values."""
@@ -176,6 +176,24 @@ class TestDataProcessingService:
         assert len(updated_stack) == 4
         assert updated_stack[3]['id'] == 4
 
+    def test_update_cache_stack_caps_loaded_stack(self, mock_cache_repo):
+        """Test that a loaded stack stays at 5 entries across updates."""
+        mock_cache_repo.get = Mock(return_value=None)
+        service = DataProcessingService(
+            cache_repo=mock_cache_repo,
+            instance_id="1",
+            use_new_cache=True
+        )
+
+        cache_stack = service.load_cache_stack()
+        for i in range(7):
+            cache_stack = service.update_cache_stack(cache_stack, {'id': i})
+        service.save_cache_stack(cache_stack)
+
+        stored = mock_cache_repo.set.call_args[0][1]
+        assert isinstance(stored, list)
+        assert [entry['id'] for entry in stored] == [2, 3, 4, 5, 6]
+
     def test_save_cache_stack_with_repository(self, mock_cache_repo):
         """Test saving cache stack using cache repository."""
         service = DataProcessingService(
@@ -225,7 +243,7 @@ class TestDataProcessingService:
 
         # Verify repository was called
         mock_cache_repo.get.assert_called_once_with('regCache_1')
-        assert result == cache_stack
+        assert list(result) == cache_stack
 
     def test_load_cache_stack_with_pickle(self, temp_files):
         """Test loading cache stack from pickle file."""
@@ -243,7 +261,7 @@ class TestDataProcessingService:
 
         result = service.load_cache_stack()
 
-        assert result == cache_stack
+        assert list(result) == cache_stack
 
     def test_load_cache_stack_not_found_repository(self, mock_cache_repo):
         """Test loading cache stack when not found in repository."""
@@ -258,7 +276,7 @@ class TestDataProcessingService:
         result = service.load_cache_stack()
 
         # Should return empty 5-element stack
-        assert result == [0, 0, 0, 0, 0]
+        assert list(result) == [0, 0, 0, 0, 0]
 
     def test_load_cache_stack_not_found_pickle(self, temp_files):
         """Test loading cache stack when pickle file doesn't exist."""
@@ -271,7 +289,45 @@ class TestDataProcessingService:
         result = service.load_cache_stack()
 
         # Should return empty 5-element stack
-        assert result == [0, 0, 0, 0, 0]
+        assert list(result) == [0, 0, 0, 0, 0]
+
+    def test_save_cache_stack_replaces_file_atomically(self, temp_files):
+        """Test that saving goes through a temp file and leaves none behind."""
+        import os
+        service = DataProcessingService(
+            cache_file_path=temp_files['cache_file'],
+            use_new_cache=False
+        )
+
+        service.save_cache_stack([{'id': 1}])
+        service.save_cache_stack([{'id': 1}, {'id': 2}])
+
+        assert not os.path.exists(temp_files['cache_file'] + '.tmp')
+        assert list(service.load_cache_stack()) == [{'id': 1}, {'id': 2}]
+
+    def test_write_behind_coalesces_saves(self, mock_cache_repo):
+        """Test that write-behind saves keep only the latest pending stack."""
+        import threading
+        import time
+        release = threading.Event()
+        mock_cache_repo.set = Mock(side_effect=lambda key, value: release.wait(5))
+        service = DataProcessingService(
+            cache_repo=mock_cache_repo,
+            instance_id="1",
+            use_new_cache=True,
+            write_behind=True
+        )
+
+        service.save_cache_stack([{'id': 1}])  # Picked up by the worker
+        while service._save_writer.pending:
+            time.sleep(0.001)
+        service.save_cache_stack([{'id': 2}])
+        service.save_cache_stack([{'id': 3}])
+        release.set()
+        service.flush()
+
+        saved = [c[0][1] for c in mock_cache_repo.set.call_args_list]
+        assert saved == [[{'id': 1}], [{'id': 3}]]
 
     def test_check_consistency_no_missing_keys(self, mock_functions):
         """Test consistency check when no keys are missing."""
@@ -0,0 +1,101 @@
+"""
+Unit tests for status manager implementations.
+
+Tests for Phase 5 refactoring: Replace File-Based Status Flags
+
+Critical tests:
+- Setting and clearing status flags
+- Visibility of flags created outside the manager
+- Cleanup of known status files
+"""
+
+import pytest
+import os
+import tempfile
+import shutil
+import time
+from GivTCP.concurrency import FileStatusManager
+
+
+class TestFileStatusManager:
+    """Tests for FileStatusManager implementation."""
+
+    @pytest.fixture
+    def temp_status_dir(self):
+        """Create a temporary directory for status files."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        # Cleanup
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @pytest.fixture
+    def status_manager(self, temp_status_dir):
+        """Create a FileStatusManager instance."""
+        return FileStatusManager(temp_status_dir)
+
+    def test_status_not_set(self, status_manager):
+        """Test is_status_set returns False for a flag that was never set."""
+        assert not status_manager.is_status_set('FCRunning')
+
+    def test_set_and_clear_status(self, status_manager, temp_status_dir):
+        """Test setting and clearing a status flag."""
+        status_manager.set_status('FCRunning')
+        assert status_manager.is_status_set('FCRunning')
+        assert os.path.exists(os.path.join(temp_status_dir, '.FCRunning'))
+
+        status_manager.clear_status('FCRunning')
+        assert not status_manager.is_status_set('FCRunning')
+        assert not os.path.exists(os.path.join(temp_status_dir, '.FCRunning'))
+
+    def test_clear_status_not_set(self, status_manager):
+        """Test clearing a flag that isn't set doesn't raise."""
+        status_manager.clear_status('FERunning')
+        assert not status_manager.is_status_set('FERunning')
+
+    def test_external_flag_visible_after_cache_ttl(self, status_manager, temp_status_dir):
+        """Test that a flag created by another process is seen once the snapshot expires."""
+        assert not status_manager.is_status_set('FERunning')
+
+        open(os.path.join(temp_status_dir, '.FERunning'), 'w').close()
+        time.sleep(status_manager.CACHE_TTL * 2)
+
+        assert status_manager.is_status_set('FERunning')
+
+    def test_clear_all(self, status_manager):
+        """Test clearing all known status flags."""
+        status_manager.set_status('FCRunning')
+        status_manager.set_status('FERunning')
+
+        status_manager.clear_all()
+
+        assert not status_manager.is_status_set('FCRunning')
+        assert not status_manager.is_status_set('FERunning')
+
+
+# Only run Redis tests if redis is available
+try:
+    import redis
+    from unittest.mock import MagicMock
+    from GivTCP.concurrency import RedisStatusManager
+
+    class TestRedisStatusManager:
+        """Tests for RedisStatusManager implementation."""
+
+        def test_set_and_clear_many_accept_generators(self, caplog):
+            """Test that generator names are sent to Redis and logged, not consumed early."""
+            import logging
+            client = MagicMock()
+            pipe = client.pipeline.return_value.__enter__.return_value
+            manager = RedisStatusManager(client, key_prefix='test')
+
+            with caplog.at_level(logging.DEBUG):
+                manager.set_many(name for name in ('FCRunning', 'FERunning'))
+                manager.clear_many(name for name in ('FCRunning', 'FERunning'))
+
+            assert pipe.set.call_count == 2
+            assert pipe.delete.call_count == 2
+            assert "['FCRunning', 'FERunning']" in caplog.text
+
+except ImportError:
+    # Redis not available, skip tests
+    pass
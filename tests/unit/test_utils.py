@@ -7,7 +7,7 @@ Tests for functions extracted from read.py as part of Phase 1 refactoring.
 import pytest
 from datetime import datetime, time, timezone
 from unittest.mock import Mock
-from GivTCP.utils import dicttoList, iterate_dict, dataSmoother2
+from GivTCP.utils import dicttoList, iter_keys, iterate_dict, dataSmoother2
 
 
 class TestDictToList:
@@ -58,6 +58,22 @@ class TestDictToList:
         assert 'nested' in result
         assert 'key' in result
 
+    def test_depth_first_order(self):
+        """Test keys are listed depth first, nested keys right after their parent."""
+        input_dict = {'a': 1, 'b': {'c': 2, 'd': {'e': 3}}, 'f': 4}
+        assert dicttoList(input_dict) == ['a', 'b', 'c', 'd', 'e', 'f']
+        assert list(iter_keys(input_dict)) == ['a', 'b', 'c', 'd', 'e', 'f']
+
+    def test_deeply_nested_dict(self):
+        """Test nesting deeper than the recursion limit is handled."""
+        input_dict = {}
+        current = input_dict
+        for i in range(5000):
+            current[i] = {}
+            current = current[i]
+
+        assert len(dicttoList(input_dict)) == 5000
+
 
 class TestIterateDict:
     """Tests for the iterate_dict function."""
@@ -115,6 +131,12 @@ class TestIterateDict:
             'values_2': 'c'
         }
 
+    def test_long_tuple_conversion(self, mock_logger):
+        """Test that tuples longer than the suffix table are fully split."""
+        input_dict = {'values': tuple(range(20))}
+        result = iterate_dict(input_dict, mock_logger)
+        assert result == {'values_' + str(i): str(i) for i in range(20)}
+
     def test_nested_dict_recursion(self, mock_logger):
         """Test that nested dictionaries are processed recursively."""
         input_dict = {
@@ -138,6 +160,27 @@ class TestIterateDict:
         result = iterate_dict(input_dict, mock_logger)
         assert result == {'model': 'AC'}
 
+    def test_subclass_values_use_base_conversion(self, mock_logger):
+        """Test that subclasses of handled types are converted like their base."""
+        from collections import OrderedDict, namedtuple
+        Slot = namedtuple('Slot', 'start end')
+
+        class Reading(float):
+            pass
+
+        input_dict = {
+            'nested': OrderedDict(value=1.23456),
+            'charge_slot_1': Slot(time(9, 0), time(17, 0)),
+            'reading': Reading(2.71828),
+        }
+        result = iterate_dict(input_dict, mock_logger)
+        assert result == {
+            'nested': {'value': 1.235},
+            'charge_slot_1_start': '09:00',
+            'charge_slot_1_end': '17:00',
+            'reading': 2.718,
+        }
+
     def test_without_logger(self):
         """Test that function works without explicit logger."""
         input_dict = {'key': 'value'}
@@ -326,6 +369,17 @@ class TestDataSmoother2:
         )
         assert result == 'string_value'  # New value returned
 
+    def test_unchanged_value_short_circuits(self):
+        """Test that an unchanged value is returned before any lookup or parsing."""
+        dataNew = ['unknown_value', 42.0]
+        dataOld = ['unknown_value', 42.0]
+
+        result = dataSmoother2(
+            dataNew, dataOld, 'not a timestamp',
+            {}, self.timezone, 'medium'
+        )
+        assert result == 42.0
+
     def test_old_data_zero_passthrough(self):
         """Test that new data is accepted when old data is zero."""
         dataNew = ['test_value', 50.0]
@@ -337,3 +391,23 @@ class TestDataSmoother2:
             self.givLUT, self.timezone, 'medium'
         )
         assert result == 50.0  # New value accepted
+
+    def test_parsed_last_update_and_now(self):
+        """Test a pre-parsed lastUpdate datetime and caller-supplied now are used."""
+        from datetime import timedelta
+
+        now = datetime.now(self.timezone)
+        dataNew = ['test_value', 80.0]
+        dataOld = ['test_value', 40.0]
+
+        result_recent = dataSmoother2(
+            dataNew, dataOld, now - timedelta(seconds=30),
+            self.givLUT, self.timezone, 'medium', now=now
+        )
+        result_stale = dataSmoother2(
+            dataNew, dataOld, now - timedelta(seconds=120),
+            self.givLUT, self.timezone, 'medium', now=now
+        )
+
+        assert result_recent == 40.0  # Spike within 60 seconds rejected
+        assert result_stale == 80.0
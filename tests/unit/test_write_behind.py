@@ -0,0 +1,70 @@
+"""
+Unit tests for the CoalescingWriter write-behind helper.
+
+Tests for Phase 3 refactoring: Extract Service Layer
+
+Critical tests:
+- Values are written on a background thread
+- Values submitted while one is pending replace it
+- Write errors are logged, not raised
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from GivTCP.services.write_behind import CoalescingWriter
+
+
+class TestCoalescingWriter:
+    """Tests for CoalescingWriter."""
+
+    def test_submit_writes_in_background(self):
+        """Test that submitted values are written on the worker thread."""
+        threads = []
+        writer = CoalescingWriter(lambda value: threads.append(threading.current_thread().name),
+                                  name='test-writer')
+
+        writer.submit({'id': 1})
+        writer.flush()
+
+        assert len(threads) == 1
+        assert threads[0].startswith('test-writer')
+
+    def test_pending_value_replaced(self):
+        """Test that only the newest of several waiting values is written."""
+        release = threading.Event()
+        written = []
+
+        def write(value):
+            release.wait(5)
+            written.append(value)
+
+        writer = CoalescingWriter(write)
+        writer.submit(1)  # Picked up by the worker
+        while writer.pending:
+            time.sleep(0.001)
+        writer.submit(2)
+        writer.submit(None)
+        release.set()
+        writer.flush()
+
+        assert written == [1, None]
+        assert not writer.pending
+
+    def test_write_error_logged(self, caplog):
+        """Test that a failing write is logged and later writes still run."""
+        write = Mock(side_effect=[OSError("disk full"), None])
+        writer = CoalescingWriter(write, name='test-writer')
+
+        writer.submit(1)
+        writer.flush()
+        writer.submit(2)
+        writer.flush()
+
+        assert write.call_count == 2
+        assert "disk full" in caplog.text
+
+    def test_flush_without_submit(self):
+        """Test that flush returns immediately when nothing was submitted."""
+        CoalescingWriter(Mock()).flush()